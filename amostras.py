@@ -0,0 +1,144 @@
+"""
+Tipos das amostras devolvidas pelos coletores
+
+Objetos com __slots__ (sem dicionário por instância) guardando os
+valores brutos, sem arredondamento: o arredondamento é feito só na
+hora de exibir. Quando não há dados, a amostra tem disponivel=False
+em vez de valores inventados
+"""
+
+from array import array
+
+GB = 1024 ** 3
+
+class _Amostra:
+    """Base: comparação, repr e conversão para dicionário pelos slots"""
+
+    __slots__ = ()
+
+    def _valores(self):
+        return tuple(getattr(self, campo) for campo in self.__slots__)
+
+    def __eq__(self, outra):
+        if type(outra) is not type(self):
+            return NotImplemented
+        return self._valores() == outra._valores()
+
+    def __repr__(self):
+        campos = ", ".join(f"{campo}={getattr(self, campo)!r}" for campo in self.__slots__)
+        return f"{type(self).__name__}({campos})"
+
+    def como_dict(self):
+        """Valores brutos em um dicionário (arrays viram listas), para serializar"""
+        return {campo: list(valor) if isinstance(valor, array) else valor
+                for campo, valor in zip(self.__slots__, self._valores())}
+
+    @classmethod
+    def indisponivel(cls):
+        return cls(disponivel=False)
+
+class AmostraCPU(_Amostra):
+    """Uso da CPU em %; uso_por_core é um array('d') com um valor por núcleo"""
+
+    __slots__ = ('disponivel', 'uso_total', 'uso_por_core')
+
+    def __init__(self, uso_total=0.0, uso_por_core=None, disponivel=True):
+        self.disponivel = disponivel
+        self.uso_total = uso_total
+        self.uso_por_core = uso_por_core if uso_por_core is not None else array('d')
+
+    @property
+    def numero_cores(self):
+        return len(self.uso_por_core)
+
+class AmostraRAM(_Amostra):
+    """
+    Memória em bytes; livre_bytes é a memória disponível para novos processos
+    (o tipo da RAM é dado estático: vem de info_estatica, fora da coleta)
+    """
+
+    __slots__ = ('disponivel', 'porcentagem', 'total_bytes', 'usada_bytes', 'livre_bytes')
+
+    def __init__(self, porcentagem=0.0, total_bytes=0, usada_bytes=0, livre_bytes=0, disponivel=True):
+        self.disponivel = disponivel
+        self.porcentagem = porcentagem
+        self.total_bytes = total_bytes
+        self.usada_bytes = usada_bytes
+        self.livre_bytes = livre_bytes
+
+class AmostraSwap(_Amostra):
+    __slots__ = ('disponivel', 'porcentagem', 'total_bytes', 'usada_bytes')
+
+    def __init__(self, porcentagem=0.0, total_bytes=0, usada_bytes=0, disponivel=True):
+        self.disponivel = disponivel
+        self.porcentagem = porcentagem
+        self.total_bytes = total_bytes
+        self.usada_bytes = usada_bytes
+
+class AmostraGPU(_Amostra):
+    """Uso da GPU; memória em MB como informado pelo driver"""
+
+    __slots__ = ('disponivel', 'nome', 'uso_porcentagem', 'memoria_usada_mb',
+                 'memoria_total_mb', 'temperatura')
+
+    def __init__(self, uso_porcentagem=0.0, memoria_usada_mb=0.0, memoria_total_mb=0.0,
+                 temperatura=0.0, nome="GPU não detectada", disponivel=True):
+        self.disponivel = disponivel
+        self.nome = nome
+        self.uso_porcentagem = uso_porcentagem
+        self.memoria_usada_mb = memoria_usada_mb
+        self.memoria_total_mb = memoria_total_mb
+        self.temperatura = temperatura
+
+    @property
+    def memoria_porcentagem(self):
+        if not self.memoria_total_mb:
+            return 0.0
+        return self.memoria_usada_mb / self.memoria_total_mb * 100
+
+class AmostraMonitor(_Amostra):
+    """Consumo do próprio monitor: CPU (% de um núcleo, pode passar de 100) e memória residente"""
+
+    __slots__ = ('disponivel', 'cpu_percent', 'rss_bytes', 'threads')
+
+    def __init__(self, cpu_percent=0.0, rss_bytes=0, threads=0, disponivel=True):
+        self.disponivel = disponivel
+        self.cpu_percent = cpu_percent
+        self.rss_bytes = rss_bytes
+        self.threads = threads
+
+class AmostraAtributosProcesso(_Amostra):
+    """
+    Atributos caros de um processo, lidos juntos (um oneshot do psutil)
+    `momento` é o time.monotonic() da leitura; None = sem permissão ou
+    não suportado neste sistema. arquivos_abertos conta descritores
+    (handles no Windows)
+    """
+
+    __slots__ = ('disponivel', 'pid', 'uss_bytes', 'pss_bytes', 'io_leitura_bytes',
+                 'io_escrita_bytes', 'threads', 'arquivos_abertos', 'momento')
+
+    def __init__(self, pid=0, uss_bytes=None, pss_bytes=None, io_leitura_bytes=None,
+                 io_escrita_bytes=None, threads=None, arquivos_abertos=None, momento=0.0,
+                 disponivel=True):
+        self.disponivel = disponivel
+        self.pid = pid
+        self.uss_bytes = uss_bytes
+        self.pss_bytes = pss_bytes
+        self.io_leitura_bytes = io_leitura_bytes
+        self.io_escrita_bytes = io_escrita_bytes
+        self.threads = threads
+        self.arquivos_abertos = arquivos_abertos
+        self.momento = momento
+
+    def idade(self, agora):
+        """Segundos desde a leitura (`agora` no relógio monotônico)"""
+        return agora - self.momento
+
+# Teste do módulo (só executa se rodar este arquivo diretamente)
+if __name__ == "__main__":
+    cpu = AmostraCPU(12.345, array('d', [10.0, 14.69]))
+    print(cpu, cpu.numero_cores)
+    print(cpu.como_dict())
+    print(AmostraGPU.indisponivel())
+    print(AmostraRAM(50.0, 8 * GB, 4 * GB, 4 * GB) == AmostraRAM(50.0, 8 * GB, 4 * GB, 4 * GB))
@@ -0,0 +1,178 @@
+"""
+Atributos caros dos processos (USS/PSS, bytes de I/O, threads e
+arquivos abertos), lidos em camadas dentro de um orçamento de tempo
+
+A varredura normal (process_monitor) só lê os campos baratos de todos
+os processos. Aqui, a cada rodada:
+1. os candidatos do topo (mais CPU e mais memória) são relidos primeiro
+2. com o tempo que sobrar, o restante é percorrido em rodízio por PID,
+   continuando de onde a rodada anterior parou; só é relido quem tem
+   leitura mais velha que `validade_s`, e a rodada termina assim que
+   não sobrar nenhum desses (não gasta o orçamento à toa)
+Cada amostra guarda o momento da leitura, então dá para saber a idade
+de cada valor
+"""
+
+import heapq
+import threading
+import time
+from bisect import bisect_right
+from operator import attrgetter
+
+import psutil
+
+from amostras import AmostraAtributosProcesso
+
+_pid = attrgetter('pid')
+
+def _ou_none(funcao):
+    """Valor de `funcao()` ou None se não houver permissão ou suporte"""
+    try:
+        return funcao()
+    except (psutil.AccessDenied, psutil.ZombieProcess, NotImplementedError, AttributeError, OSError):
+        return None
+
+def ler_atributos_caros(processo):
+    """
+    Lê os atributos caros de um psutil.Process numa única passada
+    Lança psutil.NoSuchProcess se o processo terminou
+    """
+    with processo.oneshot():
+        memoria = _ou_none(processo.memory_full_info)
+        io = _ou_none(processo.io_counters)
+        threads = _ou_none(processo.num_threads)
+        if hasattr(processo, 'num_fds'):
+            arquivos = _ou_none(processo.num_fds)
+        else:
+            arquivos = _ou_none(processo.num_handles)
+    return AmostraAtributosProcesso(
+        processo.pid,
+        getattr(memoria, 'uss', None),
+        getattr(memoria, 'pss', None),
+        getattr(io, 'read_bytes', None),
+        getattr(io, 'write_bytes', None),
+        threads,
+        arquivos,
+        time.monotonic())
+
+class ColetorAtributosProcessos:
+    """
+    Mantém os atributos caros de cada processo, relendo no máximo o que
+    couber em `orcamento_s` por rodada
+
+    `limite_topo` processos de cada ranking (CPU e memória) são relidos
+    em toda rodada; os demais esperam a vez no rodízio. Processos que
+    saíram da varredura são descartados
+
+    Os psutil.Process guardados só são reaproveitados se ainda forem o
+    mesmo processo (is_running compara o momento de criação): um PID
+    reutilizado ganha um objeto novo e perde os atributos do anterior
+    """
+
+    def __init__(self, orcamento_s=0.1, limite_topo=10, validade_s=10.0, ler=ler_atributos_caros):
+        self.orcamento_s = orcamento_s
+        self.limite_topo = limite_topo
+        self.validade_s = validade_s
+        self._ler = ler
+        self._processos = {}  # pid -> psutil.Process (reaproveitado entre rodadas)
+        self._atributos = {}  # pid -> AmostraAtributosProcesso
+        self._cursor = 0      # último PID lido no rodízio
+        self._lock = threading.Lock()
+
+    def _candidatos(self, snapshot):
+        """PIDs do topo de CPU e de memória, sem repetir"""
+        topo = heapq.nlargest(self.limite_topo, snapshot, key=attrgetter('cpu_percent'))
+        topo += heapq.nlargest(self.limite_topo, snapshot, key=attrgetter('memoria_bytes'))
+        return list(dict.fromkeys(map(_pid, topo)))
+
+    def _rodizio(self, pids_ordenados):
+        """Todos os PIDs, começando logo depois do cursor e dando a volta"""
+        i = bisect_right(pids_ordenados, self._cursor)
+        return pids_ordenados[i:] + pids_ordenados[:i]
+
+    def _ler_pid(self, pid):
+        processo = self._processos.get(pid)
+        try:
+            if processo is not None and not processo.is_running():
+                # O PID foi reutilizado por outro processo
+                self._atributos.pop(pid, None)
+                processo = None
+            if processo is None:
+                processo = self._processos[pid] = psutil.Process(pid)
+            self._atributos[pid] = self._ler(processo)
+        except psutil.NoSuchProcess:
+            # Terminou entre a varredura e a leitura
+            self._processos.pop(pid, None)
+            self._atributos.pop(pid, None)
+
+    def atualizar(self, snapshot):
+        """
+        Uma rodada sobre a varredura `snapshot` (lista de RegistroProcesso)
+        Retorna um dicionário pid -> AmostraAtributosProcesso (cópia)
+        """
+        with self._lock:
+            pids = sorted(map(_pid, snapshot))
+            vivos = set(pids)
+            for pid in self._atributos.keys() - vivos:
+                del self._atributos[pid]
+            for pid in self._processos.keys() - vivos:
+                del self._processos[pid]
+
+            limite = time.perf_counter() + self.orcamento_s
+            candidatos = self._candidatos(snapshot)
+            for pid in candidatos:
+                if time.perf_counter() >= limite:
+                    break
+                self._ler_pid(pid)
+
+            topo = set(candidatos)
+            atributos = self._atributos
+            velho = time.monotonic() - self.validade_s
+            for pid in self._rodizio(pids):
+                if pid in topo:
+                    continue
+                amostra = atributos.get(pid)
+                if amostra is not None and amostra.momento > velho:
+                    continue
+                if time.perf_counter() >= limite:
+                    break
+                self._ler_pid(pid)
+                self._cursor = pid
+            return dict(self._atributos)
+
+_coletor = ColetorAtributosProcessos()
+
+def amostrar_atributos_processos():
+    """
+    Uma rodada do coletor de atributos caros sobre a última varredura de
+    processos (process_monitor.ultimo_snapshot_processos)
+    Retorna um dicionário pid -> AmostraAtributosProcesso
+    """
+    from process_monitor import ultimo_snapshot_processos
+    try:
+        return _coletor.atualizar(ultimo_snapshot_processos())
+    except Exception as e:
+        print(f"Erro ao ler atributos dos processos: {e}")
+        return {}
+
+# Teste do módulo (só executa se rodar este arquivo diretamente)
+if __name__ == "__main__":
+    from process_monitor import obter_rankings_processos, ultimo_snapshot_processos
+
+    obter_rankings_processos()
+    time.sleep(0.5)
+    obter_rankings_processos()
+    print(f"{len(ultimo_snapshot_processos())} processos na varredura")
+
+    coletor = ColetorAtributosProcessos(orcamento_s=0.02)
+    for rodada in range(3):
+        inicio = time.perf_counter()
+        atributos = coletor.atualizar(ultimo_snapshot_processos())
+        print(f"Rodada {rodada}: {len(atributos)} processos com atributos em "
+              f"{(time.perf_counter() - inicio) * 1000:.1f} ms")
+
+    agora = time.monotonic()
+    for amostra in sorted(atributos.values(), key=lambda a: a.uss_bytes or 0, reverse=True)[:5]:
+        print(f"PID {amostra.pid}: USS {amostra.uss_bytes} PSS {amostra.pss_bytes} "
+              f"I/O {amostra.io_leitura_bytes}/{amostra.io_escrita_bytes} threads {amostra.threads} "
+              f"arquivos {amostra.arquivos_abertos} (idade {amostra.idade(agora):.2f} s)")
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Benchmark de um ciclo do monitor: cada coletor isolado e o caminho de
+atualização da interface
+
+Tudo roda sobre dados falsos e determinísticos:
+- psutil lê uma árvore /proc falsa (PROCFS_PATH) com a quantidade de
+  processos e núcleos pedida
+- nvidia-smi é um script falso colocado no início do PATH
+- a interface usa uma janela Tk escondida e amostras sintéticas
+
+Para cada medição mostra p50/p90/p99/máximo em ms e a memória alocada
+por chamada (tracemalloc). Com --salvar/--comparar os resultados podem
+ser guardados em JSON e comparados com uma execução anterior.
+
+Para executar: python benchmark_coletores.py --processos 5000 --nucleos 64
+(apenas Linux)
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from array import array
+
+import psutil
+
+from benchmark_processos import criar_proc_falso
+
+# Script que imita `nvidia-smi --query-gpu=... -lms N` com valores fixos
+NVIDIA_SMI_FALSO = """#!{python}
+import sys, time
+intervalo = 1.0
+if '-lms' in sys.argv:
+    intervalo = int(sys.argv[sys.argv.index('-lms') + 1]) / 1000
+consulta = [a for a in sys.argv if a.startswith('--query-gpu=')]
+if consulta and consulta[0] == '--query-gpu=name,memory.total':
+    for i in range({gpus}):
+        print(f"GPU Falsa {{i}}, 8192")
+    sys.exit(0)
+n = 0
+while True:
+    for i in range({gpus}):
+        print(f"{{i}}, {{(n * 7 + i) % 100}}, {{1024 + n % 512}}, 8192, {{50 + n % 20}}, GPU Falsa {{i}}")
+    sys.stdout.flush()
+    n += 1
+    time.sleep(intervalo)
+"""
+
+def percentil(valores, p):
+    """Percentil p (0-100) por interpolação linear"""
+    ordenados = sorted(valores)
+    if len(ordenados) == 1:
+        return ordenados[0]
+    posicao = (len(ordenados) - 1) * p / 100
+    i = int(posicao)
+    j = min(i + 1, len(ordenados) - 1)
+    return ordenados[i] + (ordenados[j] - ordenados[i]) * (posicao - i)
+
+def medir(funcao, repeticoes, aquecimento=3):
+    """
+    Mede `funcao` em duas passadas: tempos (sem tracemalloc, que deixa
+    tudo mais lento) e depois memória alocada por chamada
+    Retorna um dicionário com os percentis em ms e a memória em KB
+    """
+    for _ in range(aquecimento):
+        funcao()
+
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append((time.perf_counter() - inicio) * 1000)
+
+    picos = []
+    liquidos = []
+    tracemalloc.start()
+    try:
+        for _ in range(min(repeticoes, 20)):
+            tracemalloc.reset_peak()
+            antes = tracemalloc.get_traced_memory()[0]
+            funcao()
+            atual, pico = tracemalloc.get_traced_memory()
+            picos.append(pico - antes)
+            liquidos.append(atual - antes)
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'p50_ms': percentil(tempos, 50),
+        'p90_ms': percentil(tempos, 90),
+        'p99_ms': percentil(tempos, 99),
+        'max_ms': max(tempos),
+        'pico_kb': statistics.mean(picos) / 1024,
+        'retido_kb': statistics.mean(liquidos) / 1024,
+    }
+
+def imprimir(nome, resultado):
+    print(f"  {nome:<28} p50 {resultado['p50_ms']:8.3f}  p90 {resultado['p90_ms']:8.3f}  "
+          f"p99 {resultado['p99_ms']:8.3f}  máx {resultado['max_ms']:8.3f} ms   "
+          f"alocado {resultado['pico_kb']:8.1f} KB  retido {resultado['retido_kb']:6.1f} KB")
+
+def preparar_ambiente(diretorio, processos, nucleos, gpus):
+    """Cria /proc e nvidia-smi falsos e aponta psutil e PATH para eles"""
+    pasta_proc = os.path.join(diretorio, "proc")
+    os.mkdir(pasta_proc)
+    criar_proc_falso(pasta_proc, processos, nucleos)
+    psutil.PROCFS_PATH = pasta_proc
+
+    pasta_bin = os.path.join(diretorio, "bin")
+    os.mkdir(pasta_bin)
+    script = os.path.join(pasta_bin, "nvidia-smi")
+    with open(script, "w") as f:
+        f.write(NVIDIA_SMI_FALSO.format(python=sys.executable, gpus=gpus))
+    os.chmod(script, 0o755)
+    os.environ["PATH"] = pasta_bin + os.pathsep + os.environ.get("PATH", "")
+    return pasta_proc
+
+def medir_coletores(repeticoes, backend, pasta_proc):
+    """Mede as funções de coleta, uma de cada vez"""
+    import cpu_monitor
+    import gpu_monitor
+    import ram_monitor
+    import process_monitor
+    import atributos_processos
+
+    process_monitor.escolher_backend_processos(backend, pasta_proc)
+    # Inicia o leitor do nvidia-smi fora da medição (só acontece uma vez)
+    gpu_monitor.detectar_gpu(forcar=True)
+
+    funcoes = [
+        ('obter_uso_cpu', cpu_monitor.obter_uso_cpu),
+        ('amostrar_cpu', cpu_monitor.amostrar_cpu),
+        ('obter_uso_gpu', gpu_monitor.obter_uso_gpu),
+        ('obter_uso_ram', ram_monitor.obter_uso_ram),
+        ('obter_swap', ram_monitor.obter_swap),
+        ('obter_processos_top', lambda: process_monitor.obter_processos_top(8)),
+        ('obter_processos_memoria', lambda: process_monitor.obter_processos_memoria(6)),
+        ('obter_rankings_processos', lambda: process_monitor.obter_rankings_processos(8, 6)),
+        ('amostrar_atributos_processos', atributos_processos.amostrar_atributos_processos),
+    ]
+    resultados = {}
+    for nome, funcao in funcoes:
+        resultados[nome] = medir(funcao, repeticoes)
+        imprimir(nome, resultados[nome])
+    gpu_monitor.encerrar_leitor_nvidia()
+
+    # Ordenação da tabela completa com o snapshot da última varredura
+    from tabela_processos import ModeloTabelaProcessos
+    snapshot = process_monitor.ultimo_snapshot_processos()
+    for coluna in ('cpu_percent', 'nome'):
+        modelo = ModeloTabelaProcessos(coluna)
+        nome = f"tabela_processos[{coluna}]"
+        resultados[nome] = medir(lambda: modelo.atualizar(snapshot), repeticoes)
+        imprimir(nome, resultados[nome])
+
+    # Busca no índice (as linhas de comando já foram lidas nas varreduras acima)
+    for consulta in ('proc1', 'worker 1234'):
+        nome = f"buscar_processos[{consulta}]"
+        resultados[nome] = medir(lambda: process_monitor.buscar_processos(consulta), repeticoes)
+        imprimir(nome, resultados[nome])
+    return resultados
+
+def amostras_sinteticas(gerador, nucleos):
+    """Um conjunto de amostras com valores pseudoaleatórios (semente fixa)"""
+    from amostras import AmostraCPU, AmostraGPU, AmostraRAM, GB
+    from process_monitor import RegistroProcesso
+
+    cpu = AmostraCPU(gerador.uniform(0, 100), array('d', (gerador.uniform(0, 100) for _ in range(nucleos))))
+    gpu = AmostraGPU(gerador.uniform(0, 100), gerador.uniform(0, 8192), 8192, gerador.uniform(40, 90), "GPU Falsa 0")
+    ram = AmostraRAM(gerador.uniform(0, 100), 16 * GB, gerador.randrange(16 * GB), gerador.randrange(16 * GB))
+    processos = [RegistroProcesso(pid, f"processo {pid}", gerador.uniform(0, 100),
+                                  gerador.uniform(0, 10), gerador.randrange(1 << 30))
+                 for pid in gerador.sample(range(1, 100000), 8)]
+    return cpu, gpu, ram, processos
+
+def medir_interface(repeticoes, nucleos, semente):
+    """Mede atualizar_overview, desenhar_grafico_gpu e a rolagem da tabela de processos numa janela escondida"""
+    try:
+        import tkinter as tk
+    except ImportError:
+        print("  Interface não medida: tkinter não encontrado")
+        return {}
+
+    try:
+        from interface_grafica import MonitorHardware
+        monitor = MonitorHardware(historico_em_disco=False)
+    except tk.TclError as e:
+        print(f"  Interface não medida (sem display?): {e}")
+        return {}
+
+    # Sem coleta de verdade: só as amostras sintéticas abaixo
+    monitor.agendador.parar()
+    monitor.executor_coletores.encerrar()
+    monitor.root.withdraw()
+    gerador = random.Random(semente)
+
+    def overview():
+        cpu, gpu, ram, processos = amostras_sinteticas(gerador, nucleos)
+        monitor.atualizar_overview(cpu, gpu, ram, processos)
+
+    # Enche a janela do gráfico e dá um tamanho ao canvas
+    serie = monitor.metricas.serie('gpu')
+    agora = time.time()
+    for i in range(monitor.janela_grafico_s):
+        serie.adicionar(agora - monitor.janela_grafico_s + i, gerador.uniform(0, 100))
+    monitor.grafico_gpu.canvas.event_generate('<Configure>', width=800, height=200)
+
+    def grafico_gpu():
+        serie.adicionar(time.time(), gerador.uniform(0, 100))
+        monitor.desenhar_grafico_gpu()
+
+    # Tabela de processos com um snapshot grande, rolando uma linha por vez
+    from process_monitor import RegistroProcesso
+    monitor.modelo_processos.atualizar([
+        RegistroProcesso(pid, f"processo {pid}", gerador.uniform(0, 100), gerador.uniform(0, 10),
+                         gerador.randrange(1 << 30)) for pid in range(1, 10001)])
+    monitor.tabela_processos.canvas.event_generate('<Configure>', width=800, height=400)
+
+    def rolar_tabela():
+        tabela = monitor.tabela_processos
+        tabela.inicio = (tabela.inicio + 1) % 9000
+        tabela.desenhar()
+
+    resultados = {}
+    for nome, funcao in (('atualizar_overview', overview), ('desenhar_grafico_gpu', grafico_gpu),
+                         ('rolar_tabela_processos', rolar_tabela)):
+        resultados[nome] = medir(funcao, repeticoes)
+        imprimir(nome, resultados[nome])
+    monitor.root.destroy()
+    return resultados
+
+def comparar_com(arquivo, resultados, tolerancia):
+    """Mostra a variação do p50 em relação a uma execução salva"""
+    try:
+        with open(arquivo, encoding="utf-8") as f:
+            anteriores = json.load(f)['resultados']
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Não foi possível ler {arquivo}: {e}")
+        return True
+
+    print(f"\nComparação com {arquivo} (p50):")
+    ok = True
+    for nome, atual in resultados.items():
+        anterior = anteriores.get(nome)
+        if not anterior or not anterior['p50_ms']:
+            continue
+        variacao = (atual['p50_ms'] / anterior['p50_ms'] - 1) * 100
+        regressao = variacao > tolerancia
+        ok = ok and not regressao
+        marca = "  <-- REGRESSÃO" if regressao else ""
+        print(f"  {nome:<28} {anterior['p50_ms']:8.3f} -> {atual['p50_ms']:8.3f} ms ({variacao:+.0f}%){marca}")
+    return ok
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dos coletores e da atualização da interface")
+    parser.add_argument("--processos", type=int, default=2000, help="PIDs no /proc falso")
+    parser.add_argument("--nucleos", type=int, default=16, help="núcleos no /proc falso")
+    parser.add_argument("--gpus", type=int, default=1, help="GPUs do nvidia-smi falso")
+    parser.add_argument("--repeticoes", type=int, default=50)
+    parser.add_argument("--backend", choices=["psutil", "proc"], default="psutil",
+                        help="backend da varredura de processos")
+    parser.add_argument("--semente", type=int, default=1234)
+    parser.add_argument("--sem-interface", action="store_true", help="não mede a interface Tk")
+    parser.add_argument("--salvar", metavar="ARQUIVO", help="grava os resultados em JSON")
+    parser.add_argument("--comparar", metavar="ARQUIVO", help="compara com resultados salvos")
+    parser.add_argument("--tolerancia", type=float, default=20,
+                        help="piora do p50 (%%) considerada regressão")
+    args = parser.parse_args()
+
+    if not sys.platform.startswith("linux"):
+        print("Este benchmark só roda no Linux")
+        sys.exit(1)
+
+    print("=== BENCHMARK DOS COLETORES ===")
+    print(f"{args.processos} processos, {args.nucleos} núcleos, {args.gpus} GPU(s), "
+          f"{args.repeticoes} repetições, backend {args.backend}")
+    diretorio = tempfile.mkdtemp(prefix="benchmark_monitor_")
+    try:
+        pasta_proc = preparar_ambiente(diretorio, args.processos, args.nucleos, args.gpus)
+        print("\nColetores:")
+        resultados = medir_coletores(args.repeticoes, args.backend, pasta_proc)
+        if not args.sem_interface:
+            print("\nInterface:")
+            resultados.update(medir_interface(args.repeticoes, args.nucleos, args.semente))
+    finally:
+        shutil.rmtree(diretorio, ignore_errors=True)
+
+    if args.salvar:
+        with open(args.salvar, "w", encoding="utf-8") as f:
+            json.dump({'parametros': vars(args), 'resultados': resultados}, f, indent=2)
+        print(f"\nResultados gravados em {args.salvar}")
+    if args.comparar and not comparar_com(args.comparar, resultados, args.tolerancia):
+        sys.exit(2)
+
+if __name__ == "__main__":
+    main()
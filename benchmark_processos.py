@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark da varredura de processos: psutil x leitura direta de /proc
+
+Gera uma árvore /proc falsa com milhares de PIDs em um diretório
+temporário e mede quanto cada backend leva para varrê-la.
+
+Para executar: python benchmark_processos.py --processos 10000 50000
+(apenas Linux: o psutil é apontado para a árvore falsa via PROCFS_PATH)
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+import psutil
+
+import process_monitor
+
+def criar_proc_falso(diretorio, quantidade, nucleos=1):
+    """
+    Cria em `diretorio` uma árvore no formato do /proc com `quantidade`
+    processos (stat, statm e cmdline), além de /proc/stat (com `nucleos` linhas
+    cpuN), /proc/meminfo e /proc/vmstat
+    """
+    with open(os.path.join(diretorio, "stat"), "w") as f:
+        f.write(f"cpu  {100 * nucleos} 0 {100 * nucleos} {1000 * nucleos} 0 0 0 0 0 0\n")
+        for i in range(nucleos):
+            f.write(f"cpu{i} 100 0 100 1000 0 0 0 0 0 0\n")
+        f.write(f"btime {int(time.time()) - 3600}\n")
+    with open(os.path.join(diretorio, "vmstat"), "w") as f:
+        f.write("pswpin 0\npswpout 0\n")
+    with open(os.path.join(diretorio, "meminfo"), "w") as f:
+        f.write("MemTotal:       16384000 kB\n"
+                "MemFree:         8192000 kB\n"
+                "MemAvailable:   12288000 kB\n"
+                "Buffers:          102400 kB\n"
+                "Cached:          2048000 kB\n"
+                "Shmem:             10240 kB\n"
+                "Active:          4096000 kB\n"
+                "Inactive:        2048000 kB\n"
+                "SReclaimable:     102400 kB\n"
+                "SwapTotal:       4096000 kB\n"
+                "SwapFree:        3072000 kB\n")
+
+    for pid in range(1, quantidade + 1):
+        pasta = os.path.join(diretorio, str(pid))
+        os.mkdir(pasta)
+        utime = (pid * 7) % 5000
+        stime = (pid * 3) % 2000
+        with open(os.path.join(pasta, "stat"), "w") as f:
+            f.write(f"{pid} (proc {pid % 1000}) S 1 {pid} {pid} 0 -1 4194560 100 0 0 0 "
+                    f"{utime} {stime} 0 0 20 0 1 0 {pid * 10} 10000000 {pid % 4096} "
+                    "18446744073709551615 0 0 0 0 0 0 0 0 0 0 0 0 17 0 0 0 0 0 0\n")
+        with open(os.path.join(pasta, "statm"), "w") as f:
+            f.write(f"2500 {100 + pid % 4096} 300 10 0 400 0\n")
+        with open(os.path.join(pasta, "cmdline"), "wb") as f:
+            f.write(f"/usr/bin/proc{pid % 1000}\0--worker\0{pid}\0".encode())
+
+def medir(funcao, repeticoes):
+    """Executa `funcao` algumas vezes e retorna os tempos em ms"""
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    return tempos
+
+def comparar(quantidade, repeticoes):
+    diretorio = tempfile.mkdtemp(prefix="proc_falso_")
+    try:
+        print(f"\nCriando /proc falso com {quantidade} processos...")
+        criar_proc_falso(diretorio, quantidade)
+
+        procfs_original = psutil.PROCFS_PATH
+        psutil.PROCFS_PATH = diretorio
+        try:
+            rastreador_psutil = process_monitor.RastreadorProcessos()
+            rastreador_psutil.varrer()  # Primeira varredura cria os objetos Process
+            tempos_psutil = medir(rastreador_psutil.varrer, repeticoes)
+        finally:
+            psutil.PROCFS_PATH = procfs_original
+
+        rastreador_proc = process_monitor.RastreadorProcLinux(diretorio)
+        rastreador_proc.varrer()
+        tempos_proc = medir(rastreador_proc.varrer, repeticoes)
+
+        for nome, tempos in (("psutil", tempos_psutil), ("/proc", tempos_proc)):
+            print(f"  {nome:<7} mediana {statistics.median(tempos):8.1f} ms   "
+                  f"mín {min(tempos):8.1f} ms   máx {max(tempos):8.1f} ms")
+        ganho = statistics.median(tempos_psutil) / statistics.median(tempos_proc)
+        print(f"  /proc é {ganho:.1f}x mais rápido")
+    finally:
+        shutil.rmtree(diretorio, ignore_errors=True)
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara os backends de varredura de processos")
+    parser.add_argument("--processos", type=int, nargs="+", default=[10000, 50000],
+                        help="quantidades de PIDs na árvore falsa")
+    parser.add_argument("--repeticoes", type=int, default=5)
+    args = parser.parse_args()
+
+    if not sys.platform.startswith("linux"):
+        print("Este benchmark só roda no Linux")
+        sys.exit(1)
+
+    print("=== BENCHMARK DA VARREDURA DE PROCESSOS ===")
+    for quantidade in args.processos:
+        comparar(quantidade, args.repeticoes)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,334 @@
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from amostras import AmostraCPU, AmostraRAM, AmostraSwap, AmostraGPU, AmostraMonitor
+from cpu_monitor import amostrar_cpu, iniciar_amostrador_cpu, ler_frequencia_cpu
+from ram_monitor import amostrar_ram, amostrar_swap
+from gpu_monitor import amostrar_gpu
+from process_monitor import obter_rankings_processos
+from atributos_processos import amostrar_atributos_processos
+from instrumentacao import amostrar_monitor, medir_etapa, registrar_etapa
+
+# Um coletor: nome, função sem argumentos, prazo (s), valor padrão
+# usado enquanto o coletor ainda não respondeu nenhuma vez e
+# intervalo (s) entre duas coletas
+Coletor = namedtuple('Coletor', ['nome', 'funcao', 'prazo', 'padrao', 'intervalo'],
+                     defaults=[2.0])
+
+# Resultado de um coletor em uma atualização
+# atrasado=True quando o valor é o último bom (o coletor perdeu o prazo)
+ResultadoColeta = namedtuple('ResultadoColeta', ['valor', 'atrasado', 'momento'])
+
+def coletores_padrao():
+    """Coletores usados pelo monitor (quantidade de processos igual à da interface)"""
+    # Os valores são amostras de amostras.py (frequência: float ou None;
+    # processos: duas listas de RegistroProcesso; atributos: pid ->
+    # AmostraAtributosProcesso, lidos da varredura anterior)
+    # A leitura base da CPU é feita já: a primeira coleta tem com o que comparar
+    iniciar_amostrador_cpu()
+    return [
+        Coletor('cpu', amostrar_cpu, 0.5, AmostraCPU.indisponivel, 1.0),
+        Coletor('frequencia', ler_frequencia_cpu, 0.5, lambda: None, 2.0),
+        Coletor('gpu', amostrar_gpu, 0.5, AmostraGPU.indisponivel, 2.0),
+        Coletor('ram', amostrar_ram, 0.5, AmostraRAM.indisponivel, 1.0),
+        Coletor('swap', amostrar_swap, 0.5, AmostraSwap.indisponivel, 5.0),
+        Coletor('processos', lambda: obter_rankings_processos(8, 6), 1.5, lambda: ([], []), 3.0),
+        Coletor('atributos', amostrar_atributos_processos, 0.5, dict, 3.0),
+        Coletor('monitor', amostrar_monitor, 0.5, AmostraMonitor.indisponivel, 2.0),
+    ]
+
+# Séries do histórico: nome -> (coletor, função que extrai o valor)
+# A função retorna None quando a amostra não deve ser guardada
+SERIES_HISTORICO = {
+    'cpu': ('cpu', lambda cpu: cpu.uso_total if cpu.disponivel else None),
+    'cpu_cores': ('cpu', lambda cpu: cpu.uso_por_core or None),
+    'gpu': ('gpu', lambda gpu: gpu.uso_porcentagem if gpu.disponivel else None),
+    'ram': ('ram', lambda ram: ram.porcentagem if ram.disponivel else None),
+    'swap': ('swap', lambda swap: swap.porcentagem if swap.disponivel else None),
+}
+
+def novas_amostras(resultados, momentos_vistos):
+    """
+    Gera (serie, horario, valor) para cada série cujo coletor trouxe um
+    valor que ainda não está em `momentos_vistos` (atualizado aqui)
+    O horário é o relógio real (time.time) do momento da coleta
+    """
+    diferenca_relogio = time.time() - time.monotonic()
+    for nome, (coletor, extrair) in SERIES_HISTORICO.items():
+        resultado = resultados.get(coletor)
+        if resultado is None or resultado.momento is None:
+            continue
+        if resultado.momento == momentos_vistos.get(nome):
+            continue
+        momentos_vistos[nome] = resultado.momento
+        valor = extrair(resultado.valor)
+        if valor is not None:
+            yield nome, resultado.momento + diferenca_relogio, valor
+
+class ExecutorColetores:
+    """
+    Executa os coletores em paralelo num pool de threads limitado
+
+    Cada coletor tem seu próprio prazo, contado a partir do início da
+    atualização. Quem perder o prazo continua rodando em segundo plano
+    (sem ser disparado de novo) e, enquanto isso, é servido o último
+    valor bom marcado como atrasado. Assim uma atualização dura o tempo
+    do coletor mais lento (limitado pelo maior prazo), e não a soma de todos
+    """
+
+    def __init__(self, coletores=None, max_threads=None):
+        self.coletores = coletores if coletores is not None else coletores_padrao()
+        self._pool = ThreadPoolExecutor(max_workers=max_threads or len(self.coletores),
+                                        thread_name_prefix="coletor")
+        self._lock = threading.Lock()
+        self._em_andamento = {}
+        self._ultimos = {}
+        # Custo médio (s) de cada coletor, média móvel exponencial
+        self.custos = {}
+
+    def _executar(self, coletor):
+        """Roda no pool: guarda o valor antes de o futuro ser concluído"""
+        inicio = time.perf_counter()
+        inicio_cpu = time.thread_time()
+        try:
+            valor = coletor.funcao()
+        except Exception as e:
+            print(f"Erro no coletor {coletor.nome}: {e}")
+        else:
+            with self._lock:
+                self._ultimos[coletor.nome] = (valor, time.monotonic())
+        finally:
+            custo = time.perf_counter() - inicio
+            registrar_etapa(f"coletor.{coletor.nome}", custo, time.thread_time() - inicio_cpu)
+            with self._lock:
+                self._em_andamento.pop(coletor.nome, None)
+                anterior = self.custos.get(coletor.nome)
+                self.custos[coletor.nome] = custo if anterior is None else 0.7 * anterior + 0.3 * custo
+
+    def disparar(self, coletores):
+        """Envia ao pool os coletores que não estão rodando ainda"""
+        futuros = {}
+        with self._lock:
+            for coletor in coletores:
+                futuro = self._em_andamento.get(coletor.nome)
+                if futuro is None:
+                    futuro = self._pool.submit(self._executar, coletor)
+                    self._em_andamento[coletor.nome] = futuro
+                futuros[coletor.nome] = futuro
+        return futuros
+
+    def coletar(self, coletores=None):
+        """
+        Roda os coletores e espera cada um até o seu prazo
+        Retorna um dicionário nome -> ResultadoColeta
+        """
+        coletores = self.coletores if coletores is None else coletores
+        inicio = time.monotonic()
+        futuros = self.disparar(coletores)
+
+        resultados = {}
+        for coletor in coletores:
+            restante = inicio + coletor.prazo - time.monotonic()
+            wait([futuros[coletor.nome]], timeout=max(restante, 0))
+            resultados[coletor.nome] = self.resultado(coletor, inicio)
+        return resultados
+
+    def resultado(self, coletor, desde):
+        """Último valor do coletor; atrasado se não for posterior a `desde`"""
+        with self._lock:
+            ultimo = self._ultimos.get(coletor.nome)
+        if ultimo is None:
+            return ResultadoColeta(coletor.padrao(), True, None)
+        valor, momento = ultimo
+        return ResultadoColeta(valor, momento < desde, momento)
+
+    def ultimos_resultados(self, recentes=None):
+        """
+        Último valor de todos os coletores; `recentes` (de coletar)
+        sobrescreve os coletores que acabaram de rodar
+        """
+        resultados = {coletor.nome: self.resultado(coletor, float('-inf'))
+                      for coletor in self.coletores}
+        if recentes:
+            resultados.update(recentes)
+        return resultados
+
+    def encerrar(self):
+        """Libera o pool sem esperar coletores travados"""
+        # cancel_futures só existe a partir do Python 3.9: cancela à mão
+        # os que ainda estão na fila (os que já rodam não podem ser cancelados)
+        with self._lock:
+            futuros = list(self._em_andamento.values())
+        for futuro in futuros:
+            futuro.cancel()
+        self._pool.shutdown(wait=False)
+
+class AgendadorColetores:
+    """
+    Dispara cada coletor no seu próprio intervalo, usando o relógio
+    monotônico sem acumular atraso (o próximo horário é calculado a
+    partir do horário previsto, não de quando a coleta terminou)
+
+    Se um coletor gastar mais que `orcamento` (fração do intervalo) em
+    média, o intervalo dele é esticado até custo / orcamento, limitado a
+    `fator_maximo` vezes o intervalo configurado. Quando o custo cai,
+    o intervalo volta ao configurado
+
+    Com `espera_inicial` (s), a primeira rodada publica o que ficou
+    pronto nesse tempo, sem esperar os prazos dos coletores lentos
+    (útil para a interface mostrar dados o quanto antes). Sem ela, a
+    primeira publicação espera todos os coletores (ou os seus prazos)
+
+    Coletores que terminam até `agrupar_s` depois do primeiro pronto
+    saem na mesma publicação, e só se publica quando algum valor é
+    novo (perder o prazo sem trazer nada não gera publicação)
+    """
+
+    def __init__(self, executor, intervalos=None, orcamento=0.1, fator_maximo=10, espera_inicial=0.0,
+                 agrupar_s=0.05):
+        self.executor = executor
+        self.orcamento = orcamento
+        self.fator_maximo = fator_maximo
+        self.espera_inicial = espera_inicial
+        self.agrupar_s = agrupar_s
+        intervalos = intervalos or {}
+        self.intervalos = {c.nome: intervalos.get(c.nome, c.intervalo) for c in executor.coletores}
+        self.intervalos_efetivos = dict(self.intervalos)
+        self._proximo = {c.nome: 0.0 for c in executor.coletores}
+        self._publicados = None  # nome -> momento do valor publicado por último
+        self._parar = threading.Event()
+
+    def parar(self):
+        """Interrompe o loop de executar()"""
+        self._parar.set()
+
+    def _ajustar_intervalo(self, nome):
+        configurado = self.intervalos[nome]
+        custo = self.executor.custos.get(nome, 0.0)
+        if custo > self.orcamento * configurado:
+            efetivo = min(custo / self.orcamento, configurado * self.fator_maximo)
+        else:
+            efetivo = configurado
+        self.intervalos_efetivos[nome] = efetivo
+        return efetivo
+
+    def _reagendar(self, nome, agora):
+        intervalo = self._ajustar_intervalo(nome)
+        proximo = self._proximo[nome] + intervalo
+        if proximo <= agora:
+            # Perdeu horários: pula para o próximo mantendo a fase
+            atrasos = int((agora - proximo) // intervalo) + 1
+            proximo += atrasos * intervalo
+        self._proximo[nome] = proximo
+
+    def _publicar_parcial(self, ao_coletar):
+        """
+        Primeira rodada com espera_inicial: dispara todos, publica os que
+        responderem a tempo e só reagenda esses; os que ainda estão
+        rodando continuam vencidos e são esperados pelo loop normal
+        """
+        futuros = self.executor.disparar(self.executor.coletores)
+        wait(list(futuros.values()), timeout=self.espera_inicial)
+        agora = time.monotonic()
+        prontos = [nome for nome, futuro in futuros.items() if futuro.done()]
+        for nome in prontos:
+            self._reagendar(nome, agora)
+        if prontos:
+            self._publicar(ao_coletar, self.executor.ultimos_resultados())
+
+    def _publicar(self, ao_coletar, resultados):
+        """
+        Entrega `resultados` se algum coletor trouxe valor novo desde a
+        última publicação (a primeira é sempre entregue)
+        Retorna True se publicou
+        """
+        momentos = {nome: r.momento for nome, r in resultados.items()}
+        if momentos == self._publicados:
+            return False
+        self._publicados = momentos
+        try:
+            with medir_etapa("publicacao"):
+                ao_coletar(resultados)
+        except Exception as e:
+            print(f"Erro na atualização: {e}")
+        return True
+
+    def _agrupar(self, rodando, ate):
+        """
+        Depois que algum coletor terminou, espera os que foram disparados
+        na mesma rodada até `ate` (None: sem limite) ou até o prazo de
+        cada um, para que saiam na mesma publicação
+        """
+        while True:
+            agora = time.monotonic()
+            rodadas = {inicio for _, inicio, futuro in rodando.values() if futuro.done()}
+            faltam = [(inicio + coletor.prazo, futuro) for coletor, inicio, futuro in rodando.values()
+                      if inicio in rodadas and not futuro.done() and inicio + coletor.prazo > agora]
+            if not faltam:
+                return
+            limite = min(prazo for prazo, _ in faltam)
+            if ate is not None:
+                limite = min(limite, ate)
+            if limite <= agora:
+                return
+            wait([futuro for _, futuro in faltam], timeout=limite - agora, return_when=FIRST_COMPLETED)
+
+    def executar(self, ao_coletar):
+        """
+        Loop principal (bloqueia até parar() ser chamado)
+        `ao_coletar` recebe o dicionário nome -> ResultadoColeta de
+        todos os coletores quando algum deles traz um valor novo
+
+        Cada coletor é esperado só até o seu prazo: um coletor lento
+        (processos, atributos) não segura o ritmo dos rápidos (cpu, ram)
+        que vencerem enquanto ele roda
+        """
+        # nome -> (coletor, início, futuro) dos que foram disparados e
+        # ainda não terminaram nem perderam o prazo
+        rodando = {}
+        primeira = True
+        esperar_todos = False
+        while not self._parar.is_set():
+            agora = time.monotonic()
+            if primeira:
+                # Alinha todos os coletores no início
+                self._proximo = dict.fromkeys(self._proximo, agora)
+                primeira = False
+                if self.espera_inicial > 0:
+                    self._publicar_parcial(ao_coletar)
+                    continue
+                esperar_todos = True
+
+            vencidos = [c for c in self.executor.coletores
+                        if c.nome not in rodando and self._proximo[c.nome] <= agora]
+            if vencidos:
+                futuros = self.executor.disparar(vencidos)
+                for coletor in vencidos:
+                    rodando[coletor.nome] = (coletor, agora, futuros[coletor.nome])
+
+            # Espera o primeiro que terminar, o próximo prazo ou o próximo horário
+            eventos = [inicio + coletor.prazo for coletor, inicio, _ in rodando.values()]
+            eventos += [proximo for nome, proximo in self._proximo.items() if nome not in rodando]
+            espera = max(min(eventos) - agora, 0) if eventos else None
+            if rodando:
+                wait([futuro for _, _, futuro in rodando.values()], timeout=espera,
+                     return_when=FIRST_COMPLETED)
+                # Junta na mesma publicação quem terminar logo em seguida
+                # (na primeira rodada, todos, cada um até o seu prazo)
+                self._agrupar(rodando, None if esperar_todos else time.monotonic() + self.agrupar_s)
+            else:
+                self._parar.wait(espera)
+
+            agora = time.monotonic()
+            recentes = {}
+            for nome, (coletor, inicio, futuro) in list(rodando.items()):
+                if futuro.done() or agora >= inicio + coletor.prazo:
+                    # Quem perdeu o prazo continua rodando no pool e é
+                    # servido atrasado; não é disparado de novo até acabar
+                    recentes[nome] = self.executor.resultado(coletor, inicio)
+                    del rodando[nome]
+                    self._reagendar(nome, agora)
+            if recentes and self._publicar(ao_coletar, self.executor.ultimos_resultados(recentes)):
+                esperar_todos = False
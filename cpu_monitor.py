@@ -1,6 +1,11 @@
 import psutil
 import platform
 import sys
+import threading
+import time
+from array import array
+
+from amostras import AmostraCPU
 
 def obter_modelo_cpu():
     # Windows
@@ -33,6 +38,104 @@ def obter_modelo_cpu():
     # Fallback
     return platform.processor()
 
+class AmostradorCPU:
+    """
+    Calcula o uso da CPU a partir da diferença entre duas leituras de
+    psutil.cpu_times(percpu=True), sem nenhuma espera (sleep)
+
+    O total e cada núcleo saem da mesma leitura, então o uso total é
+    exatamente a média ponderada dos núcleos
+
+    Leituras a menos de `intervalo_minimo` (s) da anterior não dão uma
+    porcentagem confiável (os contadores andam em ticks de ~10 ms):
+    amostrar() retorna None e mantém a leitura anterior como base
+    """
+
+    def __init__(self, intervalo_minimo=0.1):
+        self.intervalo_minimo = intervalo_minimo
+        self._lock = threading.Lock()
+        self._anterior = psutil.cpu_times(percpu=True)
+        self._momento_anterior = time.monotonic()
+
+    @staticmethod
+    def _tempos(amostra):
+        """Retorna (tempo_ocupado, tempo_total) de um núcleo"""
+        total = sum(amostra)
+        ocioso = amostra.idle + getattr(amostra, 'iowait', 0.0)
+        # No Linux guest e guest_nice já estão contados em user e nice
+        total -= getattr(amostra, 'guest', 0.0) + getattr(amostra, 'guest_nice', 0.0)
+        return total - ocioso, total
+
+    def amostrar(self):
+        """
+        Faz uma leitura e compara com a anterior
+        Retorna (uso_total, uso_por_core) em porcentagem, sem arredondar
+        (uso_por_core é um array('d')), ou None se a anterior é recente demais
+        """
+        with self._lock:
+            agora = time.monotonic()
+            if agora - self._momento_anterior < self.intervalo_minimo:
+                return None
+            atual = psutil.cpu_times(percpu=True)
+            anterior, self._anterior = self._anterior, atual
+            self._momento_anterior = agora
+
+        # Se o número de núcleos mudou (CPU hotplug), recomeça a contagem
+        if len(anterior) != len(atual):
+            return 0.0, array('d', bytes(8 * len(atual)))
+
+        uso_por_core = array('d')
+        soma_ocupado = 0.0
+        soma_total = 0.0
+        for antes, depois in zip(anterior, atual):
+            ocupado_antes, total_antes = self._tempos(antes)
+            ocupado_depois, total_depois = self._tempos(depois)
+            delta_ocupado = max(ocupado_depois - ocupado_antes, 0.0)
+            delta_total = total_depois - total_antes
+            if delta_total <= 0:
+                uso_por_core.append(0.0)
+                continue
+            soma_ocupado += delta_ocupado
+            soma_total += delta_total
+            uso_por_core.append(min(delta_ocupado / delta_total * 100, 100.0))
+
+        uso_total = min(soma_ocupado / soma_total * 100, 100.0) if soma_total > 0 else 0.0
+        return uso_total, uso_por_core
+
+_amostrador = None
+_lock_amostrador = threading.Lock()
+
+def iniciar_amostrador_cpu():
+    """
+    Faz a leitura base do uso da CPU (se ainda não foi feita)
+    Chamado ao criar os coletores, antes da primeira coleta
+    """
+    global _amostrador
+    # O executor pode chamar amostrar_cpu de duas threads ao mesmo tempo
+    with _lock_amostrador:
+        if _amostrador is None:
+            _amostrador = AmostradorCPU()
+        return _amostrador
+
+def amostrar_cpu():
+    """
+    Coleta o uso da CPU desde a chamada anterior
+    Retorna uma AmostraCPU com valores sem arredondamento, indisponível
+    enquanto não houver tempo suficiente desde a leitura base (ex.: a
+    primeira chamada, se o amostrador acabou de ser criado)
+    """
+    try:
+        # Total e núcleos vêm da mesma leitura, sem bloquear
+        leitura = iniciar_amostrador_cpu().amostrar()
+        if leitura is None:
+            return AmostraCPU.indisponivel()
+        uso_total, uso_por_core = leitura
+        return AmostraCPU(uso_total, uso_por_core)
+
+    except Exception as e:
+        print(f"Erro ao obter dados da CPU: {e}")
+        return AmostraCPU.indisponivel()
+
 def obter_uso_cpu():
     """
     Coleta informações de uso da CPU
@@ -41,48 +144,36 @@ def obter_uso_cpu():
     - uso_por_core: lista com uso de cada núcleo
     - numero_cores: quantidade de núcleos
     """
+    amostra = amostrar_cpu()
+    return {
+        'uso_total': round(amostra.uso_total, 1),
+        'uso_por_core': [round(core, 1) for core in amostra.uso_por_core],
+        'numero_cores': amostra.numero_cores
+    }
+
+def ler_frequencia_cpu():
+    """
+    Frequência atual da CPU em MHz, sem arredondar
+    Retorna None se o sistema não informar
+    """
     try:
-        # Obtém o uso total da CPU (média de 0.1 segundos)
-        uso_total = psutil.cpu_percent(interval=0.1)
-        
-        # Obtém o uso de cada núcleo individual
-        uso_por_core = psutil.cpu_percent(interval=0.1, percpu=True)
-        
-        # Conta quantos núcleos temos
-        numero_cores = psutil.cpu_count()
-        
-        # Organiza tudo em um dicionário
-        dados_cpu = {
-            'uso_total': round(uso_total, 1),
-            'uso_por_core': [round(core, 1) for core in uso_por_core],
-            'numero_cores': numero_cores
-        }
-        
-        return dados_cpu
-        
-    except Exception as e:
-        print(f"Erro ao obter dados da CPU: {e}")
-        # Retorna dados padrão em caso de erro
-        return {
-            'uso_total': 0.0,
-            'uso_por_core': [0.0, 0.0, 0.0, 0.0],
-            'numero_cores': 4
-        }
+        freq = psutil.cpu_freq()
+        return freq.current if freq else None
+    except Exception:
+        return None
 
 def obter_frequencia_cpu():
     """
     Obtém a frequência atual da CPU em MHz
     """
-    try:
-        freq = psutil.cpu_freq()
-        if freq:
-            return round(freq.current, 0)
-        return 0
-    except:
-        return 0
+    frequencia = ler_frequencia_cpu()
+    return round(frequencia, 0) if frequencia is not None else 0
 
 # Teste da função (só executa se rodar este arquivo diretamente)
 if __name__ == "__main__":
+    import time
+    obter_uso_cpu()
+    time.sleep(0.5)
     dados = obter_uso_cpu()
     print("=== TESTE DO MONITOR DE CPU ===")
     print(f"Uso total: {dados['uso_total']}%")
@@ -0,0 +1,238 @@
+"""
+Exportador Prometheus/OpenMetrics
+
+Serve GET /metrics com o último snapshot publicado pelos coletores.
+Uma requisição nunca dispara coleta: o texto é gerado uma vez por
+snapshot (em publicar) e cada requisição só envia os bytes prontos
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from instrumentacao import resumo_etapas
+
+TIPO_PROMETHEUS = "text/plain; version=0.0.4; charset=utf-8"
+TIPO_OPENMETRICS = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+MB = 1024 ** 2
+
+# Atributos caros exportados para os processos do topo: campo, métrica, ajuda
+ATRIBUTOS_EXPORTADOS = [
+    ('uss_bytes', 'processo_uss_bytes', "Memória exclusiva (USS) do processo"),
+    ('pss_bytes', 'processo_pss_bytes', "Memória proporcional (PSS) do processo"),
+    ('io_leitura_bytes', 'processo_io_leitura_bytes', "Bytes lidos do disco pelo processo"),
+    ('io_escrita_bytes', 'processo_io_escrita_bytes', "Bytes escritos no disco pelo processo"),
+    ('threads', 'processo_threads', "Threads do processo"),
+    ('arquivos_abertos', 'processo_arquivos_abertos', "Descritores/handles abertos pelo processo"),
+]
+
+def _escapar(valor):
+    """Escapa o valor de um rótulo (barra, aspas e quebra de linha)"""
+    return str(valor).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def _numero(valor):
+    if isinstance(valor, bool):
+        return "1" if valor else "0"
+    valor = float(valor)
+    if valor != valor:
+        return "NaN"
+    if valor in (float('inf'), float('-inf')):
+        # O formato de texto escreve +Inf/-Inf (repr daria 'inf')
+        return "+Inf" if valor > 0 else "-Inf"
+    return repr(valor)
+
+class _Familia:
+    """Uma métrica (gauge) com suas amostras, na ordem de inclusão"""
+
+    def __init__(self, nome, ajuda):
+        self.nome = nome
+        self.ajuda = ajuda
+        self.amostras = []
+
+    def adicionar(self, valor, **rotulos):
+        self.amostras.append((rotulos, valor))
+
+    def texto(self, linhas):
+        if not self.amostras:
+            return
+        linhas.append(f"# HELP {self.nome} {self.ajuda}")
+        linhas.append(f"# TYPE {self.nome} gauge")
+        for rotulos, valor in self.amostras:
+            if rotulos:
+                texto_rotulos = ",".join(f'{chave}="{_escapar(v)}"' for chave, v in rotulos.items())
+                linhas.append(f"{self.nome}{{{texto_rotulos}}} {_numero(valor)}")
+            else:
+                linhas.append(f"{self.nome} {_numero(valor)}")
+
+def renderizar_metricas(resultados, horario=None, etapas=None):
+    """
+    Converte os resultados dos coletores (nome -> ResultadoColeta) no
+    formato de texto do Prometheus (sem a linha final '# EOF')
+    `etapas` (padrão: resumo_etapas()) traz os tempos do próprio monitor
+    """
+    familias = {}
+
+    def familia(nome, ajuda):
+        if nome not in familias:
+            familias[nome] = _Familia(f"monitor_{nome}", ajuda)
+        return familias[nome]
+
+    cpu = resultados['cpu'].valor
+    familia('cpu_disponivel', "1 se há dados da CPU").adicionar(cpu.disponivel)
+    if cpu.disponivel:
+        familia('cpu_uso_percent', "Uso total da CPU").adicionar(cpu.uso_total)
+        uso_core = familia('cpu_core_uso_percent', "Uso de cada núcleo da CPU")
+        for i, uso in enumerate(cpu.uso_por_core):
+            uso_core.adicionar(uso, core=i)
+    frequencia = resultados['frequencia'].valor
+    if frequencia is not None:
+        familia('cpu_frequencia_mhz', "Frequência atual da CPU").adicionar(frequencia)
+
+    ram = resultados['ram'].valor
+    if ram.disponivel:
+        familia('ram_uso_percent', "Uso da RAM").adicionar(ram.porcentagem)
+        familia('ram_usada_bytes', "RAM em uso").adicionar(ram.usada_bytes)
+        familia('ram_disponivel_bytes', "RAM disponível para novos processos").adicionar(ram.livre_bytes)
+        familia('ram_total_bytes', "RAM total").adicionar(ram.total_bytes)
+
+    swap = resultados['swap'].valor
+    if swap.disponivel:
+        familia('swap_uso_percent', "Uso do swap").adicionar(swap.porcentagem)
+        familia('swap_usada_bytes', "Swap em uso").adicionar(swap.usada_bytes)
+        familia('swap_total_bytes', "Swap total").adicionar(swap.total_bytes)
+
+    gpu = resultados['gpu'].valor
+    familia('gpu_disponivel', "1 se há dados de GPU").adicionar(gpu.disponivel)
+    if gpu.disponivel:
+        familia('gpu_uso_percent', "Uso da GPU").adicionar(gpu.uso_porcentagem, gpu=gpu.nome)
+        familia('gpu_memoria_usada_bytes', "Memória da GPU em uso").adicionar(
+            gpu.memoria_usada_mb * MB, gpu=gpu.nome)
+        familia('gpu_memoria_total_bytes', "Memória total da GPU").adicionar(
+            gpu.memoria_total_mb * MB, gpu=gpu.nome)
+        familia('gpu_temperatura_celsius', "Temperatura da GPU").adicionar(gpu.temperatura, gpu=gpu.nome)
+
+    # Processos do topo dos dois rankings (cada PID aparece uma vez)
+    processos_cpu, processos_ram = resultados['processos'].valor
+    cpu_processo = familia('processo_cpu_percent', "Uso de CPU dos processos do topo")
+    memoria_processo = familia('processo_memoria_bytes', "Memória residente dos processos do topo")
+    vistos = {}  # pid -> nome, na ordem dos rankings
+    for processo in processos_cpu + processos_ram:
+        if processo.pid in vistos:
+            continue
+        vistos[processo.pid] = processo.nome
+        cpu_processo.adicionar(processo.cpu_percent, pid=processo.pid, nome=processo.nome)
+        memoria_processo.adicionar(processo.memoria_bytes, pid=processo.pid, nome=processo.nome)
+
+    # Atributos caros desses processos, com a idade da leitura
+    atributos = resultados['atributos'].valor if 'atributos' in resultados else {}
+    agora = time.monotonic()
+    for campo, metrica, ajuda in ATRIBUTOS_EXPORTADOS:
+        f = familia(metrica, ajuda)
+        for pid, nome in vistos.items():
+            valor = getattr(atributos.get(pid), campo, None)
+            if valor is not None:
+                f.adicionar(valor, pid=pid, nome=nome)
+    idade = familia('processo_atributos_idade_segundos', "Idade da leitura dos atributos caros do processo")
+    for pid, nome in vistos.items():
+        if pid in atributos:
+            idade.adicionar(atributos[pid].idade(agora), pid=pid, nome=nome)
+
+    # Custo do próprio monitor
+    monitor = resultados['monitor'].valor
+    if monitor.disponivel:
+        familia('proprio_cpu_percent', "CPU usada pelo processo do monitor").adicionar(monitor.cpu_percent)
+        familia('proprio_rss_bytes', "Memória residente do processo do monitor").adicionar(monitor.rss_bytes)
+        familia('proprio_threads', "Threads do processo do monitor").adicionar(monitor.threads)
+    duracao = familia('etapa_segundos', "Duração das etapas do monitor (janela móvel)")
+    for etapa, resumo in (resumo_etapas() if etapas is None else etapas).items():
+        for tempo, quantil, valor in (("parede", "0.5", resumo.parede_p50), ("parede", "0.99", resumo.parede_p99),
+                                      ("cpu", "0.5", resumo.cpu_p50), ("cpu", "0.99", resumo.cpu_p99)):
+            # "quantile" é reservado a summaries; a família é gauge
+            duracao.adicionar(valor / 1000, etapa=etapa, tempo=tempo, quantil=quantil)
+
+    atrasado = familia('coletor_atrasado', "1 se o coletor perdeu o prazo e o valor é o anterior")
+    for nome in sorted(resultados):
+        atrasado.adicionar(resultados[nome].atrasado, coletor=nome)
+    familia('snapshot_horario_segundos', "Horário (epoch) do snapshot").adicionar(
+        horario if horario is not None else time.time())
+
+    linhas = []
+    for f in familias.values():
+        f.texto(linhas)
+    return "\n".join(linhas) + "\n"
+
+class ExportadorPrometheus:
+    """
+    Servidor HTTP (thread própria) para o endpoint /metrics
+
+    publicar() é chamado a cada snapshot e gera o texto uma única vez;
+    as requisições só leem a referência do cache, então muitos
+    scrapers não aumentam a carga da coleta
+    """
+
+    def __init__(self, porta=9101, endereco="127.0.0.1"):
+        self.porta = porta
+        self.endereco = endereco
+        self._corpo = b"# nenhum snapshot ainda\n"
+        self._corpo_openmetrics = b"# EOF\n"
+        self._servidor = None
+        self._thread = None
+
+    def publicar(self, resultados):
+        """Gera o texto do novo snapshot (thread de coleta)"""
+        try:
+            texto = renderizar_metricas(resultados)
+        except Exception as e:
+            print(f"Erro ao gerar métricas: {e}")
+            return
+        corpo = texto.encode("utf-8")
+        # Troca as duas referências; leitores veem a versão antiga ou a nova
+        self._corpo, self._corpo_openmetrics = corpo, corpo + b"# EOF\n"
+
+    def _criar_handler(self):
+        exportador = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                if "application/openmetrics-text" in self.headers.get("Accept", ""):
+                    corpo, tipo = exportador._corpo_openmetrics, TIPO_OPENMETRICS
+                else:
+                    corpo, tipo = exportador._corpo, TIPO_PROMETHEUS
+                self.send_response(200)
+                self.send_header("Content-Type", tipo)
+                self.send_header("Content-Length", str(len(corpo)))
+                self.end_headers()
+                self.wfile.write(corpo)
+
+            def log_message(self, formato, *args):
+                pass
+
+        return Handler
+
+    def iniciar(self):
+        """Abre a porta e atende em segundo plano"""
+        self._servidor = ThreadingHTTPServer((self.endereco, self.porta), self._criar_handler())
+        self._servidor.daemon_threads = True
+        self._thread = threading.Thread(target=self._servidor.serve_forever, daemon=True)
+        self._thread.start()
+        print(f"Métricas em http://{self.endereco}:{self.porta}/metrics")
+
+    def parar(self):
+        if self._servidor is not None:
+            self._servidor.shutdown()
+            self._servidor.server_close()
+            self._servidor = None
+
+# Teste do módulo (só executa se rodar este arquivo diretamente)
+if __name__ == "__main__":
+    from coletores import ExecutorColetores
+
+    executor = ExecutorColetores()
+    executor.coletar()
+    resultados = executor.coletar()
+    print(renderizar_metricas(resultados))
+    executor.encerrar()
@@ -1,44 +1,180 @@
 import subprocess
+import threading
+import shutil
+import atexit
+import time
 import re
 
+from amostras import AmostraGPU
+
+# Intervalo (ms) em que o nvidia-smi persistente emite novas amostras
+INTERVALO_NVIDIA_MS = 1000
+
+# Campos consultados no nvidia-smi (index identifica a GPU da linha)
+CAMPOS_NVIDIA = 'index,utilization.gpu,memory.used,memory.total,temperature.gpu,name'
+
+def _interpretar_linha_nvidia(linha):
+    """
+    Converte uma linha CSV do nvidia-smi em (indice, AmostraGPU)
+    Retorna None se a linha não puder ser interpretada
+    """
+    partes = linha.split(',')
+    if len(partes) < 6:
+        return None
+    try:
+        indice = int(partes[0].strip())
+        uso_gpu = float(partes[1].strip())
+        memoria_usada = float(partes[2].strip())
+        memoria_total = float(partes[3].strip())
+        temperatura = float(partes[4].strip())
+    except ValueError:
+        return None
+    # O nome pode conter vírgulas
+    nome_gpu = ','.join(partes[5:]).strip()
+
+    return indice, AmostraGPU(uso_gpu, memoria_usada, memoria_total, temperatura, nome_gpu)
+
+class LeitorNvidiaSmi:
+    """
+    Mantém um único processo `nvidia-smi -lms N` rodando e lê as linhas
+    em uma thread própria, guardando sempre a amostra mais recente
+
+    Se o processo terminar, ele é reiniciado com espera crescente.
+    O executável é procurado no PATH, então um script falso chamado
+    nvidia-smi pode ser usado para testes
+    """
+
+    def __init__(self, intervalo_ms=INTERVALO_NVIDIA_MS, comando='nvidia-smi'):
+        self.intervalo_ms = intervalo_ms
+        self.comando = comando
+        self.reinicios = 0
+        self.indisponivel = False
+        self._amostra = None
+        self._momento_amostra = 0.0
+        self._processo = None
+        self._thread = None
+        self._lock = threading.Lock()
+        self._parar = threading.Event()
+        self._primeira_amostra = threading.Event()
+
+    def iniciar(self):
+        """Inicia a thread leitora (e o processo nvidia-smi)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._parar.clear()
+        self._thread = threading.Thread(target=self._executar, name="leitor-nvidia-smi")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def parar(self):
+        """Encerra o processo nvidia-smi e a thread leitora"""
+        self._parar.set()
+        processo = self._processo
+        if processo is not None and processo.poll() is None:
+            try:
+                processo.terminate()
+                processo.wait(timeout=2)
+            except Exception:
+                processo.kill()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2)
+
+    def aguardar_amostra(self, timeout):
+        """Espera a primeira amostra chegar (ou o timeout acabar)"""
+        return self._primeira_amostra.wait(timeout)
+
+    def ultima_amostra(self, idade_maxima=None):
+        """
+        Retorna a amostra mais recente ou None se não
+        houver amostra ou se ela for mais velha que idade_maxima (s)
+        """
+        if idade_maxima is None:
+            # Tolera alguns intervalos perdidos antes de considerar velha
+            idade_maxima = max(3 * self.intervalo_ms / 1000, 5.0)
+        with self._lock:
+            if self._amostra is None:
+                return None
+            if time.monotonic() - self._momento_amostra > idade_maxima:
+                return None
+            # Cada linha gera uma AmostraGPU nova: não precisa copiar
+            return self._amostra
+
+    def _iniciar_processo(self):
+        return subprocess.Popen(
+            [self.comando,
+             f'--query-gpu={CAMPOS_NVIDIA}',
+             '--format=csv,noheader,nounits',
+             '-lms', str(self.intervalo_ms)],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            stdin=subprocess.DEVNULL, text=True, bufsize=1
+        )
+
+    def _executar(self):
+        """Loop da thread: roda o nvidia-smi e reinicia se ele cair"""
+        espera = 1.0
+        while not self._parar.is_set():
+            try:
+                self._processo = self._iniciar_processo()
+            except OSError:
+                # nvidia-smi não existe ou não pode ser executado
+                self.indisponivel = True
+                self._primeira_amostra.set()
+                return
+
+            recebeu_amostra = False
+            for linha in self._processo.stdout:
+                resultado = _interpretar_linha_nvidia(linha)
+                if resultado is None:
+                    continue
+                indice, dados = resultado
+                # Por enquanto só mostramos a primeira GPU
+                if indice != 0:
+                    continue
+                with self._lock:
+                    self._amostra = dados
+                    self._momento_amostra = time.monotonic()
+                recebeu_amostra = True
+                self._primeira_amostra.set()
+
+            self._processo.wait()
+            if self._parar.is_set():
+                break
+
+            # O processo caiu: reinicia com espera crescente
+            espera = 1.0 if recebeu_amostra else min(espera * 2, 30.0)
+            self.reinicios += 1
+            self._primeira_amostra.set()
+            self._parar.wait(espera)
+
+_leitor_nvidia = None
+_lock_leitor = threading.Lock()
+
 def obter_uso_gpu_nvidia():
     """
     Tenta obter informações da GPU NVIDIA usando nvidia-smi
-    Retorna um dicionário com informações da GPU ou None se não conseguir
+    Retorna uma AmostraGPU ou None se não conseguir
+
+    Na primeira chamada inicia o nvidia-smi persistente; depois disso
+    apenas devolve a última amostra lida, sem criar processos
     """
-    try:
-        # Executa o comando nvidia-smi para obter informações da GPU
-        resultado = subprocess.run([
-            'nvidia-smi', 
-            '--query-gpu=utilization.gpu,memory.used,memory.total,temperature.gpu,name',
-            '--format=csv,noheader,nounits'
-        ], capture_output=True, text=True, timeout=5)
-        
-        if resultado.returncode == 0:
-            # Processa a saída do comando
-            linha = resultado.stdout.strip()
-            partes = linha.split(',')
-            
-            if len(partes) >= 5:
-                uso_gpu = float(partes[0].strip())
-                memoria_usada = float(partes[1].strip())
-                memoria_total = float(partes[2].strip())
-                temperatura = float(partes[3].strip())
-                nome_gpu = partes[4].strip()
-                
-                return {
-                    'uso_porcentagem': round(uso_gpu, 1),
-                    'memoria_usada_mb': round(memoria_usada, 0),
-                    'memoria_total_mb': round(memoria_total, 0),
-                    'memoria_porcentagem': round((memoria_usada / memoria_total) * 100, 1),
-                    'temperatura': round(temperatura, 0),
-                    'nome': nome_gpu,
-                    'disponivel': True
-                }
-    except:
-        pass
-    
-    return None
+    global _leitor_nvidia
+    with _lock_leitor:
+        if _leitor_nvidia is None:
+            _leitor_nvidia = LeitorNvidiaSmi()
+            _leitor_nvidia.iniciar()
+            # Só a primeira chamada espera o nvidia-smi responder
+            _leitor_nvidia.aguardar_amostra(timeout=2)
+    return _leitor_nvidia.ultima_amostra()
+
+def encerrar_leitor_nvidia():
+    """Para o nvidia-smi persistente (se estiver rodando)"""
+    global _leitor_nvidia
+    with _lock_leitor:
+        leitor, _leitor_nvidia = _leitor_nvidia, None
+    if leitor is not None:
+        leitor.parar()
+
+atexit.register(encerrar_leitor_nvidia)
 
 def obter_uso_gpu_amd():
     """
@@ -58,37 +194,153 @@ def obter_uso_gpu_amd():
                     # Extrai porcentagem usando regex
                     match = re.search(r'(\d+)%', linha)
                     if match:
-                        uso = float(match.group(1))
-                        return {
-                            'uso_porcentagem': round(uso, 1),
-                            'memoria_usada_mb': 0,
-                            'memoria_total_mb': 0,
-                            'memoria_porcentagem': 0,
-                            'temperatura': 0,
-                            'nome': 'GPU AMD',
-                            'disponivel': True
-                        }
+                        return AmostraGPU(float(match.group(1)), nome='GPU AMD')
     except:
         pass
     
     return None
 
-def obter_uso_gpu():
+def obter_info_gpus():
     """
-    Função principal para obter dados da GPU
-    Tenta diferentes métodos dependendo da GPU disponível
+    Lista as GPUs NVIDIA instaladas (dados que não mudam)
+    Retorna uma lista de dicionários com 'nome' e 'memoria_total_mb'
     """
-    # Primeiro tenta NVIDIA
-    dados_nvidia = obter_uso_gpu_nvidia()
-    if dados_nvidia:
-        return dados_nvidia
-    
-    # Se não achou NVIDIA, tenta AMD
-    dados_amd = obter_uso_gpu_amd()
-    if dados_amd:
-        return dados_amd
-    
-    # Se não conseguiu obter dados de nenhuma GPU
+    if shutil.which('nvidia-smi') is None:
+        return []
+    try:
+        resultado = subprocess.run([
+            'nvidia-smi',
+            '--query-gpu=name,memory.total',
+            '--format=csv,noheader,nounits'
+        ], capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return []
+
+    gpus = []
+    if resultado.returncode == 0:
+        for linha in resultado.stdout.splitlines():
+            nome, _, memoria = linha.rpartition(',')
+            try:
+                gpus.append({'nome': nome.strip(), 'memoria_total_mb': round(float(memoria), 0)})
+            except ValueError:
+                continue
+    return gpus
+
+class _BackendNvidia:
+    nome = 'nvidia'
+
+    def sondar(self):
+        # Sem o executável no PATH nem tenta criar processo
+        if shutil.which('nvidia-smi') is None:
+            return False
+        if obter_uso_gpu_nvidia() is None:
+            encerrar_leitor_nvidia()
+            return False
+        return True
+
+    def ler(self):
+        return obter_uso_gpu_nvidia()
+
+    def ainda_disponivel(self):
+        # O leitor se reinicia sozinho; só desiste se o nvidia-smi sumir
+        leitor = _leitor_nvidia
+        return leitor is not None and not leitor.indisponivel
+
+    def encerrar(self):
+        encerrar_leitor_nvidia()
+
+class _BackendAmd:
+    nome = 'amd'
+
+    def sondar(self):
+        if shutil.which('rocm-smi') is None:
+            return False
+        return obter_uso_gpu_amd() is not None
+
+    def ler(self):
+        return obter_uso_gpu_amd()
+
+    def ainda_disponivel(self):
+        return False
+
+    def encerrar(self):
+        pass
+
+class DetectorGPU:
+    """
+    Descobre qual backend de GPU funciona e guarda o resultado
+
+    Backends que falharam só são testados de novo depois de uma espera
+    que dobra a cada falha (de espera_inicial até espera_maxima).
+    Assim uma máquina sem GPU não cria processos a cada atualização
+    """
+
+    def __init__(self, backends=None, espera_inicial=30.0, espera_maxima=3600.0):
+        self.backends = backends if backends is not None else [_BackendNvidia(), _BackendAmd()]
+        self.espera_inicial = espera_inicial
+        self.espera_maxima = espera_maxima
+        self.ativo = None
+        self._falhas = {}
+        self._proxima_tentativa = {}
+        self._lock = threading.Lock()
+
+    def forcar_nova_deteccao(self):
+        """Esquece o cache e as esperas; a próxima leitura sonda tudo de novo"""
+        with self._lock:
+            if self.ativo is not None:
+                self.ativo.encerrar()
+            self.ativo = None
+            self._falhas.clear()
+            self._proxima_tentativa.clear()
+
+    def _registrar_falha(self, backend, agora):
+        falhas = self._falhas.get(backend.nome, 0) + 1
+        self._falhas[backend.nome] = falhas
+        espera = min(self.espera_inicial * 2 ** (falhas - 1), self.espera_maxima)
+        self._proxima_tentativa[backend.nome] = agora + espera
+
+    def ler(self):
+        """Retorna os dados do backend ativo ou None se não houver GPU"""
+        with self._lock:
+            agora = time.monotonic()
+
+            if self.ativo is not None:
+                dados = self.ativo.ler()
+                if dados is not None:
+                    return dados
+                if self.ativo.ainda_disponivel():
+                    return None
+                self.ativo.encerrar()
+                self._registrar_falha(self.ativo, agora)
+                self.ativo = None
+
+            for backend in self.backends:
+                if self._proxima_tentativa.get(backend.nome, 0.0) > agora:
+                    continue
+                if backend.sondar():
+                    self._falhas.pop(backend.nome, None)
+                    self._proxima_tentativa.pop(backend.nome, None)
+                    self.ativo = backend
+                    return backend.ler()
+                self._registrar_falha(backend, agora)
+
+            return None
+
+_detector_gpu = DetectorGPU()
+
+def detectar_gpu(forcar=False):
+    """
+    Faz a detecção do backend de GPU (normalmente só no início)
+    Com forcar=True ignora o cache e as esperas de backends que falharam
+    Retorna o nome do backend ativo ou None
+    """
+    if forcar:
+        _detector_gpu.forcar_nova_deteccao()
+    _detector_gpu.ler()
+    return _detector_gpu.ativo.nome if _detector_gpu.ativo else None
+
+def dados_gpu_indisponivel():
+    """Dicionário usado quando não há dados de nenhuma GPU"""
     return {
         'uso_porcentagem': 0.0,
         'memoria_usada_mb': 0,
@@ -99,6 +351,32 @@ def obter_uso_gpu():
         'disponivel': False
     }
 
+def amostrar_gpu():
+    """
+    Função principal para obter dados da GPU
+    Usa o backend detectado (NVIDIA ou AMD) guardado em cache
+    Retorna uma AmostraGPU (disponivel=False se não há GPU)
+    """
+    amostra = _detector_gpu.ler()
+    if amostra is not None:
+        return amostra
+    return AmostraGPU.indisponivel()
+
+def obter_uso_gpu():
+    """Dados da GPU em um dicionário com valores arredondados"""
+    amostra = _detector_gpu.ler()
+    if amostra is None:
+        return dados_gpu_indisponivel()
+    return {
+        'uso_porcentagem': round(amostra.uso_porcentagem, 1),
+        'memoria_usada_mb': round(amostra.memoria_usada_mb, 0),
+        'memoria_total_mb': round(amostra.memoria_total_mb, 0),
+        'memoria_porcentagem': round(amostra.memoria_porcentagem, 1),
+        'temperatura': round(amostra.temperatura, 0),
+        'nome': amostra.nome,
+        'disponivel': True
+    }
+
 # Teste da função (só executa se rodar este arquivo diretamente)
 if __name__ == "__main__":
     dados = obter_uso_gpu()
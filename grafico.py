@@ -0,0 +1,170 @@
+import tkinter as tk
+
+class GraficoHistorico:
+    """
+    Gráfico de linha (0-100%) desenhado em um Canvas de forma incremental
+
+    Todos os itens do canvas são criados uma única vez. A cada nova
+    amostra só as coordenadas da linha, das áreas e dos pontos são
+    trocadas com canvas.coords; grade e rótulos só são reposicionados
+    quando o canvas muda de tamanho
+
+    Se `fonte` for informada (função que recebe a quantidade de pontos
+    e devolve os valores), o gráfico pede no máximo um valor por pixel
+    de largura e busca de novo quando é redimensionado
+    """
+
+    MARGEM_X = 20
+    MARGEM_Y = 15
+
+    def __init__(self, parent, altura=200, cor_linha='#4a9eff',
+                 cores_area=('#4a9eff', '#93c5fd', '#dbeafe'), cor_destaque='#dbeafe', fonte=None):
+        self.canvas = tk.Canvas(parent, bg='#0f0f0f', height=altura)
+        self.valores = []
+        self.fonte = fonte
+        c = self.canvas
+
+        # Fundo, grade e rótulos (tag 'fundo')
+        self._retangulo = c.create_rectangle(0, 0, 0, 0, fill='#18181b', outline='', tags='fundo')
+        self._linhas_horizontais = [
+            c.create_line(0, 0, 0, 0, fill=cor, width=1, tags='fundo')
+            for cor in ['#23232b', '#333', '#23232b']
+        ]
+        self._linhas_verticais = [
+            c.create_line(0, 0, 0, 0, fill='#23232b', width=1, tags='fundo')
+            for _ in range(4)
+        ]
+        self._rotulos = [
+            c.create_text(0, 0, text=f"{percent}%", fill='#6b7280', font=('Arial', 9),
+                          anchor='e', tags='fundo')
+            for percent in [0, 50, 100]
+        ]
+
+        # Dados (tag 'dados'): áreas em camadas, sombra, linha e pontos
+        self._areas = [c.create_polygon(0, 0, 0, 0, 0, 0, fill=cor, outline='', tags='dados')
+                       for cor in cores_area]
+        self._sombra = c.create_line(0, 0, 0, 0, fill='#222', width=4, tags='dados',
+                                     capstyle='round', joinstyle='round')
+        self._linha = c.create_line(0, 0, 0, 0, fill=cor_linha, width=3, tags='dados',
+                                    capstyle='round', joinstyle='round')
+        self._pontos = []
+        for _ in range(2):
+            externo = c.create_oval(0, 0, 0, 0, fill=cor_destaque, outline=cor_linha, width=2, tags='dados')
+            interno = c.create_oval(0, 0, 0, 0, fill=cor_linha, outline='', tags='dados')
+            self._pontos.append((externo, interno))
+        self._valor_atual = c.create_text(0, 0, text="", fill=cor_linha, font=('Arial', 12, 'bold'),
+                                          anchor='ne', tags='dados')
+
+        self._vazio = c.create_text(0, 0, text="Coletando dados...", fill='#6b7280',
+                                    font=('Arial', 11), anchor='center')
+
+        self._largura = 0
+        self._altura = 0
+        self._estado = None
+        c.bind('<Configure>', self._ao_redimensionar)
+
+    def pack(self, **opcoes):
+        self.canvas.pack(**opcoes)
+
+    def _ao_redimensionar(self, evento):
+        if (evento.width, evento.height) == (self._largura, self._altura):
+            return
+        self._largura, self._altura = evento.width, evento.height
+        self._posicionar_fundo()
+        if self.fonte is not None:
+            self.valores = self.fonte(self.pontos_visiveis())
+        self._posicionar_dados()
+
+    def pontos_visiveis(self):
+        """Quantos pontos cabem no gráfico (um por pixel de largura)"""
+        largura_grafico, _ = self._area_util()
+        return max(2, largura_grafico)
+
+    def _area_util(self):
+        largura_grafico = self._largura - 2 * self.MARGEM_X
+        altura_grafico = self._altura - 2 * self.MARGEM_Y
+        return largura_grafico, altura_grafico
+
+    def _posicionar_fundo(self):
+        c = self.canvas
+        mx, my = self.MARGEM_X, self.MARGEM_Y
+        largura_grafico, altura_grafico = self._area_util()
+
+        c.coords(self._retangulo, 0, 0, self._largura, self._altura)
+        for item, rotulo, percent in zip(self._linhas_horizontais, self._rotulos, [0, 50, 100]):
+            y = my + altura_grafico - (percent / 100) * altura_grafico
+            c.coords(item, mx, y, mx + largura_grafico, y)
+            c.coords(rotulo, mx - 5, y)
+        for i, item in enumerate(self._linhas_verticais, start=1):
+            x = mx + (largura_grafico / 5) * i
+            c.coords(item, x, my, x, my + altura_grafico)
+        c.coords(self._vazio, self._largura // 2, self._altura // 2)
+        c.coords(self._valor_atual, mx + largura_grafico, my)
+
+    def _mostrar(self, com_dados):
+        if self._estado == com_dados:
+            return
+        self._estado = com_dados
+        visivel, oculto = 'normal', 'hidden'
+        self.canvas.itemconfigure('fundo', state=visivel if com_dados else oculto)
+        self.canvas.itemconfigure('dados', state=visivel if com_dados else oculto)
+        self.canvas.itemconfigure(self._vazio, state=oculto if com_dados else visivel)
+
+    def _pontos_suavizados(self):
+        """Média móvel de 3 amostras convertida em coordenadas (x, y)"""
+        valores = self.valores
+        n = len(valores)
+        mx, my = self.MARGEM_X, self.MARGEM_Y
+        largura_grafico, altura_grafico = self._area_util()
+        passo = largura_grafico / (n - 1)
+        base = my + altura_grafico
+        escala = altura_grafico / 100
+
+        coordenadas = []
+        for i in range(n):
+            inicio = max(0, i - 1)
+            fim = min(n, i + 2)
+            media = sum(valores[inicio:fim]) / (fim - inicio)
+            coordenadas.append(mx + i * passo)
+            coordenadas.append(base - media * escala)
+        return coordenadas
+
+    def _posicionar_dados(self):
+        if len(self.valores) < 2:
+            self._mostrar(False)
+            return
+        self._mostrar(True)
+        if self._largura <= 1 or self._altura <= 1:
+            return
+
+        c = self.canvas
+        coordenadas = self._pontos_suavizados()
+        _, altura_grafico = self._area_util()
+        base = self.MARGEM_Y + altura_grafico
+
+        # Área sob a curva: três camadas deslocadas para simular profundidade
+        contorno = coordenadas + [coordenadas[-2], base, coordenadas[0], base]
+        for i, area in enumerate(self._areas):
+            deslocamento = i * 2
+            c.coords(area, *[v + deslocamento if j % 2 else v for j, v in enumerate(contorno)])
+
+        # Uma única polilinha para a linha e outra para a sombra
+        c.coords(self._sombra, *[v + 1 for v in coordenadas])
+        c.coords(self._linha, *coordenadas)
+
+        # Pontos de destaque nos extremos
+        for (externo, interno), (x, y) in zip(self._pontos, [coordenadas[:2], coordenadas[-2:]]):
+            c.coords(externo, x - 6, y - 6, x + 6, y + 6)
+            c.coords(interno, x - 3, y - 3, x + 3, y + 3)
+
+        c.itemconfigure(self._valor_atual, text=f"{self.valores[-1]:.1f}%")
+
+    def atualizar(self, valores=None):
+        """
+        Troca a série exibida (lista de porcentagens) e reposiciona os
+        itens; sem argumento, busca os valores na `fonte`
+        """
+        if valores is None and self.fonte is not None:
+            valores = self.fonte(self.pontos_visiveis())
+        self.valores = valores if valores is not None else []
+        self._posicionar_dados()
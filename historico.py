@@ -0,0 +1,281 @@
+import math
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+
+class BufferCircular:
+    """
+    Série temporal de capacidade fixa guardada em array('d')
+
+    Cada linha tem um momento e `canais` valores (ex.: um canal por
+    núcleo da CPU), todos no mesmo array contínuo. Inserir é O(1) e
+    não aloca memória; as janelas são memoryviews sobre os arrays
+    (sem cópia). Quando enche, as amostras mais antigas são sobrescritas
+    """
+
+    def __init__(self, capacidade, canais=1):
+        self.capacidade = capacidade
+        self.canais = canais
+        self._momentos = array('d', bytes(8 * capacidade))
+        self._valores = array('d', bytes(8 * capacidade * canais))
+        self._pos = 0
+        self._tamanho = 0
+
+    def __len__(self):
+        return self._tamanho
+
+    def adicionar(self, momento, valores):
+        """
+        Adiciona uma linha; `valores` é um número (1 canal) ou uma
+        sequência com um valor por canal
+        """
+        pos = self._pos
+        self._momentos[pos] = momento
+        if self.canais == 1:
+            self._valores[pos] = valores
+        else:
+            inicio = pos * self.canais
+            if not isinstance(valores, array):
+                valores = array('d', valores)
+            self._valores[inicio:inicio + self.canais] = valores
+        self._pos = (pos + 1) % self.capacidade
+        if self._tamanho < self.capacidade:
+            self._tamanho += 1
+
+    def _trechos(self, n):
+        """Intervalos de linhas [a, b) das últimas n amostras, em ordem cronológica"""
+        n = self._tamanho if n is None else min(n, self._tamanho)
+        if n <= 0:
+            return []
+        pos = self._pos
+        if n <= pos:
+            return [(pos - n, pos)]
+        return [(self.capacidade - (n - pos), self.capacidade), (0, pos)]
+
+    def janela(self, n=None, canal=0):
+        """
+        Últimas n amostras de um canal como lista de memoryviews
+        (um ou dois trechos, quando a janela dá a volta no buffer)
+        """
+        visao = memoryview(self._valores)
+        c = self.canais
+        return [visao[a * c + canal:b * c:c] for a, b in self._trechos(n)]
+
+    def janela_momentos(self, n=None):
+        """Momentos das últimas n amostras (mesmo formato de janela)"""
+        visao = memoryview(self._momentos)
+        return [visao[a:b] for a, b in self._trechos(n)]
+
+    def faixa(self, inicio, fim=None, canal=0):
+        """Valores de um canal com momento entre inicio e fim (lista)"""
+        resultado = []
+        momentos = memoryview(self._momentos)
+        valores = memoryview(self._valores)
+        c = self.canais
+        for a, b in self._trechos(None):
+            trecho = momentos[a:b]
+            i = bisect_left(trecho, inicio)
+            j = len(trecho) if fim is None else bisect_right(trecho, fim)
+            if i < j:
+                resultado.extend(valores[(a + i) * c + canal:(a + j) * c:c])
+        return resultado
+
+    def primeiro_momento(self):
+        """Momento da amostra mais antiga (None se vazio)"""
+        if not self._tamanho:
+            return None
+        return self._momentos[(self._pos - self._tamanho) % self.capacidade]
+
+    def ultimo_momento(self):
+        """Momento da amostra mais recente (None se vazio)"""
+        if not self._tamanho:
+            return None
+        return self._momentos[(self._pos - 1) % self.capacidade]
+
+    def ultimos(self, n=None, canal=0):
+        """Últimas n amostras de um canal copiadas para uma lista"""
+        resultado = []
+        for trecho in self.janela(n, canal):
+            resultado.extend(trecho)
+        return resultado
+
+    def ultimo(self, canal=0):
+        """Amostra mais recente de um canal (None se vazio)"""
+        if not self._tamanho:
+            return None
+        return self._valores[((self._pos - 1) % self.capacidade) * self.canais + canal]
+
+    def tamanho_bytes(self):
+        """Memória ocupada pelos arrays"""
+        return (len(self._momentos) + len(self._valores)) * 8
+
+def decimar_min_max(minimos, maximos, pontos, medias=None):
+    """
+    Reduz uma série a no máximo `pontos` valores mantendo picos e vales:
+    divide em pontos/2 grupos e emite o mínimo e o máximo de cada um,
+    na ordem em que aparecem. min/max/index rodam em C sobre as fatias
+    Se couber sem reduzir, devolve `medias` (agregados) ou os próprios valores
+    """
+    n = len(minimos)
+    if n <= pontos:
+        return list(medias if medias is not None else minimos)
+
+    grupos = max(1, pontos // 2)
+    resultado = []
+    for g in range(grupos):
+        a = g * n // grupos
+        b = (g + 1) * n // grupos
+        menor = min(minimos[a:b])
+        maior = max(maximos[a:b])
+        if minimos.index(menor, a, b) <= maximos.index(maior, a, b):
+            resultado.append(menor)
+            resultado.append(maior)
+        else:
+            resultado.append(maior)
+            resultado.append(menor)
+    return resultado
+
+class SerieMultiResolucao:
+    """
+    Série de um canal guardada em três resoluções:
+    - bruta: cada amostra (retenção retencao_s)
+    - 1 min e 15 min: mínimo, média e máximo de cada período
+
+    Os agregados são atualizados a cada amostra (sem reprocessar o
+    histórico). A leitura escolhe a resolução mais fina que cobre o
+    período pedido sem passar de poucos valores por pixel
+    """
+
+    # (duração do período em s, retenção padrão em s)
+    NIVEIS = ((60, 24 * 3600), (900, 30 * 24 * 3600))
+
+    # Valores lidos por ponto desenhado antes de trocar de resolução
+    FATOR_LEITURA = 8
+
+    def __init__(self, intervalo_s=1.0, retencao_s=3600, retencoes_agregados=None):
+        self.intervalo_s = intervalo_s
+        self.canais = 1
+        self.bruta = BufferCircular(max(2, math.ceil(retencao_s / intervalo_s)))
+        retencoes = retencoes_agregados or [retencao for _, retencao in self.NIVEIS]
+        # Por nível: [período, buffer (min, média, max), período atual, min, max, soma, contagem]
+        self.agregados = [
+            [periodo, BufferCircular(max(2, math.ceil(retencao / periodo)), canais=3),
+             None, 0.0, 0.0, 0.0, 0]
+            for (periodo, _), retencao in zip(self.NIVEIS, retencoes)
+        ]
+
+    def __len__(self):
+        return len(self.bruta)
+
+    def adicionar(self, momento, valor):
+        self.bruta.adicionar(momento, valor)
+        for nivel in self.agregados:
+            periodo = int(momento // nivel[0])
+            if periodo != nivel[2]:
+                if nivel[6]:
+                    # Fecha o período anterior
+                    nivel[1].adicionar(nivel[2] * nivel[0], (nivel[3], nivel[5] / nivel[6], nivel[4]))
+                nivel[2:] = [periodo, valor, valor, valor, 1]
+            else:
+                if valor < nivel[3]:
+                    nivel[3] = valor
+                if valor > nivel[4]:
+                    nivel[4] = valor
+                nivel[5] += valor
+                nivel[6] += 1
+
+    def ultimos(self, n=None, canal=0):
+        return self.bruta.ultimos(n)
+
+    def ultimo(self, canal=0):
+        return self.bruta.ultimo()
+
+    def tamanho_bytes(self):
+        return self.bruta.tamanho_bytes() + sum(nivel[1].tamanho_bytes() for nivel in self.agregados)
+
+    def ler(self, inicio, fim=None, pontos=300):
+        """
+        Valores entre inicio e fim reduzidos a no máximo `pontos`
+        (normalmente a largura do gráfico em pixels)
+        """
+        limite = fim if fim is not None else inicio + 1e12
+        # Sem fim (caso da interface) o período vai até a amostra mais recente
+        ate = fim if fim is not None else self.bruta.ultimo_momento()
+        if ate is None:
+            ate = time.time()
+        duracao = max(ate - inicio, 0)
+
+        # Resolução bruta: se não tem valores demais e cobre o período
+        # pelo menos tão bem quanto os agregados (ex.: logo após iniciar,
+        # quando os agregados só têm os mesmos poucos segundos)
+        primeiro = self.bruta.primeiro_momento()
+        if primeiro is not None:
+            esperado = max(ate - max(inicio, primeiro), 0) / self.intervalo_s
+            cobre = primeiro <= inicio + self.intervalo_s
+            if esperado <= self.FATOR_LEITURA * pontos and (cobre or not self._agregados_mais_antigos(primeiro)):
+                valores = self.bruta.faixa(inicio, fim)
+                return decimar_min_max(valores, valores, pontos)
+
+        escolhido = self.agregados[-1]
+        for nivel in self.agregados:
+            primeiro = nivel[1].primeiro_momento()
+            cobre = primeiro is not None and primeiro <= inicio + nivel[0]
+            if cobre and duracao / nivel[0] <= self.FATOR_LEITURA * pontos:
+                escolhido = nivel
+                break
+
+        periodo, buffer = escolhido[0], escolhido[1]
+        minimos = buffer.faixa(inicio, fim, canal=0)
+        medias = buffer.faixa(inicio, fim, canal=1)
+        maximos = buffer.faixa(inicio, fim, canal=2)
+        # Inclui o período ainda aberto
+        if escolhido[6] and escolhido[2] * periodo <= limite:
+            minimos.append(escolhido[3])
+            medias.append(escolhido[5] / escolhido[6])
+            maximos.append(escolhido[4])
+        return decimar_min_max(minimos, maximos, pontos, medias)
+
+    def _agregados_mais_antigos(self, momento):
+        """True se algum nível agregado tem um período inteiro antes de `momento`"""
+        for periodo, buffer, *_ in self.agregados:
+            primeiro = buffer.primeiro_momento()
+            if primeiro is not None and primeiro + periodo <= momento:
+                return True
+        return False
+
+class ArmazemMetricas:
+    """
+    Guarda o histórico de todas as métricas, uma BufferCircular por série
+
+    A capacidade de cada série é retencao_s / intervalo da série. Ex.:
+    1 h de amostras de 1 s para 128 núcleos ocupa cerca de 3,7 MB
+    """
+
+    def __init__(self, retencao_s=3600):
+        self.retencao_s = retencao_s
+        self.series = {}
+
+    def criar_serie(self, nome, intervalo_s=1.0, canais=1):
+        """
+        Cria (ou recria, se mudou o número de canais) uma série
+        Séries de um canal ganham agregados de 1 min e 15 min
+        """
+        serie = self.series.get(nome)
+        if serie is None or serie.canais != canais:
+            if canais == 1:
+                serie = SerieMultiResolucao(intervalo_s, self.retencao_s)
+            else:
+                capacidade = max(2, math.ceil(self.retencao_s / intervalo_s))
+                serie = BufferCircular(capacidade, canais)
+            self.series[nome] = serie
+        return serie
+
+    def serie(self, nome):
+        return self.series.get(nome)
+
+    def registrar(self, nome, momento, valores):
+        """Adiciona uma amostra a uma série já criada"""
+        self.series[nome].adicionar(momento, valores)
+
+    def tamanho_bytes(self):
+        return sum(serie.tamanho_bytes() for serie in self.series.values())
@@ -0,0 +1,219 @@
+"""
+Índice de busca sobre o nome e a linha de comando dos processos
+
+Atualizado a cada varredura só com a diferença: processos que
+apareceram entram, os que sumiram saem. A linha de comando é lida uma
+única vez por PID, dentro de um orçamento de tempo por atualização; os
+que ficarem para depois já podem ser achados pelo nome. Cada processo
+é identificado por (pid, criacao): um PID reutilizado (mesmo com o
+mesmo nome) ou que troca de nome (exec) é reindexado
+"""
+
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left, insort
+from operator import attrgetter
+
+import psutil
+
+_pid = attrgetter('pid')
+_nome = attrgetter('nome')
+_criacao = attrgetter('criacao')
+
+def ler_linha_de_comando(pid):
+    """
+    Linha de comando do processo como texto ("" para threads do kernel,
+    processos que já terminaram ou sem permissão)
+    """
+    if sys.platform.startswith("linux"):
+        # Leitura direta: evita criar um psutil.Process só para isso
+        try:
+            with open(os.path.join(psutil.PROCFS_PATH, str(pid), "cmdline"), "rb") as f:
+                conteudo = f.read()
+        except OSError:
+            return ""
+        return conteudo.rstrip(b"\0").replace(b"\0", b" ").decode(errors="replace")
+    try:
+        return " ".join(psutil.Process(pid).cmdline())
+    except (psutil.Error, OSError):
+        return ""
+
+class IndiceProcessos:
+    """
+    Busca por prefixo do nome e por trecho do nome ou da linha de comando
+
+    - prefixo: lista ordenada de (nome, pid), consultada com bisect
+    - trecho: um texto "nome\\0linha de comando" por processo, já em
+      minúsculas, percorrido com o operador `in` (em C)
+
+    `orcamento_s` limita o tempo gasto lendo linhas de comando em cada
+    atualizar(); o que não couber fica pendente para a próxima
+    """
+
+    def __init__(self, orcamento_s=0.05, ler_comando=ler_linha_de_comando):
+        self.orcamento_s = orcamento_s
+        self._ler_comando = ler_comando
+        self._indexados = {}  # (pid, criacao) -> nome indexado (exatamente o que está em _nomes)
+        self._textos = {}     # pid -> "nome\0linha de comando" (minúsculas)
+        self._comandos = {}   # pid -> linha de comando original
+        self._nomes = []      # (nome em minúsculas, pid), ordenada
+        self._pendentes = {}  # (pid, criacao) -> nome, ainda sem linha de comando (ordem de chegada)
+        self._lock = threading.Lock()
+
+    def atualizar(self, snapshot):
+        """
+        Aplica uma varredura (lista de RegistroProcesso)
+        Retorna quantos processos entraram e saíram do índice
+
+        A chave é (pid, criacao), como no rastreador de processos: um
+        PID reutilizado por outro processo sai e entra de novo, com a
+        linha de comando relida. O mesmo vale para um processo que
+        trocou de nome (exec)
+        """
+        # Montar e comparar os conjuntos fica todo em C
+        nomes = dict(zip(zip(map(_pid, snapshot), map(_criacao, snapshot)), map(_nome, snapshot)))
+        with self._lock:
+            anteriores = self._indexados
+            mudaram = [chave for chave, nome in nomes.items() if anteriores.get(chave, nome) != nome]
+            sairam = (anteriores.keys() - nomes.keys()).union(mudaram)
+            entraram = (nomes.keys() - anteriores.keys()).union(mudaram)
+            # Remove tudo antes de inserir: um PID reutilizado sai e entra na mesma varredura
+            for chave in sairam:
+                self._remover(chave, anteriores[chave])
+            self._indexados = nomes
+            novos = [(nomes[chave].lower(), chave[0]) for chave in entraram]
+            for nome, pid in novos:
+                self._textos[pid] = nome
+            if len(novos) > len(self._nomes):
+                # Muitos de uma vez (primeira varredura): reordena tudo
+                self._nomes.extend(novos)
+                self._nomes.sort()
+            else:
+                for item in novos:
+                    insort(self._nomes, item)
+            for chave in entraram:
+                self._pendentes[chave] = nomes[chave]
+        self._ler_pendentes()
+        return len(entraram), len(sairam)
+
+    def _remover(self, chave, nome):
+        """Tira do índice a entrada de `chave` (pid, criacao) inserida com `nome`"""
+        pid = chave[0]
+        self._textos.pop(pid, None)
+        self._comandos.pop(pid, None)
+        self._pendentes.pop(chave, None)
+        item = (nome.lower(), pid)
+        i = bisect_left(self._nomes, item)
+        if i < len(self._nomes) and self._nomes[i] == item:
+            del self._nomes[i]
+
+    def _ler_pendentes(self):
+        """Lê linhas de comando até esgotar o orçamento (fora do lock), mais novos primeiro"""
+        limite = time.perf_counter() + self.orcamento_s
+        while time.perf_counter() < limite:
+            with self._lock:
+                if not self._pendentes:
+                    return
+                chave, nome = self._pendentes.popitem()
+            pid = chave[0]
+            comando = self._ler_comando(pid)
+            with self._lock:
+                # O processo pode ter saído ou trocado de nome enquanto a linha era lida
+                if self._indexados.get(chave) == nome:
+                    self._comandos[pid] = comando
+                    self._textos[pid] = f"{nome}\0{comando}".lower()
+
+    def buscar_prefixo(self, prefixo):
+        """PIDs cujo nome começa com `prefixo`, em ordem alfabética"""
+        prefixo = prefixo.lower()
+        with self._lock:
+            nomes = self._nomes
+            i = bisect_left(nomes, (prefixo,))
+            pids = []
+            while i < len(nomes) and nomes[i][0].startswith(prefixo):
+                pids.append(nomes[i][1])
+                i += 1
+        return pids
+
+    def buscar_trecho(self, trecho):
+        """PIDs cujo nome ou linha de comando contém `trecho`"""
+        trecho = trecho.lower()
+        with self._lock:
+            return [pid for pid, texto in self._textos.items() if trecho in texto]
+
+    def buscar(self, texto):
+        """
+        Prefixo do nome primeiro, depois o restante dos que contêm o
+        texto no nome ou na linha de comando (sem repetir PIDs)
+        """
+        texto = texto.strip()
+        if not texto:
+            return []
+        pids = self.buscar_prefixo(texto)
+        vistos = set(pids)
+        pids.extend(pid for pid in self.buscar_trecho(texto) if pid not in vistos)
+        return pids
+
+    def linha_de_comando(self, pid):
+        """Linha de comando já lida do processo (None se ainda pendente)"""
+        with self._lock:
+            return self._comandos.get(pid)
+
+    @property
+    def pendentes(self):
+        return len(self._pendentes)
+
+    def __len__(self):
+        return len(self._textos)
+
+# Teste do módulo (só executa se rodar este arquivo diretamente)
+if __name__ == "__main__":
+    import random
+    from process_monitor import RegistroProcesso
+
+    gerador = random.Random(1)
+    programas = ["python3", "postgres", "nginx", "java", "bash", "sshd", "chrome", "node"]
+
+    comandos_novos = {}
+
+    def comando_falso(pid):
+        if pid in comandos_novos:
+            return comandos_novos[pid]
+        programa = programas[pid % len(programas)]
+        return f"/usr/bin/{programa} --worker {pid} --config /etc/{programa}/{pid % 97}.conf"
+
+    snapshot = [RegistroProcesso(pid, programas[pid % len(programas)], 0.0, 0.0, 0)
+                for pid in range(1, 20001)]
+    indice = IndiceProcessos(orcamento_s=1.0, ler_comando=comando_falso)
+    inicio = time.perf_counter()
+    indice.atualizar(snapshot)
+    print(f"Primeira varredura: {len(indice)} processos em {(time.perf_counter() - inicio) * 1000:.1f} ms")
+
+    # Próxima varredura: 100 saem, 100 entram
+    snapshot = snapshot[100:] + [RegistroProcesso(pid, "rogue", 0.0, 0.0, 0) for pid in range(30001, 30101)]
+    inicio = time.perf_counter()
+    entraram, sairam = indice.atualizar(snapshot)
+    print(f"Varredura seguinte: +{entraram} -{sairam} em {(time.perf_counter() - inicio) * 1000:.2f} ms")
+
+    # exec: o PID 500 deixa de ser "bash" e passa a ser "python3"; depois termina
+    snapshot = [r._replace(nome="python3") if r.pid == 500 else r for r in snapshot]
+    indice.atualizar(snapshot)
+    print(f"PID 500 após exec: python3 -> {500 in indice.buscar_prefixo('python3')}, "
+          f"bash -> {500 in indice.buscar_prefixo('bash')}")
+    indice.atualizar([r for r in snapshot if r.pid != 500])
+    print(f"PID 500 após sair: no índice -> {any(pid == 500 for _, pid in indice._nomes)}")
+
+    # PID 600 reutilizado por outro python3 (mesmo nome, outro create_time)
+    comandos_novos[600] = "python3 -m http.server 8000"
+    snapshot = [r._replace(criacao=1.0) if r.pid == 600 else r for r in snapshot]
+    indice.atualizar(snapshot)
+    print(f"PID 600 reutilizado: {indice.linha_de_comando(600)!r}, "
+          f"busca 'http.server' -> {indice.buscar_trecho('http.server')}, "
+          f"busca '--worker 600 ' -> {indice.buscar_trecho('--worker 600 ')}")
+
+    for consulta in ("pos", "rogue", "--worker 1234", "/etc/nginx/5.conf"):
+        inicio = time.perf_counter()
+        pids = indice.buscar(consulta)
+        print(f"{consulta!r}: {len(pids)} resultados em {(time.perf_counter() - inicio) * 1000:.2f} ms")
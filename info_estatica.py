@@ -0,0 +1,109 @@
+import json
+import os
+import sys
+import threading
+
+import psutil
+
+# Versão do formato do arquivo de cache
+VERSAO_CACHE = 1
+
+def caminho_cache():
+    """Retorna o caminho do arquivo de cache dos dados estáticos"""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "monitor-hardware", "dados_estaticos.json")
+
+def _coletar_tipo_ram():
+    """Usa a fonte mais barata disponível para o tipo de RAM"""
+    if sys.platform == "linux":
+        from ram_monitor import obter_tipo_ram_dmi
+        return obter_tipo_ram_dmi()
+    if sys.platform == "win32":
+        from ram_monitor import obter_tipo_ram
+        return obter_tipo_ram()
+    return "Desconhecida"
+
+def coletar_dados_estaticos():
+    """
+    Sonda o hardware (operação lenta, feita só quando não há cache)
+    Retorna um dicionário com:
+    - tipo_ram: tecnologia da RAM (DDR4, DDR5...)
+    - cpu_modelo: nome do processador
+    - cpu_cores: quantidade de núcleos lógicos
+    - ram_total_gb: total de RAM em GB
+    - gpu_nomes: lista com o nome de cada GPU
+    - vram_total_mb: soma da memória das GPUs em MB
+    """
+    from cpu_monitor import obter_modelo_cpu
+    from gpu_monitor import obter_info_gpus
+
+    gpus = obter_info_gpus()
+    return {
+        'tipo_ram': _coletar_tipo_ram(),
+        'cpu_modelo': obter_modelo_cpu(),
+        'cpu_cores': psutil.cpu_count(),
+        'ram_total_gb': round(psutil.virtual_memory().total / (1024**3), 1),
+        'gpu_nomes': [gpu['nome'] for gpu in gpus],
+        'vram_total_mb': sum(gpu['memoria_total_mb'] for gpu in gpus)
+    }
+
+def _ler_cache(caminho, boot_time):
+    try:
+        with open(caminho, encoding="utf-8") as f:
+            conteudo = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(conteudo, dict) or conteudo.get('versao') != VERSAO_CACHE:
+        return None
+    # boot_time pode variar um pouco entre leituras no Linux
+    if abs(conteudo.get('boot_time', 0) - boot_time) > 2:
+        return None
+    dados = conteudo.get('dados')
+    return dados if isinstance(dados, dict) else None
+
+def _gravar_cache(caminho, boot_time, dados):
+    try:
+        os.makedirs(os.path.dirname(caminho), exist_ok=True)
+        temporario = f"{caminho}.{os.getpid()}.tmp"
+        with open(temporario, "w", encoding="utf-8") as f:
+            json.dump({'versao': VERSAO_CACHE, 'boot_time': boot_time, 'dados': dados}, f)
+        # Troca atômica: nunca deixa um cache pela metade
+        os.replace(temporario, caminho)
+    except OSError:
+        pass
+
+_dados = None
+_lock = threading.Lock()
+
+def obter_dados_estaticos(recarregar=False):
+    """
+    Retorna os dados de hardware que não mudam até o próximo boot
+
+    Na primeira chamada tenta o cache em disco (válido enquanto o
+    boot_time for o mesmo); se não houver, sonda o hardware e grava
+    o cache. As chamadas seguintes respondem direto da memória
+    """
+    global _dados
+    with _lock:
+        if _dados is not None and not recarregar:
+            return _dados
+
+        caminho = caminho_cache()
+        boot_time = psutil.boot_time()
+        dados = None if recarregar else _ler_cache(caminho, boot_time)
+        if dados is None:
+            dados = coletar_dados_estaticos()
+            _gravar_cache(caminho, boot_time, dados)
+        _dados = dados
+        return _dados
+
+# Teste da função (só executa se rodar este arquivo diretamente)
+if __name__ == "__main__":
+    dados = obter_dados_estaticos()
+    print("=== DADOS ESTÁTICOS DO HARDWARE ===")
+    for chave, valor in dados.items():
+        print(f"{chave}: {valor}")
+    print(f"\nCache: {caminho_cache()}")
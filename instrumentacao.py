@@ -0,0 +1,136 @@
+"""
+Instrumentação do próprio monitor
+
+Guarda, para cada etapa (coletor, publicação, desenho de cada tela),
+o tempo de relógio e o tempo de CPU das últimas execuções, e mede o
+consumo de CPU e memória do processo do monitor. Serve para ver o
+custo de observar o sistema e qual etapa é cara
+"""
+
+import threading
+import time
+from collections import deque, namedtuple
+from contextlib import contextmanager
+
+import psutil
+
+from amostras import AmostraMonitor
+
+# Resumo de uma etapa (tempos em ms) nas últimas `n` execuções
+ResumoEtapa = namedtuple('ResumoEtapa', ['n', 'parede_p50', 'parede_p99', 'cpu_p50', 'cpu_p99'])
+
+def _percentil(ordenados, p):
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * p / 100))]
+
+class Instrumentacao:
+    """
+    Janela móvel das últimas `janela` execuções de cada etapa
+    Registrar é O(1); os percentis só são calculados em resumo()
+    """
+
+    def __init__(self, janela=300):
+        self.janela = janela
+        self._etapas = {}
+        self._lock = threading.Lock()
+
+    def registrar(self, etapa, parede_s, cpu_s):
+        """Guarda uma execução (tempos em segundos)"""
+        with self._lock:
+            historico = self._etapas.get(etapa)
+            if historico is None:
+                historico = self._etapas[etapa] = deque(maxlen=self.janela)
+            historico.append((parede_s, cpu_s))
+
+    @contextmanager
+    def medir(self, etapa):
+        """
+        Mede o bloco com o relógio e com o tempo de CPU da thread atual
+        (time.thread_time: não conta o trabalho de outras threads)
+        """
+        inicio = time.perf_counter()
+        inicio_cpu = time.thread_time()
+        try:
+            yield
+        finally:
+            self.registrar(etapa, time.perf_counter() - inicio, time.thread_time() - inicio_cpu)
+
+    def resumo(self):
+        """Dicionário etapa -> ResumoEtapa, em ordem alfabética"""
+        with self._lock:
+            copias = {etapa: list(historico) for etapa, historico in self._etapas.items()}
+        resumo = {}
+        for etapa in sorted(copias):
+            execucoes = copias[etapa]
+            parede = sorted(p for p, _ in execucoes)
+            cpu = sorted(c for _, c in execucoes)
+            resumo[etapa] = ResumoEtapa(
+                len(execucoes),
+                _percentil(parede, 50) * 1000, _percentil(parede, 99) * 1000,
+                _percentil(cpu, 50) * 1000, _percentil(cpu, 99) * 1000)
+        return resumo
+
+class AmostradorProprio:
+    """CPU% do processo do monitor entre duas leituras e memória residente"""
+
+    def __init__(self):
+        self._processo = psutil.Process()
+        self._lock = threading.Lock()
+        self._anterior = (time.monotonic(), self._tempo_cpu())
+
+    def _tempo_cpu(self):
+        tempos = self._processo.cpu_times()
+        return tempos.user + tempos.system
+
+    def amostrar(self):
+        with self._processo.oneshot():
+            agora = time.monotonic()
+            tempo_cpu = self._tempo_cpu()
+            rss = self._processo.memory_info().rss
+            threads = self._processo.num_threads()
+        with self._lock:
+            (momento_anterior, cpu_anterior), self._anterior = self._anterior, (agora, tempo_cpu)
+        decorrido = agora - momento_anterior
+        cpu_percent = (tempo_cpu - cpu_anterior) / decorrido * 100 if decorrido > 0 else 0.0
+        return AmostraMonitor(cpu_percent, rss, threads)
+
+_instrumentacao = Instrumentacao()
+_amostrador_proprio = None
+
+def registrar_etapa(etapa, parede_s, cpu_s):
+    """Registra uma execução na instrumentação global"""
+    _instrumentacao.registrar(etapa, parede_s, cpu_s)
+
+def medir_etapa(etapa):
+    """Context manager que mede um bloco na instrumentação global"""
+    return _instrumentacao.medir(etapa)
+
+def resumo_etapas():
+    """p50/p99 de cada etapa registrada (ms)"""
+    return _instrumentacao.resumo()
+
+def amostrar_monitor():
+    """
+    Coleta o consumo do próprio monitor
+    Retorna uma AmostraMonitor (CPU desde a chamada anterior)
+    """
+    global _amostrador_proprio
+    try:
+        if _amostrador_proprio is None:
+            _amostrador_proprio = AmostradorProprio()
+        return _amostrador_proprio.amostrar()
+    except Exception as e:
+        print(f"Erro ao medir o próprio monitor: {e}")
+        return AmostraMonitor.indisponivel()
+
+# Teste do módulo (só executa se rodar este arquivo diretamente)
+if __name__ == "__main__":
+    amostrar_monitor()
+    for _ in range(50):
+        with medir_etapa("soma"):
+            sum(range(100000))
+        with medir_etapa("espera"):
+            time.sleep(0.001)
+    for etapa, r in resumo_etapas().items():
+        print(f"{etapa:<8} n={r.n} parede p50={r.parede_p50:.2f} p99={r.parede_p99:.2f} ms  "
+              f"cpu p50={r.cpu_p50:.2f} p99={r.cpu_p99:.2f} ms")
+    print(amostrar_monitor())
@@ -1,6 +1,8 @@
 import tkinter as tk
 from tkinter import ttk, font
 import threading
+import queue
+import weakref
 import time
 from datetime import datetime
 import os
@@ -8,13 +10,40 @@ import platform
 import psutil
 
 # Importa nossos módulos de monitoramento
-from cpu_monitor import obter_uso_cpu, obter_frequencia_cpu, obter_modelo_cpu
-from ram_monitor import obter_uso_ram, obter_swap
-from gpu_monitor import obter_uso_gpu
-from process_monitor import obter_processos_top, obter_processos_memoria
+from amostras import GB
+from info_estatica import obter_dados_estaticos
+from coletores import ExecutorColetores, AgendadorColetores, SERIES_HISTORICO, novas_amostras
+from grafico import GraficoHistorico
+from tabela_processos import ModeloTabelaProcessos, TabelaVirtual
+from process_monitor import ultimo_snapshot_processos, buscar_processos
+from historico import ArmazemMetricas
+from instrumentacao import medir_etapa, resumo_etapas, registrar_etapa
+
+# Gráficos de histórico exibidos em cada tela
+GRAFICOS_POR_TELA = {
+    'cpu': ['cpu'],
+    'gpu': ['gpu'],
+    'ram': ['ram', 'swap'],
+}
 
 class MonitorHardware:
-    def __init__(self):
+    def __init__(self, intervalos=None, retencao_s=3600, janela_grafico_s=120,
+                 arquivo_historico=None, historico_em_disco=True, exportador=None, inicio=None):
+        """
+        intervalos: dicionário opcional nome do coletor -> segundos
+        (ex.: {'cpu': 0.5, 'processos': 5}) para trocar os intervalos padrão
+        retencao_s: quanto tempo de histórico bruto manter em memória
+        janela_grafico_s: período exibido nos gráficos de histórico
+        arquivo_historico: caminho do histórico em disco (padrão em persistencia.py)
+        historico_em_disco: False desliga a gravação do histórico
+        exportador: ExportadorPrometheus já iniciado que recebe cada snapshot
+        inicio: time.perf_counter() do início do programa, para medir o
+        tempo até o primeiro quadro e os primeiros dados (padrão: agora)
+        """
+        self.inicio = inicio if inicio is not None else time.perf_counter()
+        self._tempo_primeiro_quadro = None
+        self._tempo_primeiros_dados = None
+        
         # Cria a janela principal
         self.root = tk.Tk()
         self.root.title("Monitor de Hardware")
@@ -35,19 +64,54 @@ class MonitorHardware:
         
         self.botoes_nav = {}  # <-- Mova esta linha para cá, antes de criar a interface
         
-        # Coleta e salva dados estáticos só uma vez
-        self.dados_estaticos = {}
-        self.dados_estaticos['tipo_ram'] = obter_uso_ram()['tipo_ram']
-        self.dados_estaticos['cpu_modelo'] = obter_modelo_cpu()
-        self.dados_estaticos['cpu_cores'] = psutil.cpu_count()
-        
-        # Cria a interface
+        # Dados estáticos chegam da sondagem em segundo plano (ver _sondar_estaticos);
+        # até lá as telas mostram "Detectando..."
+        self.dados_estaticos = None
+        
+        # Coletores rodam em paralelo, cada um com seu prazo e intervalo
+        self.executor_coletores = ExecutorColetores()
+        self.agendador = AgendadorColetores(self.executor_coletores, intervalos, espera_inicial=0.1)
+        self.frequencia_cpu = None
+        
+        # As threads de segundo plano só publicam mensagens (tipo, dados)
+        # nesta fila; quem mexe nos widgets é sempre a thread do Tk (ver drenar_fila)
+        self.fila_resultados = queue.Queue()
+        # Último valor aplicado em cada widget (evita config() repetido)
+        self._estado_widgets = weakref.WeakKeyDictionary()
+        # Por tela: momento da última coleta já desenhada de cada coletor
+        self._momentos_renderizados = {}
+        # Resultados mais recentes (desenhados ao trocar de tela)
+        self._ultimos_resultados = None
+        # Histórico de todas as métricas em buffers circulares
+        self.metricas = ArmazemMetricas(retencao_s)
+        for nome, (coletor, _) in SERIES_HISTORICO.items():
+            if nome != 'cpu_cores':  # criada na 1ª amostra (depende do nº de núcleos)
+                self.metricas.criar_serie(nome, self.agendador.intervalos[coletor])
+        self._momentos_historico = {}
+        self.janela_grafico_s = janela_grafico_s
+        self._graficos_desatualizados = set()
+        
+        self.exportador = exportador
+        
+        # Histórico em disco: aberto pela thread de coleta antes da 1ª coleta
+        self.historico_disco = None
+        self._arquivo_historico = arquivo_historico
+        self._historico_em_disco = historico_em_disco
+        self.retencao_s = retencao_s
+        
+        # Cria a interface (só widgets, nenhuma sondagem)
         self.criar_interface()
-        
-        # Inicia o thread de atualização dos dados
-        self.thread_atualizacao = threading.Thread(target=self.loop_atualizacao)
+        self.root.bind('<Map>', self._ao_mostrar_janela, add='+')
+        
+        # Sondagens lentas e coleta rodam em segundo plano: a janela
+        # aparece já com os textos provisórios
+        self.thread_estaticos = threading.Thread(target=self._sondar_estaticos, name="sondagem-inicial")
+        self.thread_estaticos.daemon = True
+        self.thread_estaticos.start()
+        self.thread_atualizacao = threading.Thread(target=self.loop_atualizacao, name="agendador")
         self.thread_atualizacao.daemon = True
         self.thread_atualizacao.start()
+        self.root.after(20, self.drenar_fila)
     
     def criar_interface(self):
         """Cria a interface principal com barra lateral"""
@@ -125,6 +189,8 @@ class MonitorHardware:
         criar_botao(sidebar, "CPU", "🖥️", "cpu")
         criar_botao(sidebar, "GPU", "🎮", "gpu")
         criar_botao(sidebar, "RAM", "💾", "ram")
+        criar_botao(sidebar, "Processos", "📋", "processos")
+        criar_botao(sidebar, "Diagnóstico", "🩺", "diagnostico")
 
         # Espaçador
         tk.Frame(sidebar, bg='#18181b', height=20).pack()
@@ -149,12 +215,20 @@ class MonitorHardware:
         
         # Dicionário para armazenar as telas
         self.telas = {}
+        # Gráficos de histórico por coletor (preenchido pelas telas)
+        self.graficos = {}
         
         # Cria cada tela
         self.telas['overview'] = self.criar_tela_overview()
         self.telas['cpu'] = self.criar_tela_cpu()
         self.telas['gpu'] = self.criar_tela_gpu()
         self.telas['ram'] = self.criar_tela_ram()
+        self.telas['processos'] = self.criar_tela_processos()
+        self.telas['diagnostico'] = self.criar_tela_diagnostico()
+        
+        # Cada gráfico busca no histórico só os pontos que cabem na largura
+        for nome, grafico in self.graficos.items():
+            grafico.fonte = lambda pontos, nome=nome: self.valores_grafico(nome, pontos)
     
     def criar_tela_overview(self):
         """Cria a tela de visão geral"""
@@ -186,14 +260,12 @@ class MonitorHardware:
         horas, resto = divmod(uptime, 3600)
         minutos, segundos = divmod(resto, 60)
         uptime_str = f"{horas}h {minutos}m"
-        # Usuário
-        usuario = os.getlogin() if hasattr(os, "getlogin") else "Usuário"
-        # Processos ativos
-        n_proc = len(psutil.pids())
-        # Labels
+        # Labels (usuário e processos vêm da sondagem em segundo plano)
         tk.Label(info_frame, text=f"⏱️ Uptime: {uptime_str}", bg='#23232b', fg='#f3f3f3', font=self.fonte_pequena).pack(side='left', padx=12, pady=6)
-        tk.Label(info_frame, text=f"👤 Usuário: {usuario}", bg='#23232b', fg='#f3f3f3', font=self.fonte_pequena).pack(side='left', padx=12, pady=6)
-        tk.Label(info_frame, text=f"⚙️ Processos: {n_proc}", bg='#23232b', fg='#f3f3f3', font=self.fonte_pequena).pack(side='left', padx=12, pady=6)
+        self.label_usuario = tk.Label(info_frame, text="👤 Usuário: ...", bg='#23232b', fg='#f3f3f3', font=self.fonte_pequena)
+        self.label_usuario.pack(side='left', padx=12, pady=6)
+        self.label_n_processos = tk.Label(info_frame, text="⚙️ Processos: ...", bg='#23232b', fg='#f3f3f3', font=self.fonte_pequena)
+        self.label_n_processos.pack(side='left', padx=12, pady=6)
 
         # Tabela de processos
         proc_frame = tk.LabelFrame(frame, text="Processos com Maior Consumo", bg='#23232b', fg='#4a9eff', font=self.fonte_subtitulo)
@@ -209,6 +281,10 @@ class MonitorHardware:
         # Container para linhas dos processos
         self.proc_table_container = tk.Frame(proc_frame, bg='#23232b')
         self.proc_table_container.pack(fill='both', expand=True, padx=10, pady=(0, 10))
+        
+        # Linhas da tabela criadas sob demanda e reaproveitadas
+        self.linhas_proc = []
+        self._linhas_proc_visiveis = 0
 
         return frame
     
@@ -242,14 +318,14 @@ class MonitorHardware:
         card_modelo = tk.Frame(cards_frame, bg='#23232b', relief='ridge', bd=1)
         card_modelo.pack(side='left', fill='both', expand=True, padx=(0, 8), pady=5)
         tk.Label(card_modelo, text="Modelo", bg='#23232b', fg='#94a3b8', font=self.fonte_pequena).pack(pady=(10, 0))
-        self.label_cpu_modelo = tk.Label(card_modelo, text=f"{self.dados_estaticos['cpu_modelo']}", bg='#23232b', fg='#4a9eff', font=("Arial", 14, "bold"), wraplength=180, justify='center')
+        self.label_cpu_modelo = tk.Label(card_modelo, text="Detectando...", bg='#23232b', fg='#4a9eff', font=("Arial", 14, "bold"), wraplength=180, justify='center')
         self.label_cpu_modelo.pack(pady=(2, 10))
         
         # Card Núcleos
         card_cores = tk.Frame(cards_frame, bg='#23232b', relief='ridge', bd=1)
         card_cores.pack(side='left', fill='both', expand=True, padx=8, pady=5)
         tk.Label(card_cores, text="Núcleos", bg='#23232b', fg='#94a3b8', font=self.fonte_pequena).pack(pady=(10, 0))
-        self.label_cpu_cores = tk.Label(card_cores, text=f"{self.dados_estaticos['cpu_cores']}", bg='#23232b', fg='#4eff4a', font=("Arial", 18, "bold"))
+        self.label_cpu_cores = tk.Label(card_cores, text="--", bg='#23232b', fg='#4eff4a', font=("Arial", 18, "bold"))
         self.label_cpu_cores.pack(pady=(2, 10))
         
         # Card Frequência
@@ -266,6 +342,10 @@ class MonitorHardware:
                                             bg='#1a1a1a', fg='#4a9eff', font=("Arial", 16, "bold"))
         self.label_cpu_uso_total.pack(anchor='center', pady=5)
         
+        # Histórico do uso total
+        self.graficos['cpu'] = GraficoHistorico(frame, altura=120)
+        self.graficos['cpu'].pack(fill='x', pady=(0, 10))
+        
         # Grade de uso por núcleo
         nucleos_frame = tk.LabelFrame(frame, text="Uso por Núcleo", 
                                      bg='#2a2a2a', fg='#4a9eff', 
@@ -363,12 +443,10 @@ class MonitorHardware:
         tk.Label(grafico_frame, text="Histórico de Uso", bg='#1a1a1a', fg='#ffffff', 
                  font=('Segoe UI', 12, 'bold')).pack(anchor='w', pady=(0, 10))
         
-        # Canvas para o gráfico
-        self.canvas_gpu = tk.Canvas(grafico_frame, bg='#0f0f0f', height=200)
-        self.canvas_gpu.pack(fill='both', expand=True)
-        
-        # Lista para armazenar histórico de uso
-        self.historico_gpu = []
+        # Gráfico incremental (itens do canvas criados uma única vez)
+        self.grafico_gpu = GraficoHistorico(grafico_frame)
+        self.grafico_gpu.pack(fill='both', expand=True)
+        self.graficos['gpu'] = self.grafico_gpu
         
         return frame
 
@@ -376,20 +454,20 @@ class MonitorHardware:
         """Atualiza os cards de métricas de forma simples"""
         
         if uso is not None:
-            self.label_gpu_uso_card.config(text=f"{uso:.1f}%")
+            self._atualizar_widget(self.label_gpu_uso_card, text=f"{uso:.1f}%")
             # Muda cor baseado no uso
             cor = "#ef4444" if uso > 80 else "#f59e0b" if uso > 50 else "#10b981"
-            self.label_gpu_uso_card.config(fg=cor)
+            self._atualizar_widget(self.label_gpu_uso_card, fg=cor)
         
         if memoria_usada is not None and memoria_total is not None:
             mem_gb = memoria_usada / 1024
-            self.label_gpu_mem_card.config(text=f"{mem_gb:.1f} GB")
+            self._atualizar_widget(self.label_gpu_mem_card, text=f"{mem_gb:.1f} GB")
         
         if temperatura is not None:
-            self.label_gpu_temp_card.config(text=f"{temperatura}°C")
+            self._atualizar_widget(self.label_gpu_temp_card, text=f"{temperatura:.0f}°C")
             # Muda cor baseado na temperatura
             cor = "#ef4444" if temperatura > 80 else "#f59e0b" if temperatura > 70 else "#10b981"
-            self.label_gpu_temp_card.config(fg=cor)
+            self._atualizar_widget(self.label_gpu_temp_card, fg=cor)
     
     def atualizar_cores_sidebar(self):
         for tela, (btn, lbl_icone, lbl_texto) in self.botoes_nav.items():
@@ -437,7 +515,7 @@ class MonitorHardware:
         card_tipo = tk.Frame(cards_frame, bg='#23232b', relief='ridge', bd=1)
         card_tipo.pack(side='left', fill='both', expand=True, padx=(8, 0), pady=5)
         tk.Label(card_tipo, text="Tipo", bg='#23232b', fg='#94a3b8', font=self.fonte_pequena).pack(pady=(10, 0))
-        self.label_ram_tipo = tk.Label(card_tipo, text=f"{self.dados_estaticos['tipo_ram']}", bg='#23232b', fg='#4a9eff', font=("Arial", 18, "bold"))
+        self.label_ram_tipo = tk.Label(card_tipo, text="Detectando...", bg='#23232b', fg='#4a9eff', font=("Arial", 18, "bold"))
         self.label_ram_tipo.pack(pady=(2, 10))
         
         # Porcentagem usada (destaque)
@@ -447,6 +525,12 @@ class MonitorHardware:
                                           bg='#1a1a1a', fg='#ff8c42', font=("Arial", 16, "bold"))
         self.label_ram_percent.pack(anchor='center', pady=5)
         
+        # Histórico da RAM
+        self.graficos['ram'] = GraficoHistorico(frame, altura=100, cor_linha='#ff8c42',
+                                                cores_area=('#ff8c42', '#fdba74', '#ffedd5'),
+                                                cor_destaque='#ffedd5')
+        self.graficos['ram'].pack(fill='x', pady=(0, 10))
+        
         # Frame do Swap
         swap_frame = tk.LabelFrame(frame, text="Memória Swap", 
                                  bg='#2a2a2a', fg='#4a9eff', 
@@ -460,6 +544,10 @@ class MonitorHardware:
                                       bg='#2a2a2a', fg='#ffffff', font=self.fonte_normal)
         self.label_swap_info.pack(anchor='w')
         
+        # Histórico do swap
+        self.graficos['swap'] = GraficoHistorico(self.swap_info_container, altura=70)
+        self.graficos['swap'].pack(fill='x', pady=(5, 0))
+        
         # Frame dos processos que mais usam RAM
         proc_ram_frame = tk.LabelFrame(frame, text="Processos que Mais Usam RAM", 
                                      bg='#2a2a2a', fg='#4a9eff', 
@@ -469,6 +557,60 @@ class MonitorHardware:
         self.listbox_ram_proc = tk.Listbox(proc_ram_frame, bg='#1a1a1a', fg='#ffffff',
                                          font=self.fonte_pequena, height=6)
         self.listbox_ram_proc.pack(fill='both', expand=True, padx=10, pady=5)
+        self._linhas_ram_proc = []
+        
+        return frame
+    
+    def criar_tela_processos(self):
+        """Cria a tela com todos os processos (tabela virtual, ordenável e com busca)"""
+        frame = tk.Frame(self.content_frame, bg='#1a1a1a')
+        
+        titulo = tk.Label(frame, text="Processos", 
+                         bg='#1a1a1a', fg='#ffffff', font=("Segoe UI", 20, "bold"))
+        titulo.pack(pady=(0, 20))
+        
+        # Filtro por nome e contagem
+        filtro_frame = tk.Frame(frame, bg='#1a1a1a')
+        filtro_frame.pack(fill='x', pady=(0, 10))
+        tk.Label(filtro_frame, text="🔍 Nome ou comando:", bg='#1a1a1a', fg='#94a3b8', font=self.fonte_normal).pack(side='left')
+        self.filtro_processos = tk.StringVar()
+        entrada = tk.Entry(filtro_frame, textvariable=self.filtro_processos, bg='#23232b', fg='#ffffff',
+                           insertbackground='#ffffff', relief='flat', font=self.fonte_normal)
+        entrada.pack(side='left', fill='x', expand=True, padx=10, ipady=3)
+        self.label_total_processos = tk.Label(filtro_frame, text="", bg='#1a1a1a', fg='#94a3b8', font=self.fonte_pequena)
+        self.label_total_processos.pack(side='right')
+        self.filtro_processos.trace_add('write', lambda *_: self._ao_filtrar_processos())
+        
+        # Só as linhas visíveis existem no canvas; clique no título ordena
+        self.modelo_processos = ModeloTabelaProcessos(buscar=buscar_processos)
+        self.tabela_processos = TabelaVirtual(frame, self.modelo_processos)
+        self.tabela_processos.pack(fill='both', expand=True)
+        
+        return frame
+    
+    def criar_tela_diagnostico(self):
+        """Cria a tela com o custo do próprio monitor (por coletor e por desenho)"""
+        frame = tk.Frame(self.content_frame, bg='#1a1a1a')
+        
+        titulo = tk.Label(frame, text="Diagnóstico do Monitor", 
+                         bg='#1a1a1a', fg='#ffffff', font=("Segoe UI", 20, "bold"))
+        titulo.pack(pady=(0, 20))
+        
+        self.label_monitor_consumo = tk.Label(frame, text="CPU: --%   Memória: -- MB   Threads: --",
+                                              bg='#1a1a1a', fg='#ff8c42', font=("Arial", 14, "bold"))
+        self.label_monitor_consumo.pack(anchor='center', pady=(0, 10))
+        
+        etapas_frame = tk.LabelFrame(frame, text="Tempo por Etapa (ms, últimas 300 execuções)", 
+                                     bg='#2a2a2a', fg='#4a9eff', 
+                                     font=self.fonte_subtitulo)
+        etapas_frame.pack(fill='both', expand=True, pady=5)
+        
+        tk.Label(etapas_frame, text=f"{'Etapa':<28}{'n':>5}{'p50':>9}{'p99':>9}{'CPU p50':>10}{'CPU p99':>10}",
+                 bg='#2a2a2a', fg='#4a9eff', font=("Courier", 10, "bold"), anchor='w').pack(fill='x', padx=10, pady=(5, 0))
+        self.listbox_etapas = tk.Listbox(etapas_frame, bg='#1a1a1a', fg='#ffffff',
+                                         font=("Courier", 10), height=16)
+        self.listbox_etapas.pack(fill='both', expand=True, padx=10, pady=5)
+        self._linhas_etapas = []
         
         return frame
     
@@ -491,67 +633,186 @@ class MonitorHardware:
                 btn.config(bg=cor)
                 lbl_icone.config(bg=cor)
                 lbl_texto.config(bg=cor)
+            
+            # A tela estava oculta: desenha já com os dados mais recentes
+            if self._ultimos_resultados is not None:
+                self.root.update_idletasks()
+                self.renderizar_tela(nome_tela)
+    
+    def _atualizar_widget(self, widget, **opcoes):
+        """Chama widget.config() só com as opções que mudaram desde a última vez"""
+        anteriores = self._estado_widgets.get(widget)
+        if anteriores is None:
+            anteriores = self._estado_widgets[widget] = {}
+        mudou = {chave: valor for chave, valor in opcoes.items() if anteriores.get(chave) != valor}
+        if mudou:
+            widget.config(**mudou)
+            anteriores.update(mudou)
     
-    def atualizar_dados(self):
-        """Atualiza todos os dados nas interfaces"""
+    def publicar_resultados(self, resultados):
+        """Chamado pela thread de coleta: só enfileira, não toca no Tk"""
+        self.fila_resultados.put(('resultados', resultados))
+        # A gravação em disco (em lotes) também fica nesta thread
+        if self.historico_disco is not None:
+            self.historico_disco.registrar_resultados(resultados)
+        # O texto do /metrics é gerado aqui, uma vez por snapshot
+        if self.exportador is not None:
+            self.exportador.publicar(resultados)
+    
+    def drenar_fila(self):
+        """
+        Roda na thread do Tk: aplica as mensagens na ordem em que
+        chegaram, mas desenha só o resultado mais recente
+        """
+        ultimo = None
+        try:
+            while True:
+                tipo, dados = self.fila_resultados.get_nowait()
+                if tipo == 'resultados':
+                    ultimo = dados
+                elif tipo == 'historico':
+                    self._aplicar_historico(dados)
+                elif tipo == 'estaticos':
+                    self._aplicar_estaticos(*dados)
+        except queue.Empty:
+            pass
+        if ultimo is not None:
+            try:
+                with medir_etapa("interface.atualizar_dados"):
+                    self.atualizar_dados(ultimo)
+            except Exception as e:
+                print(f"Erro ao desenhar: {e}")
+            if self._tempo_primeiros_dados is None:
+                self._tempo_primeiros_dados = time.perf_counter() - self.inicio
+                registrar_etapa("inicio.primeiros_dados", self._tempo_primeiros_dados, 0.0)
+                print(f"Primeiros dados em {self._tempo_primeiros_dados * 1000:.0f} ms")
+        if self.rodando:
+            self.root.after(100, self.drenar_fila)
+    
+    def atualizar_dados(self, resultados):
+        """
+        Recebe os resultados dos coletores: guarda os dados (inclusive
+        históricos) e desenha apenas a tela que está visível
+        """
+        self._ultimos_resultados = resultados
         
         # Atualiza hora
         agora = datetime.now().strftime("%H:%M:%S")
-        self.label_hora.config(text=agora)
-        
-        # Obtém dados de todos os componentes
-        dados_cpu = obter_uso_cpu()
-        dados_gpu = obter_uso_gpu()
-        dados_ram = obter_uso_ram()
-        dados_swap = obter_swap()
-        processos_cpu = obter_processos_top(8)
-        processos_ram = obter_processos_memoria(6)
-        
-        # Atualiza tela overview
-        self.atualizar_overview(dados_cpu, dados_gpu, dados_ram, processos_cpu)
+        self._atualizar_widget(self.label_hora, text=agora)
         
-        # Atualiza tela específica da CPU
-        self.atualizar_cpu_detalhada(dados_cpu)
+        # Os históricos crescem mesmo com a tela correspondente oculta
+        for nome, momento, valor in novas_amostras(resultados, self._momentos_historico):
+            if nome == 'cpu_cores':
+                coletor = SERIES_HISTORICO[nome][0]
+                self.metricas.criar_serie(nome, self.agendador.intervalos[coletor], len(valor))
+            self.metricas.registrar(nome, momento, valor)
+            self._graficos_desatualizados.add(nome)
         
-        # Atualiza tela específica da GPU
-        self.atualizar_gpu_detalhada(dados_gpu)
-        
-        # Atualiza tela específica da RAM
-        self.atualizar_ram_detalhada(dados_ram, dados_swap, processos_ram)
+        self.renderizar_tela(self.tela_atual)
+    
+    def _novos_para_tela(self, tela, resultados):
+        """Coletores com valor novo desde a última vez que `tela` foi desenhada"""
+        momentos = self._momentos_renderizados.setdefault(tela, {})
+        novos = {nome for nome, resultado in resultados.items()
+                 if resultado.momento != momentos.get(nome)}
+        for nome in novos:
+            momentos[nome] = resultados[nome].momento
+        return novos
+    
+    def renderizar_tela(self, tela):
+        """Desenha uma tela com os resultados mais recentes"""
+        resultados = self._ultimos_resultados
+        novos = self._novos_para_tela(tela, resultados)
+        
+        dados_cpu = resultados['cpu'].valor
+        dados_gpu = resultados['gpu'].valor
+        dados_ram = resultados['ram'].valor
+        dados_swap = resultados['swap'].valor
+        processos_cpu, processos_ram = resultados['processos'].valor
+        self.frequencia_cpu = resultados['frequencia'].valor
+        
+        with medir_etapa(f"interface.{tela}"):
+            if tela == "overview":
+                self.atualizar_overview(dados_cpu, dados_gpu, dados_ram, processos_cpu,
+                                        processos_novos='processos' in novos)
+            elif tela == "cpu":
+                self.atualizar_cpu_detalhada(dados_cpu)
+            elif tela == "gpu":
+                self.atualizar_gpu_detalhada(dados_gpu)
+            elif tela == "ram":
+                self.atualizar_ram_detalhada(dados_ram, dados_swap, processos_ram)
+            elif tela == "processos":
+                if 'processos' in novos:
+                    self.atualizar_tabela_processos()
+            elif tela == "diagnostico":
+                self.atualizar_diagnostico(resultados['monitor'].valor)
+        
+        # Gráficos da tela: só os que receberam amostra nova
+        for nome in GRAFICOS_POR_TELA.get(tela, ()):
+            if nome in self._graficos_desatualizados:
+                self._graficos_desatualizados.discard(nome)
+                with medir_etapa(f"interface.grafico_{nome}"):
+                    if nome == 'gpu':
+                        self.desenhar_grafico_gpu()
+                    else:
+                        self.graficos[nome].atualizar()
     
-    def atualizar_overview(self, cpu, gpu, ram, processos):
+    def atualizar_overview(self, cpu, gpu, ram, processos, processos_novos=True):
         """Atualiza a tela de visão geral"""
-        self.card_cpu.config(text=f"{cpu['uso_total']}%")
-        if gpu['disponivel']:
-            self.card_gpu.config(text=f"{gpu['uso_porcentagem']}%")
-        else:
-            self.card_gpu.config(text="N/A")
-        self.card_ram.config(text=f"{ram['porcentagem_usada']}%")
+        self._atualizar_widget(self.card_cpu, text=f"{cpu.uso_total:.1f}%" if cpu.disponivel else "N/A")
+        self._atualizar_widget(self.card_gpu, text=f"{gpu.uso_porcentagem:.1f}%" if gpu.disponivel else "N/A")
+        self._atualizar_widget(self.card_ram, text=f"{ram.porcentagem:.1f}%" if ram.disponivel else "N/A")
 
-        # Limpa tabela de processos
-        for widget in self.proc_table_container.winfo_children():
-            widget.destroy()
-        for proc in processos:
-            if proc['nome'].lower() in ["system idle process", "idle"]:
-                continue
-            memoria_mb = proc.get('memoria_bytes', 0) / (1024 * 1024) if 'memoria_bytes' in proc else proc.get('memoria_mb', 0)
+        # A tabela só é refeita quando chega uma nova lista de processos
+        if not processos_novos:
+            return
+
+        visiveis = [proc for proc in processos
+                    if proc.nome.lower() not in ["system idle process", "idle"]]
+
+        # As linhas são reaproveitadas: só o texto muda a cada atualização
+        for i, proc in enumerate(visiveis):
+            row, lbl_nome, lbl_cpu, lbl_mem = self._linha_processo(i)
+            memoria_mb = proc.memoria_bytes / (1024 * 1024)
+            self._atualizar_widget(lbl_nome, text=f"{proc.nome[:20]}")
+            self._atualizar_widget(lbl_cpu, text=f"{proc.cpu_percent:>5.1f}%")
+            self._atualizar_widget(lbl_mem, text=f"{memoria_mb:>7.1f} MB")
+            if i >= self._linhas_proc_visiveis:
+                row.pack(fill='x', pady=1)
+
+        # Esconde as linhas que sobraram (sem destruí-las)
+        for row, *_ in self.linhas_proc[len(visiveis):self._linhas_proc_visiveis]:
+            row.pack_forget()
+        self._linhas_proc_visiveis = len(visiveis)
+    
+    def _linha_processo(self, indice):
+        """Retorna a linha `indice` da tabela de processos, criando-a só na primeira vez"""
+        while len(self.linhas_proc) <= indice:
             row = tk.Frame(self.proc_table_container, bg='#23232b')
-            row.pack(fill='x', pady=1)
             # Ícone de processo + nome
             tk.Label(row, text="🔹", bg='#23232b', fg='#4a9eff', font=("Segoe UI Emoji", 10), width=2, anchor='w').pack(side='left')
-            tk.Label(row, text=f"{proc['nome'][:20]}", bg='#23232b', fg='#fff', font=self.fonte_pequena, width=20, anchor='w').pack(side='left')
-            tk.Label(row, text=f"{proc['cpu_percent']:>5.1f}%", bg='#23232b', fg='#ff8c42', font=self.fonte_pequena, width=8, anchor='e').pack(side='left')
-            tk.Label(row, text=f"{memoria_mb:>7.1f} MB", bg='#23232b', fg='#4eff4a', font=self.fonte_pequena, width=10, anchor='e').pack(side='left')
+            lbl_nome = tk.Label(row, text="", bg='#23232b', fg='#fff', font=self.fonte_pequena, width=20, anchor='w')
+            lbl_nome.pack(side='left')
+            lbl_cpu = tk.Label(row, text="", bg='#23232b', fg='#ff8c42', font=self.fonte_pequena, width=8, anchor='e')
+            lbl_cpu.pack(side='left')
+            lbl_mem = tk.Label(row, text="", bg='#23232b', fg='#4eff4a', font=self.fonte_pequena, width=10, anchor='e')
+            lbl_mem.pack(side='left')
+            self.linhas_proc.append((row, lbl_nome, lbl_cpu, lbl_mem))
+        return self.linhas_proc[indice]
     
     def atualizar_cpu_detalhada(self, dados):
         """Atualiza a tela detalhada da CPU"""
-        self.label_cpu_modelo.config(text=f"{self.dados_estaticos['cpu_modelo']}")
-        self.label_cpu_cores.config(text=f"{self.dados_estaticos['cpu_cores']}")
-        self.label_cpu_freq.config(text=f"{obter_frequencia_cpu()} MHz")
-        self.label_cpu_uso_total.config(text=f"Uso Total: {dados['uso_total']}%")
+        if self.frequencia_cpu is not None:
+            self._atualizar_widget(self.label_cpu_freq, text=f"{self.frequencia_cpu:.0f} MHz")
+        else:
+            self._atualizar_widget(self.label_cpu_freq, text="N/A")
+        if dados.disponivel:
+            self._atualizar_widget(self.label_cpu_uso_total, text=f"Uso Total: {dados.uso_total:.1f}%")
+        else:
+            self._atualizar_widget(self.label_cpu_uso_total, text="Uso Total: N/A")
         
         # Grade responsiva para núcleos
-        num_cores = dados['numero_cores']
+        num_cores = dados.numero_cores
         cores_por_linha = 4 if num_cores > 4 else num_cores
         if len(self.labels_cpu_cores) != num_cores:
             for widget in self.cpu_cores_container.winfo_children():
@@ -569,37 +830,32 @@ class MonitorHardware:
             for col in range(cores_por_linha):
                 self.cpu_cores_container.grid_columnconfigure(col, weight=1)
         for i, label in enumerate(self.labels_cpu_cores):
-            if i < len(dados['uso_por_core']):
-                uso = dados['uso_por_core'][i]
+            if i < num_cores:
+                uso = dados.uso_por_core[i]
                 cor = '#ff4444' if uso > 80 else '#ff8c42' if uso > 50 else '#4a9eff'
-                label.config(text=f"Core {i}: {uso}%", fg=cor)
+                self._atualizar_widget(label, text=f"Core {i}: {uso:.1f}%", fg=cor)
     
     def atualizar_gpu_detalhada(self, dados):
         """Atualiza a tela detalhada da GPU"""
-        if dados['disponivel']:
-            self.label_gpu_nome_det.config(text=f"Nome: {dados['nome']}")
-            self.label_gpu_uso_det.config(text=f"Uso: {dados['uso_porcentagem']}%")
-            self.label_gpu_memoria_det.config(text=f"Memória: {dados['memoria_usada_mb']} / {dados['memoria_total_mb']} MB")
-            self.label_gpu_temp.config(text=f"Temperatura: {dados['temperatura']}°C")
+        if dados.disponivel:
+            self._atualizar_widget(self.label_gpu_nome_det, text=f"Nome: {dados.nome}")
+            self._atualizar_widget(self.label_gpu_uso_det, text=f"Uso: {dados.uso_porcentagem:.1f}%")
+            self._atualizar_widget(self.label_gpu_memoria_det, text=f"Memória: {dados.memoria_usada_mb:.0f} / {dados.memoria_total_mb:.0f} MB")
+            self._atualizar_widget(self.label_gpu_temp, text=f"Temperatura: {dados.temperatura:.0f}°C")
 
             # Atualiza os CARDS principais
             self.atualizar_cards_gpu(
-                uso=dados['uso_porcentagem'],
-                memoria_usada=dados['memoria_usada_mb'],
-                memoria_total=dados['memoria_total_mb'],
-                temperatura=dados['temperatura']
+                uso=dados.uso_porcentagem,
+                memoria_usada=dados.memoria_usada_mb,
+                memoria_total=dados.memoria_total_mb,
+                temperatura=dados.temperatura
             )
 
-            # Atualiza histórico e gráfico
-            self.historico_gpu.append(dados['uso_porcentagem'])
-            if len(self.historico_gpu) > 50:  # Mantém apenas últimos 50 valores
-                self.historico_gpu.pop(0)
-            self.desenhar_grafico_gpu()
         else:
-            self.label_gpu_nome_det.config(text="Nome: GPU não detectada")
-            self.label_gpu_uso_det.config(text="Uso: N/A")
-            self.label_gpu_memoria_det.config(text="Memória: N/A")
-            self.label_gpu_temp.config(text="Temperatura: N/A")
+            self._atualizar_widget(self.label_gpu_nome_det, text="Nome: GPU não detectada")
+            self._atualizar_widget(self.label_gpu_uso_det, text="Uso: N/A")
+            self._atualizar_widget(self.label_gpu_memoria_det, text="Memória: N/A")
+            self._atualizar_widget(self.label_gpu_temp, text="Temperatura: N/A")
             # Zera os cards
             self.atualizar_cards_gpu(uso=0, memoria_usada=0, memoria_total=0, temperatura=0)
     
@@ -607,31 +863,128 @@ class MonitorHardware:
         """Atualiza a tela detalhada da RAM"""
         
         # Atualiza informações da RAM
-        self.label_ram_total.config(text=f"Total: {ram['total_gb']} GB")
-        self.label_ram_usada.config(text=f"Usada: {ram['usada_gb']} GB")
-        self.label_ram_livre.config(text=f"Livre: {ram['disponivel_gb']} GB")
-        self.label_ram_percent.config(text=f"Porcentagem: {ram['porcentagem_usada']}%")
+        if ram.disponivel:
+            self._atualizar_widget(self.label_ram_total, text=f"Total: {ram.total_bytes / GB:.1f} GB")
+            self._atualizar_widget(self.label_ram_usada, text=f"Usada: {ram.usada_bytes / GB:.1f} GB")
+            self._atualizar_widget(self.label_ram_livre, text=f"Livre: {ram.livre_bytes / GB:.1f} GB")
+            self._atualizar_widget(self.label_ram_percent, text=f"Porcentagem: {ram.porcentagem:.1f}%")
 
         # Atualiza informações do swap
-        self.label_swap_info.config(text=f"Swap: {swap['usada_gb']} / {swap['total_gb']} GB ({swap['porcentagem']}%)")
+        if swap.disponivel:
+            self._atualizar_widget(self.label_swap_info, text=f"Swap: {swap.usada_bytes / GB:.1f} / {swap.total_bytes / GB:.1f} GB ({swap.porcentagem:.1f}%)")
+        else:
+            self._atualizar_widget(self.label_swap_info, text="Swap: N/A")
         
-        # Atualiza lista de processos
-        self.listbox_ram_proc.delete(0, tk.END)
+        # Atualiza lista de processos (só se o texto mudou)
+        linhas = []
         for proc in processos:
             # Exibe RAM em MB
-            memoria_mb = proc.get('memoria_bytes', 0) / (1024 * 1024) if 'memoria_bytes' in proc else proc.get('memoria_mb', 0)
-            texto = f"{proc['nome'][:25]:<25} RAM: {memoria_mb:>6.1f} MB"
-            self.listbox_ram_proc.insert(tk.END, texto)
+            memoria_mb = proc.memoria_bytes / (1024 * 1024)
+            linhas.append(f"{proc.nome[:25]:<25} RAM: {memoria_mb:>6.1f} MB")
+        if linhas != self._linhas_ram_proc:
+            self.listbox_ram_proc.delete(0, tk.END)
+            self.listbox_ram_proc.insert(tk.END, *linhas)
+            self._linhas_ram_proc = linhas
     
-    def loop_atualizacao(self):
-        """Loop que roda em background atualizando os dados"""
-        while self.rodando:
+    def atualizar_tabela_processos(self):
+        """Carrega o último snapshot completo na tabela de processos"""
+        self.modelo_processos.atualizar(ultimo_snapshot_processos())
+        self.tabela_processos.desenhar()
+        self._atualizar_total_processos()
+    
+    def _ao_filtrar_processos(self):
+        self.modelo_processos.filtrar(self.filtro_processos.get())
+        self.tabela_processos.inicio = 0
+        self.tabela_processos.desenhar()
+        self._atualizar_total_processos()
+    
+    def _atualizar_total_processos(self):
+        modelo = self.modelo_processos
+        texto = f"{modelo.total} processos"
+        if modelo.filtro:
+            texto = f"{len(modelo.linhas)} de {texto}"
+        self._atualizar_widget(self.label_total_processos, text=texto)
+    
+    def atualizar_diagnostico(self, monitor):
+        """Atualiza a tela de diagnóstico (consumo do monitor e tempos por etapa)"""
+        if monitor.disponivel:
+            self._atualizar_widget(self.label_monitor_consumo,
+                                   text=f"CPU: {monitor.cpu_percent:.1f}%   "
+                                        f"Memória: {monitor.rss_bytes / (1024 * 1024):.1f} MB   "
+                                        f"Threads: {monitor.threads}")
+        
+        linhas = [f"{etapa:<28}{r.n:>5}{r.parede_p50:>9.2f}{r.parede_p99:>9.2f}{r.cpu_p50:>10.2f}{r.cpu_p99:>10.2f}"
+                  for etapa, r in resumo_etapas().items()]
+        if linhas != self._linhas_etapas:
+            self.listbox_etapas.delete(0, tk.END)
+            self.listbox_etapas.insert(tk.END, *linhas)
+            self._linhas_etapas = linhas
+    
+    def _ao_mostrar_janela(self, evento):
+        """Primeira vez que a janela aparece: registra o tempo até o primeiro quadro"""
+        if evento.widget is not self.root or self._tempo_primeiro_quadro is not None:
+            return
+        self._tempo_primeiro_quadro = time.perf_counter() - self.inicio
+        registrar_etapa("inicio.primeiro_quadro", self._tempo_primeiro_quadro, 0.0)
+        print(f"Primeiro quadro em {self._tempo_primeiro_quadro * 1000:.0f} ms")
+    
+    def _sondar_estaticos(self):
+        """
+        Roda em segundo plano: dados estáticos (cache ou sondagem lenta,
+        como wmic/wmi) e informações que só aparecem na visão geral
+        """
+        with medir_etapa("inicio.dados_estaticos"):
+            dados = obter_dados_estaticos()
+            try:
+                usuario = os.getlogin()
+            except (AttributeError, OSError):
+                usuario = os.environ.get("USER") or os.environ.get("USERNAME") or "Usuário"
+            n_processos = len(psutil.pids())
+        self.fila_resultados.put(('estaticos', (dados, usuario, n_processos)))
+    
+    def _aplicar_estaticos(self, dados, usuario, n_processos):
+        """Troca os textos provisórios pelos dados estáticos (thread do Tk)"""
+        self.dados_estaticos = dados
+        self._atualizar_widget(self.label_cpu_modelo, text=f"{dados['cpu_modelo']}")
+        self._atualizar_widget(self.label_cpu_cores, text=f"{dados['cpu_cores']}")
+        self._atualizar_widget(self.label_ram_tipo, text=f"{dados['tipo_ram']}")
+        self._atualizar_widget(self.label_usuario, text=f"👤 Usuário: {usuario}")
+        self._atualizar_widget(self.label_n_processos, text=f"⚙️ Processos: {n_processos}")
+    
+    def _abrir_historico_disco(self):
+        """
+        Roda na thread de coleta antes da 1ª coleta: abre o SQLite (o
+        import também fica fora do caminho da janela) e lê a última hora
+        """
+        if not self._historico_em_disco:
+            return
+        with medir_etapa("inicio.historico_disco"):
             try:
-                self.atualizar_dados()
-                time.sleep(2)  # Atualiza a cada 2 segundos
+                from persistencia import HistoricoEmDisco
+                historico = HistoricoEmDisco(self._arquivo_historico)
+                linhas = historico.ler_series(list(self.metricas.series), time.time() - self.retencao_s)
             except Exception as e:
-                print(f"Erro na atualização: {e}")
-                time.sleep(5)  # Espera mais tempo se der erro
+                print(f"Histórico em disco desativado: {e}")
+                return
+        self.historico_disco = historico
+        # Vai pela fila: as amostras antigas entram antes de qualquer coleta nova
+        self.fila_resultados.put(('historico', linhas))
+    
+    def _aplicar_historico(self, linhas):
+        """Carrega nas séries as amostras lidas do disco (thread do Tk)"""
+        for nome, amostras in linhas.items():
+            serie = self.metricas.serie(nome)
+            if serie is None or serie.canais != 1:
+                continue
+            for momento, valor in amostras:
+                serie.adicionar(momento, valor)
+            self._graficos_desatualizados.add(nome)
+    
+    def loop_atualizacao(self):
+        """Loop que roda em background: cada coletor no seu intervalo"""
+        self._abrir_historico_disco()
+        if self.rodando:
+            self.agendador.executar(self.publicar_resultados)
     
     def iniciar(self):
         """Inicia a aplicação"""
@@ -641,159 +994,25 @@ class MonitorHardware:
     def fechar_aplicacao(self):
         """Fecha a aplicação de forma segura"""
         self.rodando = False
+        self.agendador.parar()
+        self.executor_coletores.encerrar()
+        if self.historico_disco is not None:
+            self.historico_disco.fechar()
+        if self.exportador is not None:
+            self.exportador.parar()
         self.root.quit()
         self.root.destroy()
 
-    def desenhar_grafico_gpu(self):
-        """Desenha um gráfico moderno, minimalista e polido do uso da GPU"""
-        self.canvas_gpu.delete("all")
-
-        if len(self.historico_gpu) < 2:
-            self._desenhar_estado_vazio()
-            return
-
-        width = self.canvas_gpu.winfo_width()
-        height = self.canvas_gpu.winfo_height()
-
-        if width <= 1 or height <= 1:
-            return
-
-        # Margens para um visual mais limpo
-        margin_x = 20
-        margin_y = 15
-        chart_width = width - (2 * margin_x)
-        chart_height = height - (2 * margin_y)
-
-        # Fundo escuro sutil
-        self.canvas_gpu.create_rectangle(0, 0, width, height, fill='#18181b', outline='')
-
-        # Grid minimalista
-        self._desenhar_grid_moderno(margin_x, margin_y, chart_width, chart_height)
+    def valores_grafico(self, nome, pontos):
+        """Valores da janela do gráfico, no máximo `pontos` (um por pixel)"""
+        serie = self.metricas.serie(nome)
+        if serie is None:
+            return []
+        return serie.ler(time.time() - self.janela_grafico_s, None, pontos)
 
-        # Curva suavizada
-        pontos = self._calcular_pontos_suavizados(margin_x, margin_y, chart_width, chart_height)
-
-        # Área sob a curva com camadas de azul
-        self._desenhar_area_azul(pontos, margin_x, margin_y, chart_height)
-
-        # Linha principal com sombra
-        self._desenhar_linha_com_sombra(pontos)
-
-        # Pontos de destaque nos extremos
-        self._desenhar_pontos_destaque(pontos)
-
-        # Labels de valores
-        self._desenhar_labels_valores(margin_x, margin_y, chart_width, chart_height)
-
-    def _desenhar_estado_vazio(self):
-        width = self.canvas_gpu.winfo_width()
-        height = self.canvas_gpu.winfo_height()
-        self.canvas_gpu.create_text(
-            width//2, height//2,
-            text="Coletando dados...",
-            fill='#6b7280',
-            font=('Arial', 11),
-            anchor='center'
-        )
-
-    def _desenhar_grid_moderno(self, margin_x, margin_y, chart_width, chart_height):
-        # Linhas horizontais principais (0%, 50%, 100%)
-        for percent, cor in zip([0, 50, 100], ['#23232b', '#333', '#23232b']):
-            y = margin_y + chart_height - (percent / 100) * chart_height
-            self.canvas_gpu.create_line(
-                margin_x, y, margin_x + chart_width, y,
-                fill=cor, width=1
-            )
-        # Linhas verticais sutis
-        num_vertical_lines = 5
-        for i in range(1, num_vertical_lines):
-            x = margin_x + (chart_width / num_vertical_lines) * i
-            self.canvas_gpu.create_line(
-                x, margin_y, x, margin_y + chart_height,
-                fill='#23232b', width=1
-            )
-
-    def _calcular_pontos_suavizados(self, margin_x, margin_y, chart_width, chart_height):
-        pontos = []
-        dados_suavizados = []
-        window_size = min(3, len(self.historico_gpu))
-        for i in range(len(self.historico_gpu)):
-            start_idx = max(0, i - window_size // 2)
-            end_idx = min(len(self.historico_gpu), i + window_size // 2 + 1)
-            avg = sum(self.historico_gpu[start_idx:end_idx]) / (end_idx - start_idx)
-            dados_suavizados.append(avg)
-        for i, valor in enumerate(dados_suavizados):
-            x = margin_x + (i / (len(dados_suavizados) - 1)) * chart_width
-            y = margin_y + chart_height - (valor / 100) * chart_height
-            pontos.append((x, y))
-        return pontos
-
-    def _desenhar_area_azul(self, pontos, margin_x, margin_y, chart_height):
-        if len(pontos) < 2:
-            return
-        area_points = [(p[0], p[1]) for p in pontos]
-        area_points.append((pontos[-1][0], margin_y + chart_height))
-        area_points.append((pontos[0][0], margin_y + chart_height))
-        # Camadas de azul para simular profundidade
-        colors = ['#4a9eff', '#93c5fd', '#dbeafe']
-        for i, color in enumerate(colors):
-            offset = i * 2
-            adjusted_points = [(x, y + offset) for (x, y) in area_points]
-            flat_points = [coord for point in adjusted_points for coord in point]
-            self.canvas_gpu.create_polygon(flat_points, fill=color, outline='')
-
-    def _desenhar_linha_com_sombra(self, pontos):
-        if len(pontos) < 2:
-            return
-        # Sombra da linha (offset)
-        for i in range(len(pontos) - 1):
-            self.canvas_gpu.create_line(
-                pontos[i][0] + 1, pontos[i][1] + 1,
-                pontos[i+1][0] + 1, pontos[i+1][1] + 1,
-                fill='#222', width=4, smooth=True
-            )
-        # Linha principal
-        for i in range(len(pontos) - 1):
-            self.canvas_gpu.create_line(
-                pontos[i][0], pontos[i][1],
-                pontos[i+1][0], pontos[i+1][1],
-                fill='#4a9eff', width=3, smooth=True,
-                capstyle='round', joinstyle='round'
-            )
-
-    def _desenhar_pontos_destaque(self, pontos):
-        if len(pontos) < 2:
-            return
-        for ponto in [pontos[0], pontos[-1]]:
-            x, y = ponto
-            self.canvas_gpu.create_oval(
-                x-6, y-6, x+6, y+6,
-                fill='#dbeafe', outline='#4a9eff', width=2
-            )
-            self.canvas_gpu.create_oval(
-                x-3, y-3, x+3, y+3,
-                fill='#4a9eff', outline=''
-            )
-
-    def _desenhar_labels_valores(self, margin_x, margin_y, chart_width, chart_height):
-        for percent in [0, 50, 100]:
-            y = margin_y + chart_height - (percent / 100) * chart_height
-            self.canvas_gpu.create_text(
-                margin_x - 5, y,
-                text=f"{percent}%",
-                fill='#6b7280',
-                font=('Arial', 9),
-                anchor='e'
-            )
-        if self.historico_gpu:
-            valor_atual = self.historico_gpu[-1]
-            self.canvas_gpu.create_text(
-                margin_x + chart_width, margin_y,
-                text=f"{valor_atual:.1f}%",
-                fill='#4a9eff',
-                font=('Arial', 12, 'bold'),
-                anchor='ne'
-            )
+    def desenhar_grafico_gpu(self):
+        """Atualiza o gráfico de uso da GPU (só as coordenadas mudam)"""
+        self.grafico_gpu.atualizar()
 
 # Executa a aplicação se este arquivo for rodado diretamente
 if __name__ == "__main__":
@@ -10,6 +10,10 @@ Ele importa e executa a interface gráfica que mostra:
 - Lista dos processos que mais consomem recursos
 
 Para executar: python main.py
+Sem interface gráfica (servidores): python main.py --headless
+  --formato jsonl|csv   formato da saída (padrão jsonl)
+  --saida ARQUIVO       grava em arquivo com rotação (padrão: saída padrão)
+Métricas para o Prometheus (nos dois modos): --prometheus-porta 9101
 
 Dependências necessárias:
 - psutil: pip install psutil
@@ -19,11 +23,20 @@ Para GPU NVIDIA: instalar nvidia-smi (geralmente vem com drivers)
 Para GPU AMD: instalar ROCm tools (opcional)
 """
 
+import argparse
+import contextlib
 import sys
 import os
+import time
 
-def verificar_dependencias():
-    """Verifica se as dependências necessárias estão instaladas"""
+# Referência para medir o tempo até o primeiro quadro da janela
+INICIO = time.perf_counter()
+
+def verificar_dependencias(headless=False):
+    """
+    Verifica se as dependências necessárias estão instaladas
+    No modo headless o tkinter não é necessário (nem importado)
+    """
     
     try:
         import psutil
@@ -33,6 +46,9 @@ def verificar_dependencias():
         print("Instale com: pip install psutil")
         return False
     
+    if headless:
+        return True
+    
     try:
         import tkinter
         print("✓ tkinter encontrado")
@@ -44,7 +60,7 @@ def verificar_dependencias():
     
     return True
 
-def verificar_arquivos():
+def verificar_arquivos(headless=False):
     """Verifica se todos os arquivos do monitor estão presentes"""
     
     arquivos_necessarios = [
@@ -52,8 +68,18 @@ def verificar_arquivos():
         'ram_monitor.py', 
         'gpu_monitor.py',
         'process_monitor.py',
-        'interface_grafica.py'
+        'indice_processos.py',
+        'atributos_processos.py',
+        'amostras.py',
+        'instrumentacao.py',
+        'info_estatica.py',
+        'coletores.py'
     ]
+    if headless:
+        arquivos_necessarios += ['modo_headless.py']
+    else:
+        arquivos_necessarios += ['grafico.py', 'historico.py', 'persistencia.py', 'tabela_processos.py',
+                                 'interface_grafica.py']
     
     arquivos_faltando = []
     
@@ -71,9 +97,81 @@ def verificar_arquivos():
     print("✓ Todos os arquivos encontrados")
     return True
 
+def ler_argumentos():
+    """Lê as opções da linha de comando"""
+    parser = argparse.ArgumentParser(description="Monitor de hardware")
+    parser.add_argument("--headless", action="store_true",
+                        help="roda só os coletores, sem interface, gravando os dados")
+    parser.add_argument("--formato", choices=["jsonl", "csv", "nenhum"], default="jsonl",
+                        help="formato da saída no modo headless ('nenhum' = só o exportador)")
+    parser.add_argument("--saida", default="-",
+                        help="arquivo de saída no modo headless ('-' = saída padrão)")
+    parser.add_argument("--tamanho-maximo-mb", type=float, default=10,
+                        help="tamanho do arquivo antes de rotacionar (0 = sem rotação)")
+    parser.add_argument("--copias", type=int, default=5,
+                        help="arquivos rotacionados mantidos")
+    parser.add_argument("--intervalo", action="append", default=[], metavar="COLETOR=SEGUNDOS",
+                        help="intervalo de um coletor (ex.: --intervalo processos=10)")
+    parser.add_argument("--prometheus-porta", type=int, default=0,
+                        help="serve /metrics nesta porta (0 = desligado)")
+    parser.add_argument("--prometheus-endereco", default="127.0.0.1",
+                        help="endereço do endpoint /metrics")
+    return parser.parse_args()
+
+def criar_exportador(argumentos):
+    """Inicia o exportador Prometheus se uma porta foi pedida"""
+    if not argumentos.prometheus_porta:
+        return None
+    from exportador_prometheus import ExportadorPrometheus
+    
+    exportador = ExportadorPrometheus(argumentos.prometheus_porta, argumentos.prometheus_endereco)
+    try:
+        exportador.iniciar()
+    except OSError as e:
+        print(f"✗ Não foi possível abrir a porta {argumentos.prometheus_porta}: {e}")
+        return None
+    return exportador
+
+def ler_intervalos(opcoes):
+    """Converte as opções --intervalo em dicionário coletor -> segundos"""
+    intervalos = {}
+    for opcao in opcoes:
+        nome, _, segundos = opcao.partition("=")
+        try:
+            intervalos[nome.strip()] = float(segundos)
+        except ValueError:
+            print(f"Intervalo inválido ignorado: {opcao}")
+    return intervalos
+
+def main_headless(argumentos):
+    """
+    Modo sem interface: as mensagens vão para a saída de erro e a
+    saída padrão fica só com os dados
+    """
+    with contextlib.redirect_stdout(sys.stderr):
+        if not verificar_dependencias(headless=True):
+            sys.exit(1)
+        if not verificar_arquivos(headless=True):
+            sys.exit(1)
+        intervalos = ler_intervalos(argumentos.intervalo)
+        exportador = criar_exportador(argumentos)
+    
+    from modo_headless import ColetorHeadless
+    
+    coletor = ColetorHeadless(formato=argumentos.formato, saida=argumentos.saida,
+                              tamanho_maximo_mb=argumentos.tamanho_maximo_mb,
+                              copias=argumentos.copias, intervalos=intervalos,
+                              exportador=exportador)
+    coletor.executar()
+
 def main():
     """Função principal"""
     
+    argumentos = ler_argumentos()
+    if argumentos.headless:
+        main_headless(argumentos)
+        return
+    
     print("=== MONITOR DE HARDWARE ===")
     print("Verificando sistema...")
     
@@ -97,6 +195,7 @@ def main():
     print("║  🎮 GPU - Informações da placa de    ║")
     print("║       vídeo                          ║")
     print("║  💾 RAM - Detalhes da memória        ║")
+    print("║  🩺 Diagnóstico - Custo do monitor   ║")
     print("╚══════════════════════════════════════╝")
     print()
     
@@ -105,7 +204,8 @@ def main():
         from interface_grafica import MonitorHardware
         
         print("🚀 Iniciando interface gráfica...")
-        monitor = MonitorHardware()
+        monitor = MonitorHardware(intervalos=ler_intervalos(argumentos.intervalo),
+                                  exportador=criar_exportador(argumentos), inicio=INICIO)
         monitor.iniciar()
         
     except KeyboardInterrupt:
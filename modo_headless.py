@@ -0,0 +1,270 @@
+"""
+Modo sem interface gráfica (servidores sem display)
+
+Roda os mesmos coletores do monitor no agendador e grava cada
+snapshot como JSON Lines ou CSV na saída padrão ou em um arquivo
+com rotação por tamanho. Este módulo não importa tkinter
+"""
+
+import contextlib
+import csv
+import io
+import json
+import os
+import sys
+import time
+
+from coletores import ExecutorColetores, AgendadorColetores
+from instrumentacao import resumo_etapas
+
+def achatar_resultados(resultados):
+    """
+    Converte os resultados dos coletores em um dicionário simples
+    (uma linha de saída) com os valores brutos, sem arredondar.
+    Listas de processos e núcleos ficam como listas. O horário é o da
+    coleta mais recente (não o da conversão)
+    """
+    cpu = resultados['cpu'].valor
+    gpu = resultados['gpu'].valor
+    ram = resultados['ram'].valor
+    swap = resultados['swap'].valor
+    processos_cpu, processos_ram = resultados['processos'].valor
+    monitor = resultados['monitor'].valor
+    # Atributos caros dos processos dos rankings, com a idade da leitura
+    atributos = resultados['atributos'].valor if 'atributos' in resultados else {}
+    agora = time.monotonic()
+    momentos = [r.momento for r in resultados.values() if r.momento is not None]
+    horario = (max(momentos) if momentos else agora) + time.time() - agora
+    atributos_topo = {}
+    for processo in processos_cpu + processos_ram:
+        amostra = atributos.get(processo.pid)
+        if amostra is not None and processo.pid not in atributos_topo:
+            valores = amostra.como_dict()
+            del valores['momento']
+            valores['idade_s'] = amostra.idade(agora)
+            atributos_topo[processo.pid] = valores
+    return {
+        'horario': horario,
+        'cpu_disponivel': cpu.disponivel,
+        'cpu_total': cpu.uso_total,
+        'cpu_cores': cpu.uso_por_core.tolist(),
+        'cpu_freq_mhz': resultados['frequencia'].valor,
+        'gpu_disponivel': gpu.disponivel,
+        'gpu_uso': gpu.uso_porcentagem,
+        'gpu_memoria_usada_mb': gpu.memoria_usada_mb,
+        'gpu_memoria_total_mb': gpu.memoria_total_mb,
+        'gpu_temperatura': gpu.temperatura,
+        'ram_disponivel': ram.disponivel,
+        'ram_porcentagem': ram.porcentagem,
+        'ram_usada_bytes': ram.usada_bytes,
+        'ram_total_bytes': ram.total_bytes,
+        'swap_disponivel': swap.disponivel,
+        'swap_porcentagem': swap.porcentagem,
+        'swap_usada_bytes': swap.usada_bytes,
+        'processos_cpu': [processo._asdict() for processo in processos_cpu],
+        'processos_ram': [processo._asdict() for processo in processos_ram],
+        'processos_atributos': list(atributos_topo.values()),
+        'monitor_cpu_percent': monitor.cpu_percent,
+        'monitor_rss_bytes': monitor.rss_bytes,
+        # etapa -> [p50, p99, cpu p50, cpu p99] em ms
+        'etapas': {etapa: list(r[1:]) for etapa, r in resumo_etapas().items()},
+        'atrasados': sorted(nome for nome, r in resultados.items() if r.atrasado),
+    }
+
+class FormatoJsonl:
+    """Uma linha JSON por snapshot"""
+
+    cabecalho = None
+
+    def linha(self, registro):
+        return json.dumps(registro, ensure_ascii=False, separators=(',', ':')) + "\n"
+
+class FormatoCsv:
+    """
+    CSV com uma coluna por núcleo; as colunas são fixadas no primeiro
+    snapshot. Processos viram o nome/uso do primeiro colocado
+    """
+
+    def __init__(self):
+        self.colunas = None
+        self.cabecalho = None
+
+    def _converter(self, registro):
+        linha = {}
+        for chave, valor in registro.items():
+            if chave == 'cpu_cores':
+                for i, uso in enumerate(valor):
+                    linha[f'cpu_core_{i}'] = uso
+            elif chave == 'processos_cpu':
+                linha['top_cpu_nome'] = valor[0]['nome'] if valor else ''
+                linha['top_cpu_percent'] = valor[0]['cpu_percent'] if valor else ''
+            elif chave == 'processos_ram':
+                linha['top_ram_nome'] = valor[0]['nome'] if valor else ''
+                linha['top_ram_bytes'] = valor[0]['memoria_bytes'] if valor else ''
+            elif chave == 'atrasados':
+                linha[chave] = ' '.join(valor)
+            elif chave in ('etapas', 'processos_atributos'):
+                # Variam durante a execução: não cabem em colunas fixas
+                continue
+            else:
+                linha[chave] = valor
+        return linha
+
+    def _csv(self, valores):
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator="\n").writerow(valores)
+        return buffer.getvalue()
+
+    def linha(self, registro):
+        linha = self._converter(registro)
+        if self.colunas is None:
+            self.colunas = list(linha)
+            self.cabecalho = self._csv(self.colunas)
+        return self._csv([linha.get(coluna, '') for coluna in self.colunas])
+
+class SaidaRotativa:
+    """
+    Arquivo de saída que é renomeado para .1, .2, ... ao passar de
+    `tamanho_maximo` bytes (mantém `copias` arquivos antigos)
+    """
+
+    def __init__(self, caminho, tamanho_maximo, copias=5, cabecalho=None):
+        self.caminho = caminho
+        self.tamanho_maximo = tamanho_maximo
+        self.copias = copias
+        self.cabecalho = cabecalho
+        self._arquivo = None
+        self._abrir()
+
+    def _abrir(self):
+        self._arquivo = open(self.caminho, "a", encoding="utf-8", buffering=64 * 1024)
+        self._tamanho = self._arquivo.tell()
+
+    def _rotacionar(self):
+        self._arquivo.close()
+        for i in range(self.copias - 1, 0, -1):
+            origem = f"{self.caminho}.{i}"
+            if os.path.exists(origem):
+                os.replace(origem, f"{self.caminho}.{i + 1}")
+        if self.copias > 0:
+            os.replace(self.caminho, f"{self.caminho}.1")
+        else:
+            os.remove(self.caminho)
+        self._abrir()
+
+    def write(self, texto):
+        if self.tamanho_maximo and self._tamanho and self._tamanho + len(texto) > self.tamanho_maximo:
+            self._rotacionar()
+        if self._tamanho == 0 and self.cabecalho:
+            self._arquivo.write(self.cabecalho)
+            self._tamanho += len(self.cabecalho)
+        self._arquivo.write(texto)
+        self._tamanho += len(texto)
+
+    def flush(self):
+        self._arquivo.flush()
+
+    def close(self):
+        self._arquivo.close()
+
+class ColetorHeadless:
+    """
+    Liga o agendador de coletores à saída: as linhas ficam em memória
+    e são escritas juntas a cada `intervalo_escrita_s`
+
+    Só vira linha o snapshot em que algum coletor trouxe valor novo
+    (momento diferente do snapshot anterior)
+    """
+
+    def __init__(self, formato="jsonl", saida=None, tamanho_maximo_mb=0, copias=5,
+                 intervalos=None, intervalo_escrita_s=1.0, exportador=None):
+        """
+        formato: "jsonl", "csv" ou "nenhum" (só alimenta o exportador)
+        exportador: ExportadorPrometheus opcional que recebe cada snapshot
+        """
+        self.formato = {'csv': FormatoCsv, 'nenhum': lambda: None}.get(formato, FormatoJsonl)()
+        self.exportador = exportador
+        self.caminho_saida = saida
+        self.tamanho_maximo = int(tamanho_maximo_mb * 1024 * 1024)
+        self.copias = copias
+        self.intervalo_escrita_s = intervalo_escrita_s
+        self.executor = ExecutorColetores()
+        self.agendador = AgendadorColetores(self.executor, intervalos)
+        self._stdout = sys.stdout
+        self._saida = None
+        self._saida_fechada = False
+        self._pendentes = []
+        self._momentos = None
+        self._ultima_escrita = time.monotonic()
+
+    def _abrir_saida(self):
+        if self.caminho_saida in (None, "-"):
+            self._saida = self._stdout
+            if self.formato.cabecalho:
+                self._saida.write(self.formato.cabecalho)
+        else:
+            self._saida = SaidaRotativa(self.caminho_saida, self.tamanho_maximo, self.copias,
+                                        cabecalho=self.formato.cabecalho)
+
+    def ao_coletar(self, resultados):
+        if self.exportador is not None:
+            self.exportador.publicar(resultados)
+        if self._saida_fechada or self.formato is None:
+            return
+        momentos = {nome: r.momento for nome, r in resultados.items()}
+        if momentos == self._momentos:
+            return
+        self._momentos = momentos
+        linha = self.formato.linha(achatar_resultados(resultados))
+        if self._saida is None:
+            # Abre só agora: o CSV precisa do primeiro snapshot para o cabeçalho
+            self._abrir_saida()
+        self._pendentes.append(linha)
+        if time.monotonic() - self._ultima_escrita >= self.intervalo_escrita_s:
+            self.escrever()
+
+    def escrever(self):
+        """Escreve e descarrega as linhas acumuladas"""
+        self._ultima_escrita = time.monotonic()
+        if not self._pendentes or self._saida is None:
+            return
+        try:
+            self._saida.write("".join(self._pendentes))
+            self._saida.flush()
+        except BrokenPipeError:
+            # Quem lia a saída (ex.: `| head`) fechou: encerra a coleta
+            self._pendentes.clear()
+            self._saida = None
+            self._saida_fechada = True
+            self.agendador.parar()
+            descartar = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(descartar, self._stdout.fileno())
+            return
+        self._pendentes.clear()
+
+    def executar(self):
+        """
+        Roda até Ctrl+C. Mensagens de erro dos coletores vão para a
+        saída de erro para não misturar com os dados
+        """
+        try:
+            with contextlib.redirect_stdout(sys.stderr):
+                self.agendador.executar(self.ao_coletar)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.agendador.parar()
+            self.executor.encerrar()
+            if self.exportador is not None:
+                self.exportador.parar()
+            self.escrever()
+            if self._saida is not None and self._saida is not self._stdout:
+                self._saida.close()
+
+# Teste do módulo (só executa se rodar este arquivo diretamente)
+if __name__ == "__main__":
+    import threading
+
+    coletor = ColetorHeadless(formato="jsonl", intervalo_escrita_s=0)
+    threading.Timer(3, coletor.agendador.parar).start()
+    coletor.executar()
@@ -0,0 +1,135 @@
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+from coletores import novas_amostras
+
+def caminho_padrao():
+    """Retorna o caminho padrão do arquivo de histórico"""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    else:
+        base = os.environ.get("XDG_DATA_HOME") or os.path.join(os.path.expanduser("~"), ".local", "share")
+    return os.path.join(base, "monitor-hardware", "historico.db")
+
+class HistoricoEmDisco:
+    """
+    Histórico das métricas em SQLite (modo WAL), só com inserções
+
+    As amostras ficam em memória e são gravadas em lote, numa única
+    transação, a cada `intervalo_gravacao_s`. Se o programa cair, no
+    máximo o último lote se perde; o arquivo nunca fica corrompido.
+    Quando o arquivo passa de `tamanho_maximo_mb`, as amostras mais
+    antigas são apagadas. Só séries de um canal são gravadas
+    """
+
+    def __init__(self, caminho=None, tamanho_maximo_mb=50, intervalo_gravacao_s=5.0):
+        self.caminho = caminho or caminho_padrao()
+        self.tamanho_maximo = tamanho_maximo_mb * 1024 * 1024
+        self.intervalo_gravacao_s = intervalo_gravacao_s
+        self._pendentes = []
+        self._ultima_gravacao = time.monotonic()
+        self._momentos_vistos = {}
+        self._ids_series = {}
+        self._lock = threading.Lock()
+
+        pasta = os.path.dirname(self.caminho)
+        if pasta:
+            os.makedirs(pasta, exist_ok=True)
+        self._conexao = sqlite3.connect(self.caminho, check_same_thread=False)
+        self._conexao.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        self._conexao.execute("PRAGMA journal_mode = WAL")
+        self._conexao.execute("PRAGMA synchronous = NORMAL")
+        self._conexao.execute(
+            "CREATE TABLE IF NOT EXISTS series (id INTEGER PRIMARY KEY, nome TEXT UNIQUE NOT NULL)")
+        # Chave (serie, momento): leitura por período sem índice extra
+        self._conexao.execute(
+            "CREATE TABLE IF NOT EXISTS amostras ("
+            " serie INTEGER NOT NULL, momento REAL NOT NULL, valor REAL NOT NULL,"
+            " PRIMARY KEY (serie, momento)) WITHOUT ROWID")
+        self._conexao.commit()
+        for id_serie, nome in self._conexao.execute("SELECT id, nome FROM series"):
+            self._ids_series[nome] = id_serie
+
+    def _id_serie(self, nome):
+        id_serie = self._ids_series.get(nome)
+        if id_serie is None:
+            cursor = self._conexao.execute("INSERT INTO series (nome) VALUES (?)", (nome,))
+            id_serie = self._ids_series[nome] = cursor.lastrowid
+        return id_serie
+
+    def adicionar(self, serie, momento, valor):
+        """Guarda uma amostra para o próximo lote"""
+        with self._lock:
+            self._pendentes.append((serie, momento, valor))
+
+    def registrar_resultados(self, resultados):
+        """
+        Chamado pela thread de coleta: separa as amostras novas dos
+        resultados e grava o lote se já passou o intervalo
+        """
+        for nome, momento, valor in novas_amostras(resultados, self._momentos_vistos):
+            if isinstance(valor, (int, float)):
+                self.adicionar(nome, momento, valor)
+        if time.monotonic() - self._ultima_gravacao >= self.intervalo_gravacao_s:
+            self.gravar()
+
+    def gravar(self):
+        """Grava todas as amostras pendentes em uma única transação"""
+        with self._lock:
+            pendentes, self._pendentes = self._pendentes, []
+            self._ultima_gravacao = time.monotonic()
+            if not pendentes:
+                return
+            try:
+                with self._conexao:
+                    self._conexao.executemany(
+                        "INSERT OR REPLACE INTO amostras (serie, momento, valor) VALUES (?, ?, ?)",
+                        [(self._id_serie(serie), momento, valor) for serie, momento, valor in pendentes])
+                self._aplicar_retencao()
+            except sqlite3.Error as e:
+                print(f"Erro ao gravar histórico: {e}")
+
+    def _tamanho_arquivo(self):
+        paginas = self._conexao.execute("PRAGMA page_count").fetchone()[0]
+        livres = self._conexao.execute("PRAGMA freelist_count").fetchone()[0]
+        tamanho_pagina = self._conexao.execute("PRAGMA page_size").fetchone()[0]
+        return (paginas - livres) * tamanho_pagina
+
+    def _aplicar_retencao(self):
+        """Apaga as amostras mais antigas até o arquivo caber no limite"""
+        tamanho = self._tamanho_arquivo()
+        if tamanho <= self.tamanho_maximo:
+            return
+        inicio, fim = self._conexao.execute("SELECT MIN(momento), MAX(momento) FROM amostras").fetchone()
+        if inicio is None:
+            return
+        # Remove a fração mais antiga proporcional ao excesso (+10% de folga)
+        fracao = min(1.0, (tamanho - self.tamanho_maximo) / tamanho + 0.1)
+        corte = inicio + (fim - inicio) * fracao
+        with self._conexao:
+            self._conexao.execute("DELETE FROM amostras WHERE momento < ?", (corte,))
+        self._conexao.execute("PRAGMA incremental_vacuum")
+
+    def ler(self, serie, inicio, fim=None):
+        """Lista de (momento, valor) de uma série no período pedido"""
+        id_serie = self._ids_series.get(serie)
+        if id_serie is None:
+            return []
+        with self._lock:
+            return self._conexao.execute(
+                "SELECT momento, valor FROM amostras WHERE serie = ? AND momento >= ? AND momento <= ?"
+                " ORDER BY momento",
+                (id_serie, inicio, fim if fim is not None else float('inf'))).fetchall()
+
+    def ler_series(self, nomes, desde):
+        """Dicionário serie -> lista de (momento, valor) a partir de `desde`"""
+        return {nome: self.ler(nome, desde) for nome in nomes}
+
+    def fechar(self):
+        """Grava o que estiver pendente e fecha o arquivo"""
+        self.gravar()
+        with self._lock:
+            self._conexao.close()
@@ -1,5 +1,240 @@
+import heapq
+import os
+import threading
+import time
+from collections import namedtuple
+
 import psutil
 
+from indice_processos import IndiceProcessos
+
+# Todos os atributos necessários, pedidos de uma vez ao process_iter
+ATRIBUTOS_PROCESSO = ['pid', 'name', 'create_time', 'cpu_times', 'memory_percent', 'memory_info']
+
+# Uma linha do snapshot de processos
+# criacao identifica o processo junto com o pid (PIDs são reutilizados):
+# create_time do psutil ou starttime do /proc, conforme o backend
+RegistroProcesso = namedtuple('RegistroProcesso',
+                              ['pid', 'nome', 'cpu_percent', 'memoria_percent', 'memoria_bytes', 'criacao'],
+                              defaults=[0.0])
+
+class RastreadorProcessos:
+    """
+    Guarda, entre uma varredura e outra, o tempo de CPU de cada processo
+    (chave: pid + create_time, para não confundir PIDs reutilizados)
+
+    O uso de CPU é calculado pela diferença de tempo de CPU dividida pelo
+    tempo decorrido, sem bloquear. Processos vistos pela primeira vez
+    ainda não têm taxa (ficam com 0.0) e processos que terminaram
+    saem do estado na varredura seguinte
+    """
+
+    def __init__(self):
+        self._anteriores = {}
+        self._momento_anterior = None
+        self._lock = threading.Lock()
+
+    def varrer(self):
+        """Percorre a tabela de processos e retorna uma lista de RegistroProcesso"""
+        with self._lock:
+            agora = time.monotonic()
+            decorrido = agora - self._momento_anterior if self._momento_anterior else 0.0
+            anteriores = self._anteriores
+            atuais = {}
+            snapshot = []
+
+            # process_iter reaproveita os objetos Process entre chamadas;
+            # ad_value=None: atributos sem permissão viram None em vez de exceção
+            for processo in psutil.process_iter(ATRIBUTOS_PROCESSO, ad_value=None):
+                info = processo.info
+                pid = info['pid']
+                tempos = info['cpu_times']
+                cpu_percent = 0.0
+                if tempos is not None:
+                    chave = (pid, info['create_time'])
+                    tempo_cpu = tempos.user + tempos.system
+                    atuais[chave] = tempo_cpu
+                    tempo_anterior = anteriores.get(chave)
+                    if tempo_anterior is not None and decorrido > 0:
+                        cpu_percent = max(tempo_cpu - tempo_anterior, 0.0) / decorrido * 100
+
+                mem = info['memory_info']
+                snapshot.append(RegistroProcesso(
+                    pid,
+                    info['name'] or '',
+                    cpu_percent,
+                    info['memory_percent'] or 0.0,
+                    getattr(mem, 'wset', mem.rss) if mem is not None else 0,
+                    info['create_time'] or 0.0
+                ))
+
+            # Só sobrevivem os processos vistos nesta varredura
+            self._anteriores = atuais
+            self._momento_anterior = agora
+            return snapshot
+
+class RastreadorProcLinux:
+    """
+    Backend alternativo para Linux: lê /proc/<pid>/stat e /proc/<pid>/statm
+    diretamente, sem o custo de criar e consultar objetos do psutil
+
+    Lista os PIDs com os.scandir, reaproveita o mesmo buffer de leitura
+    para todos os arquivos e só interpreta os campos usados. Devolve os
+    mesmos RegistroProcesso que RastreadorProcessos. O nome vem do campo
+    comm (no máximo 15 caracteres), sem consultar o cmdline
+    """
+
+    def __init__(self, caminho_proc="/proc"):
+        self.caminho_proc = caminho_proc
+        self._ticks_por_segundo = os.sysconf('SC_CLK_TCK')
+        self._tamanho_pagina = os.sysconf('SC_PAGE_SIZE')
+        self._buffer = bytearray(4096)
+        self._anteriores = {}
+        self._momento_anterior = None
+        self._lock = threading.Lock()
+
+    def _ler(self, caminho):
+        """Lê um arquivo pequeno para o buffer e retorna quantos bytes vieram"""
+        fd = os.open(caminho, os.O_RDONLY)
+        try:
+            return os.readv(fd, [self._buffer])
+        finally:
+            os.close(fd)
+
+    def _memoria_total(self):
+        with open(os.path.join(self.caminho_proc, "meminfo"), "rb") as f:
+            for linha in f:
+                if linha.startswith(b"MemTotal:"):
+                    return int(linha.split()[1]) * 1024
+        return 0
+
+    def varrer(self):
+        """Percorre /proc e retorna uma lista de RegistroProcesso"""
+        with self._lock:
+            agora = time.monotonic()
+            decorrido = agora - self._momento_anterior if self._momento_anterior else 0.0
+            anteriores = self._anteriores
+            atuais = {}
+            snapshot = []
+            buffer = self._buffer
+            ticks = self._ticks_por_segundo
+            pagina = self._tamanho_pagina
+            memoria_total = self._memoria_total()
+
+            with os.scandir(self.caminho_proc) as entradas:
+                for entrada in entradas:
+                    if not entrada.name.isdigit():
+                        continue
+                    pid = int(entrada.name)
+                    try:
+                        n = self._ler(f"{entrada.path}/stat")
+                        # O nome fica entre parênteses e pode conter espaços
+                        inicio_nome = buffer.find(b"(", 0, n)
+                        fim_nome = buffer.rfind(b")", 0, n)
+                        nome = buffer[inicio_nome + 1:fim_nome].decode(errors="replace")
+                        # Campos após o nome: 0=state, 11=utime, 12=stime, 19=starttime
+                        campos = buffer[fim_nome + 2:n].split(None, 20)
+                        tempo_cpu = (int(campos[11]) + int(campos[12])) / ticks
+                        criacao = int(campos[19])
+                        chave = (pid, criacao)
+
+                        n = self._ler(f"{entrada.path}/statm")
+                        residente = int(buffer[:n].split(None, 2)[1]) * pagina
+                    except (OSError, IndexError, ValueError):
+                        # Processo terminou durante a leitura ou sem permissão
+                        continue
+
+                    atuais[chave] = tempo_cpu
+                    tempo_anterior = anteriores.get(chave)
+                    cpu_percent = 0.0
+                    if tempo_anterior is not None and decorrido > 0:
+                        cpu_percent = max(tempo_cpu - tempo_anterior, 0.0) / decorrido * 100
+
+                    snapshot.append(RegistroProcesso(
+                        pid,
+                        nome,
+                        cpu_percent,
+                        residente / memoria_total * 100 if memoria_total else 0.0,
+                        residente,
+                        criacao
+                    ))
+
+            self._anteriores = atuais
+            self._momento_anterior = agora
+            return snapshot
+
+_rastreador = RastreadorProcessos()
+# Último snapshot completo (lista nova a cada varredura, nunca alterada)
+_ultimo_snapshot = []
+# Índice de busca por nome/linha de comando, atualizado a cada varredura
+_indice = IndiceProcessos()
+
+def escolher_backend_processos(nome="psutil", caminho_proc="/proc"):
+    """
+    Define como a tabela de processos é lida:
+    - 'psutil': portável (padrão)
+    - 'proc': leitura direta de /proc (apenas Linux)
+    """
+    global _rastreador
+    if nome == "proc":
+        _rastreador = RastreadorProcLinux(caminho_proc)
+    elif nome == "psutil":
+        _rastreador = RastreadorProcessos()
+    else:
+        raise ValueError(f"Backend de processos desconhecido: {nome}")
+
+def obter_snapshot_processos():
+    """
+    Percorre a tabela de processos uma única vez
+    Retorna uma lista de RegistroProcesso com tudo que os rankings usam
+    (o uso de CPU é relativo à varredura anterior)
+    """
+    return _rastreador.varrer()
+
+def _ranking_cpu(snapshot, limite):
+    # Seleção parcial (heap): O(n log k) em vez de ordenar tudo
+    ativos = (r for r in snapshot if r.cpu_percent > 0)
+    return heapq.nlargest(limite, ativos, key=lambda r: r.cpu_percent)
+
+def _ranking_memoria(snapshot, limite):
+    ativos = (r for r in snapshot if r.memoria_percent > 0)
+    return heapq.nlargest(limite, ativos, key=lambda r: r.memoria_percent)
+
+def obter_rankings_processos(limite_cpu=5, limite_memoria=5):
+    """
+    Faz uma única varredura e devolve os dois rankings
+
+    Returns:
+        (processos_cpu, processos_memoria): listas de RegistroProcesso
+        com os valores sem arredondamento
+    """
+    global _ultimo_snapshot
+    try:
+        snapshot = _ultimo_snapshot = obter_snapshot_processos()
+        _indice.atualizar(snapshot)
+        return _ranking_cpu(snapshot, limite_cpu), _ranking_memoria(snapshot, limite_memoria)
+    except Exception as e:
+        print(f"Erro ao obter processos: {e}")
+        return [], []
+
+def ultimo_snapshot_processos():
+    """
+    Snapshot completo da última varredura feita por obter_rankings_processos
+    (para a tabela de todos os processos, sem varrer de novo)
+    """
+    return _ultimo_snapshot
+
+def buscar_processos(texto):
+    """
+    PIDs cujo nome começa com `texto` e, depois, os que contêm `texto`
+    no nome ou na linha de comando (índice da última varredura)
+    """
+    return _indice.buscar(texto)
+
+def linha_de_comando(pid):
+    """Linha de comando do processo, se já foi lida pelo índice (senão None)"""
+    return _indice.linha_de_comando(pid)
+
 def obter_processos_top(limite=5):
     """
     Obtém os processos que mais consomem CPU
@@ -11,36 +246,13 @@ def obter_processos_top(limite=5):
         Lista de dicionários com informações dos processos
     """
     try:
-        processos = []
-        
-        # Percorre todos os processos do sistema
-        for processo in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']):
-            try:
-                # Obtém informações do processo
-                info = processo.info
-                
-                # Só adiciona se o processo está usando CPU
-                if info['cpu_percent'] and info['cpu_percent'] > 0:
-                    mem = processo.memory_info()
-                    memoria_bytes = getattr(mem, 'wset', mem.rss)
-                    processos.append({
-                        'pid': info['pid'],
-                        'nome': info['name'][:20],  # Limita o nome a 20 caracteres
-                        'cpu_percent': round(info['cpu_percent'], 1),
-                        'memoria_percent': round(info['memory_percent'], 1),
-                        'memoria_bytes': memoria_bytes
-                    })
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                # Ignora processos que não conseguimos acessar
-                continue
-        
-        # Ordena por uso de CPU (maior primeiro) e pega os primeiros
-        processos_ordenados = sorted(processos, 
-                                   key=lambda x: x['cpu_percent'], 
-                                   reverse=True)
-        
-        return processos_ordenados[:limite]
-        
+        return [{
+            'pid': r.pid,
+            'nome': r.nome[:20],  # Limita o nome a 20 caracteres
+            'cpu_percent': round(r.cpu_percent, 1),
+            'memoria_percent': round(r.memoria_percent, 1),
+            'memoria_bytes': r.memoria_bytes
+        } for r in _ranking_cpu(obter_snapshot_processos(), limite)]
     except Exception as e:
         print(f"Erro ao obter processos: {e}")
         return []
@@ -50,31 +262,12 @@ def obter_processos_memoria(limite=5):
     Obtém os processos que mais consomem memória
     """
     try:
-        processos = []
-        
-        for processo in psutil.process_iter(['pid', 'name', 'memory_percent']):
-            try:
-                info = processo.info
-                
-                if info['memory_percent'] and info['memory_percent'] > 0:
-                    mem = processo.memory_info()
-                    memoria_bytes = getattr(mem, 'wset', mem.rss)
-                    processos.append({
-                        'pid': info['pid'],
-                        'nome': info['name'][:20],
-                        'memoria_percent': round(info['memory_percent'], 1),
-                        'memoria_bytes': memoria_bytes
-                    })
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
-        
-        # Ordena por uso de memória
-        processos_ordenados = sorted(processos, 
-                                   key=lambda x: x['memoria_percent'], 
-                                   reverse=True)
-        
-        return processos_ordenados[:limite]
-        
+        return [{
+            'pid': r.pid,
+            'nome': r.nome[:20],
+            'memoria_percent': round(r.memoria_percent, 1),
+            'memoria_bytes': r.memoria_bytes
+        } for r in _ranking_memoria(obter_snapshot_processos(), limite)]
     except Exception as e:
         print(f"Erro ao obter processos por memória: {e}")
         return []
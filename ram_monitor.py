@@ -1,6 +1,9 @@
 import psutil
 import subprocess
 
+from amostras import AmostraRAM, AmostraSwap, GB
+from info_estatica import obter_dados_estaticos
+
 def obter_tipo_ram():
     """
     Obtém a tecnologia da RAM (DDR3, DDR4, DDR5...) usando wmic (apenas Windows)
@@ -55,6 +58,78 @@ def obter_tipo_ram():
     except Exception as e:
         return f"Desconhecida (erro: {e})"
 
+# Memory Type (offset 0x12) das estruturas SMBIOS tipo 17
+_TIPOS_DMI = {
+    0x12: "DDR",
+    0x13: "DDR2",
+    0x18: "DDR3",
+    0x1A: "DDR4",
+    0x1B: "LPDDR",
+    0x1C: "LPDDR2",
+    0x1D: "LPDDR3",
+    0x1E: "LPDDR4",
+    0x22: "DDR5",
+    0x23: "LPDDR5"
+}
+
+def obter_tipo_ram_dmi(caminho="/sys/firmware/dmi/tables/DMI"):
+    """
+    Obtém a tecnologia da RAM lendo a tabela DMI/SMBIOS do Linux
+    (sem criar processos). Retorna 'Desconhecida' se não conseguir ler
+    """
+    try:
+        with open(caminho, "rb") as f:
+            tabela = f.read()
+    except OSError:
+        # Normalmente só o root consegue ler a tabela
+        return "Desconhecida"
+
+    pos = 0
+    while pos + 4 <= len(tabela):
+        tipo = tabela[pos]
+        tamanho = tabela[pos + 1]
+        if tamanho < 4:
+            break
+        # Tipo 17 = Memory Device; ignora slots vazios (tamanho 0)
+        if tipo == 17 and tamanho > 0x12 and pos + tamanho <= len(tabela):
+            tamanho_modulo = int.from_bytes(tabela[pos + 0x0C:pos + 0x0E], "little")
+            if tamanho_modulo not in (0, 0xFFFF):
+                nome = _TIPOS_DMI.get(tabela[pos + 0x12])
+                if nome:
+                    return nome
+        if tipo == 127:
+            break
+        # Pula a área formatada e as strings (terminadas por dois zeros)
+        fim_strings = tabela.find(b"\x00\x00", pos + tamanho)
+        if fim_strings == -1:
+            break
+        pos = fim_strings + 2
+    return "Desconhecida"
+
+def amostrar_ram():
+    """
+    Coleta o uso da RAM
+    Retorna uma AmostraRAM (bytes e porcentagem sem arredondamento)
+    """
+    try:
+        # Obtém informações da memória virtual (RAM)
+        memoria = psutil.virtual_memory()
+        return AmostraRAM(memoria.percent, memoria.total, memoria.used, memoria.available)
+    except Exception as e:
+        print(f"Erro ao obter dados da RAM: {e}")
+        return AmostraRAM.indisponivel()
+
+def amostrar_swap():
+    """
+    Coleta o uso da memória swap (arquivo de paginação)
+    Retorna uma AmostraSwap
+    """
+    try:
+        swap = psutil.swap_memory()
+        return AmostraSwap(swap.percent, swap.total, swap.used)
+    except Exception:
+        return AmostraSwap.indisponivel()
+
 def obter_uso_ram():
     """
     Coleta informações de uso da RAM
@@ -65,58 +140,26 @@ def obter_uso_ram():
     - disponivel_gb: RAM disponível em GB
     - tipo_ram: tipo da RAM (DDR3, DDR4, DDR5...)
     """
-    try:
-        # Obtém informações da memória virtual (RAM)
-        memoria = psutil.virtual_memory()
-        
-        # Converte bytes para gigabytes (dividindo por 1024³)
-        total_gb = round(memoria.total / (1024**3), 1)
-        usada_gb = round(memoria.used / (1024**3), 1)
-        disponivel_gb = round(memoria.available / (1024**3), 1)
-        
-        # A porcentagem já vem calculada
-        porcentagem_usada = round(memoria.percent, 1)
-        tipo_ram = obter_tipo_ram()
-        
-        # Organiza os dados
-        dados_ram = {
-            'porcentagem_usada': porcentagem_usada,
-            'total_gb': total_gb,
-            'usada_gb': usada_gb,
-            'disponivel_gb': disponivel_gb,
-            'tipo_ram': tipo_ram
-        }
-        
-        return dados_ram
-        
-    except Exception as e:
-        print(f"Erro ao obter dados da RAM: {e}")
-        # Retorna dados padrão em caso de erro
-        return {
-            'porcentagem_usada': 0.0,
-            'total_gb': 8.0,
-            'usada_gb': 0.0,
-            'disponivel_gb': 8.0,
-            'tipo_ram': 'Desconhecida'
-        }
+    ram = amostrar_ram()
+    return {
+        'porcentagem_usada': round(ram.porcentagem, 1),
+        'total_gb': round(ram.total_bytes / GB, 1),
+        'usada_gb': round(ram.usada_bytes / GB, 1),
+        'disponivel_gb': round(ram.livre_bytes / GB, 1),
+        # O tipo não muda durante a execução: vem do cache de dados estáticos
+        'tipo_ram': obter_dados_estaticos()['tipo_ram']
+    }
 
 def obter_swap():
     """
     Obtém informações sobre a memória swap (arquivo de paginação)
     """
-    try:
-        swap = psutil.swap_memory()
-        return {
-            'total_gb': round(swap.total / (1024**3), 1),
-            'usada_gb': round(swap.used / (1024**3), 1),
-            'porcentagem': round(swap.percent, 1)
-        }
-    except:
-        return {
-            'total_gb': 0.0,
-            'usada_gb': 0.0,
-            'porcentagem': 0.0
-        }
+    swap = amostrar_swap()
+    return {
+        'total_gb': round(swap.total_bytes / GB, 1),
+        'usada_gb': round(swap.usada_bytes / GB, 1),
+        'porcentagem': round(swap.porcentagem, 1)
+    }
 
 # Teste da função (só executa se rodar este arquivo diretamente)
 if __name__ == "__main__":
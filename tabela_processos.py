@@ -0,0 +1,257 @@
+import tkinter as tk
+from operator import attrgetter
+
+MB = 1024 ** 2
+
+# Colunas da tabela: atributo do RegistroProcesso, título, largura (px),
+# alinhamento, se começa decrescente e formatação do valor
+COLUNAS = [
+    ('pid', "PID", 70, 'e', False, str),
+    ('nome', "Nome", 0, 'w', False, str),  # largura 0: ocupa o que sobrar
+    ('cpu_percent', "CPU %", 80, 'e', True, lambda v: f"{v:.1f}"),
+    ('memoria_percent', "Mem %", 80, 'e', True, lambda v: f"{v:.1f}"),
+    ('memoria_bytes', "Memória", 110, 'e', True, lambda v: f"{v / MB:.1f} MB"),
+]
+
+def _chave_ordenacao(coluna):
+    if coluna == 'nome':
+        return lambda r: r.nome.lower()
+    return attrgetter(coluna)
+
+class ModeloTabelaProcessos:
+    """
+    Dados da tabela completa de processos, ordenados e filtrados
+
+    `linhas` é o vetor que a tabela exibe. Cada snapshot é ordenado uma
+    vez com list.sort e uma chave attrgetter (tudo em C); ordenar por
+    outra coluna ou filtrar reaproveita o snapshot guardado, sem nova
+    varredura. Empates ficam na ordem da varredura (por PID)
+
+    `buscar` (texto -> PIDs, ex.: process_monitor.buscar_processos)
+    faz o filtro usar o índice de nome e linha de comando; sem ela o
+    filtro compara só o nome
+    """
+
+    def __init__(self, coluna='cpu_percent', decrescente=True, buscar=None):
+        self.coluna = coluna
+        self.decrescente = decrescente
+        self.buscar = buscar
+        self.filtro = ""
+        self._pids_filtro = None
+        self._ordem = []
+        self.linhas = []
+
+    def atualizar(self, snapshot):
+        """Aplica um novo snapshot (lista de RegistroProcesso, que não é alterada)"""
+        self._ordem = list(snapshot)
+        if self.filtro and self.buscar is not None:
+            # Processos novos podem passar a atender o filtro
+            self._pids_filtro = set(self.buscar(self.filtro))
+        self._ordenar()
+
+    def ordenar_por(self, coluna):
+        """Ordena por `coluna`; na mesma coluna, inverte o sentido"""
+        if coluna == self.coluna:
+            self.decrescente = not self.decrescente
+        else:
+            self.coluna = coluna
+            self.decrescente = next(c[4] for c in COLUNAS if c[0] == coluna)
+        self._ordenar()
+
+    def filtrar(self, texto):
+        """Mostra só os processos que atendem `texto` (sem diferenciar maiúsculas)"""
+        self.filtro = texto.strip().lower()
+        if self.filtro and self.buscar is not None:
+            self._pids_filtro = set(self.buscar(self.filtro))
+        else:
+            self._pids_filtro = None
+        self._aplicar_filtro()
+
+    def _ordenar(self):
+        self._ordem.sort(key=_chave_ordenacao(self.coluna), reverse=self.decrescente)
+        self._aplicar_filtro()
+
+    def _aplicar_filtro(self):
+        if self._pids_filtro is not None:
+            pids = self._pids_filtro
+            self.linhas = [r for r in self._ordem if r.pid in pids]
+        elif self.filtro:
+            filtro = self.filtro
+            self.linhas = [r for r in self._ordem if filtro in r.nome.lower()]
+        else:
+            self.linhas = self._ordem
+
+    @property
+    def total(self):
+        return len(self._ordem)
+
+class TabelaVirtual:
+    """
+    Tabela de processos desenhada em um Canvas que só tem itens para as
+    linhas visíveis
+
+    As linhas do canvas formam um conjunto fixo (o que cabe na altura)
+    e rolar só troca o texto delas para o trecho `inicio`...`inicio + n`
+    do vetor do modelo. Com 10 mil processos o custo de rolar ou
+    atualizar é o mesmo de algumas dezenas de linhas
+    """
+
+    ALTURA_LINHA = 20
+    CORES_FUNDO = ('#1a1a1a', '#23232b')
+
+    def __init__(self, parent, modelo, fonte=("Courier", 10)):
+        self.modelo = modelo
+        self.fonte = fonte
+        self.frame = tk.Frame(parent, bg='#1a1a1a')
+
+        # Títulos posicionados com place sobre as colunas (ver _ao_redimensionar)
+        self._cabecalho = tk.Frame(self.frame, bg='#2a2a2a', height=self.ALTURA_LINHA)
+        self._cabecalho.pack(fill='x')
+        self._titulos = {}
+        for coluna, titulo, largura, ancora, _, _ in COLUNAS:
+            lbl = tk.Label(self._cabecalho, text=titulo, bg='#2a2a2a', fg='#4a9eff',
+                           font=(fonte[0], fonte[1], 'bold'), anchor=ancora, cursor="hand2")
+            lbl.bind("<Button-1>", lambda e, coluna=coluna: self._ao_clicar_titulo(coluna))
+            self._titulos[coluna] = lbl
+
+        corpo = tk.Frame(self.frame, bg='#1a1a1a')
+        corpo.pack(fill='both', expand=True)
+        self.barra = tk.Scrollbar(corpo, orient='vertical', command=self._rolar)
+        self.barra.pack(side='right', fill='y')
+        self.canvas = tk.Canvas(corpo, bg='#1a1a1a', highlightthickness=0)
+        self.canvas.pack(side='left', fill='both', expand=True)
+
+        self.inicio = 0
+        self._linhas = []  # (fundo, [texto por coluna], [último texto por coluna])
+        self._posicoes = []
+        self._largura = 0
+        self._altura = 0
+
+        self.canvas.bind('<Configure>', self._ao_redimensionar)
+        for widget in (self.canvas, self.frame):
+            widget.bind('<MouseWheel>', self._ao_rodar_mouse)
+            widget.bind('<Button-4>', lambda e: self.rolar_linhas(-3))
+            widget.bind('<Button-5>', lambda e: self.rolar_linhas(3))
+        self._atualizar_titulos()
+
+    def pack(self, **opcoes):
+        self.frame.pack(**opcoes)
+
+    def _colunas_x(self, largura):
+        """Posição (x inicial, largura) de cada coluna; 'Nome' fica com a sobra"""
+        fixas = sum(c[2] for c in COLUNAS)
+        sobra = max(100, largura - fixas - 10)
+        posicoes = []
+        x = 5
+        for _, _, largura_coluna, _, _, _ in COLUNAS:
+            largura_coluna = largura_coluna or sobra
+            posicoes.append((x, largura_coluna))
+            x += largura_coluna
+        return posicoes
+
+    def _ao_redimensionar(self, evento):
+        if (evento.width, evento.height) == (self._largura, self._altura):
+            return
+        self._largura, self._altura = evento.width, evento.height
+        self._posicoes = self._colunas_x(evento.width)
+        # Reposiciona os títulos sobre as colunas
+        for (x, largura), (coluna, *_) in zip(self._posicoes, COLUNAS):
+            self._titulos[coluna].place(x=x, y=0, width=largura, height=self.ALTURA_LINHA)
+        self._criar_linhas(evento.height // self.ALTURA_LINHA + 1)
+        self.desenhar()
+
+    def _criar_linhas(self, quantidade):
+        """Garante `quantidade` linhas no canvas e reposiciona todas"""
+        c = self.canvas
+        while len(self._linhas) < quantidade:
+            fundo = c.create_rectangle(0, 0, 0, 0, outline='', fill=self.CORES_FUNDO[len(self._linhas) % 2])
+            textos = [c.create_text(0, 0, text="", fill='#ffffff', font=self.fonte, anchor=c_[3])
+                      for c_ in COLUNAS]
+            self._linhas.append((fundo, textos, [""] * len(COLUNAS)))
+        for i, (fundo, textos, _) in enumerate(self._linhas):
+            y = i * self.ALTURA_LINHA
+            c.coords(fundo, 0, y, self._largura, y + self.ALTURA_LINHA)
+            for texto, (x, largura), coluna in zip(textos, self._posicoes, COLUNAS):
+                ancora = coluna[3]
+                c.coords(texto, x + largura - 6 if ancora == 'e' else x, y + self.ALTURA_LINHA // 2)
+                c.itemconfigure(texto, anchor=ancora)
+
+    def linhas_visiveis(self):
+        return max(1, self._altura // self.ALTURA_LINHA)
+
+    def desenhar(self):
+        """Troca o texto das linhas do canvas pelo trecho visível do modelo"""
+        linhas = self.modelo.linhas
+        n = len(linhas)
+        visiveis = self.linhas_visiveis()
+        self.inicio = max(0, min(self.inicio, n - visiveis))
+
+        c = self.canvas
+        formatos = [coluna[5] for coluna in COLUNAS]
+        atributos = [coluna[0] for coluna in COLUNAS]
+        for i, (_, textos, anteriores) in enumerate(self._linhas):
+            indice = self.inicio + i
+            if indice < n:
+                registro = linhas[indice]
+                novos = [formatar(getattr(registro, atributo))
+                         for atributo, formatar in zip(atributos, formatos)]
+            else:
+                novos = [""] * len(textos)
+            # Só chama o Tk para os textos que mudaram
+            for j, (item, texto) in enumerate(zip(textos, novos)):
+                if anteriores[j] != texto:
+                    c.itemconfigure(item, text=texto)
+                    anteriores[j] = texto
+
+        if n:
+            self.barra.set(self.inicio / n, min(1.0, (self.inicio + visiveis) / n))
+        else:
+            self.barra.set(0.0, 1.0)
+
+    def rolar_linhas(self, quantidade):
+        self.inicio += quantidade
+        self.desenhar()
+
+    def _rolar(self, acao, quantidade, unidade=None):
+        """Comando da barra de rolagem ('moveto' fração ou 'scroll' n units/pages)"""
+        if acao == 'moveto':
+            self.inicio = int(float(quantidade) * len(self.modelo.linhas))
+            self.desenhar()
+        elif acao == 'scroll':
+            passo = self.linhas_visiveis() if unidade == 'pages' else 1
+            self.rolar_linhas(int(quantidade) * passo)
+
+    def _ao_rodar_mouse(self, evento):
+        self.rolar_linhas(-3 if evento.delta > 0 else 3)
+
+    def _ao_clicar_titulo(self, coluna):
+        self.modelo.ordenar_por(coluna)
+        self._atualizar_titulos()
+        self.desenhar()
+
+    def _atualizar_titulos(self):
+        """Marca com ▲/▼ a coluna da ordenação"""
+        for coluna, titulo, *_ in COLUNAS:
+            if coluna == self.modelo.coluna:
+                titulo = f"{titulo} {'▼' if self.modelo.decrescente else '▲'}"
+            self._titulos[coluna].config(text=titulo)
+
+# Teste do módulo (só executa se rodar este arquivo diretamente)
+if __name__ == "__main__":
+    import random
+    import time
+    from process_monitor import RegistroProcesso
+
+    gerador = random.Random(1)
+    snapshot = [RegistroProcesso(pid, f"processo {pid % 500}", gerador.uniform(0, 5),
+                                 gerador.uniform(0, 2), gerador.randrange(1 << 30))
+                for pid in range(1, 10001)]
+    modelo = ModeloTabelaProcessos()
+    for coluna in ('cpu_percent', 'memoria_bytes', 'nome', 'pid'):
+        modelo.coluna = coluna
+        inicio = time.perf_counter()
+        modelo.atualizar(snapshot)
+        print(f"Ordenar 10000 processos por {coluna}: {(time.perf_counter() - inicio) * 1000:.1f} ms")
+
+    modelo.filtrar("processo 42")
+    print(f"{len(modelo.linhas)} de {modelo.total} com o filtro; topo: {modelo.linhas[0]}")
@@ -0,0 +1,131 @@
+"""
+Testes do leitor persistente do nvidia-smi com um script falso no PATH
+"""
+
+import os
+import sys
+import time
+
+import pytest
+
+import gpu_monitor
+from gpu_monitor import DetectorGPU, LeitorNvidiaSmi, _BackendNvidia, _interpretar_linha_nvidia
+
+# Imita `nvidia-smi --query-gpu=... -lms N`: duas GPUs por rodada, a
+# primeira com uso n % 100. Com MODO=falha sai sem escrever nada
+NVIDIA_SMI_FALSO = """#!{python}
+import sys, time
+if {modo!r} == 'falha':
+    sys.exit(9)
+intervalo = int(sys.argv[sys.argv.index('-lms') + 1]) / 1000
+n = 0
+while True:
+    print(f"0, {{n % 100}}, 1024, 8192, 55, GPU Falsa, Modelo X")
+    print(f"1, 99, 4096, 8192, 80, Outra GPU")
+    print("linha que não é CSV")
+    sys.stdout.flush()
+    n += 1
+    time.sleep(intervalo)
+"""
+
+@pytest.fixture
+def nvidia_smi_falso(tmp_path, monkeypatch):
+    """Coloca um nvidia-smi falso no início do PATH; recebe o modo ('ok' ou 'falha')"""
+    def criar(modo='ok'):
+        script = tmp_path / "nvidia-smi"
+        script.write_text(NVIDIA_SMI_FALSO.format(python=sys.executable, modo=modo))
+        script.chmod(0o755)
+        monkeypatch.setenv("PATH", str(tmp_path) + os.pathsep + os.environ.get("PATH", ""))
+        return script
+    yield criar
+    gpu_monitor.encerrar_leitor_nvidia()
+
+@pytest.fixture
+def leitor():
+    leitores = []
+    def criar(**opcoes):
+        leitor = LeitorNvidiaSmi(intervalo_ms=50, **opcoes)
+        leitores.append(leitor)
+        return leitor
+    yield criar
+    for leitor in leitores:
+        leitor.parar()
+
+def esperar(condicao, timeout=10.0):
+    limite = time.monotonic() + timeout
+    while time.monotonic() < limite:
+        if condicao():
+            return True
+        time.sleep(0.02)
+    return False
+
+def test_interpretar_linha():
+    indice, amostra = _interpretar_linha_nvidia("0, 37, 1024, 8192, 61, GPU, com vírgula\n")
+    assert indice == 0
+    assert (amostra.uso_porcentagem, amostra.memoria_usada_mb, amostra.memoria_total_mb,
+            amostra.temperatura) == (37.0, 1024.0, 8192.0, 61.0)
+    assert amostra.nome == "GPU, com vírgula"
+    assert amostra.memoria_porcentagem == 12.5
+    assert _interpretar_linha_nvidia("0, [N/A], 1024, 8192, 61, GPU") is None
+    assert _interpretar_linha_nvidia("linha qualquer") is None
+
+def test_leitor_le_primeira_gpu(nvidia_smi_falso, leitor):
+    nvidia_smi_falso()
+    leitor = leitor()
+    leitor.iniciar()
+    assert leitor.aguardar_amostra(timeout=5)
+
+    amostra = leitor.ultima_amostra()
+    assert amostra is not None and amostra.disponivel
+    assert amostra.nome == "GPU Falsa, Modelo X"
+    assert (amostra.memoria_usada_mb, amostra.memoria_total_mb, amostra.temperatura) == (1024.0, 8192.0, 55.0)
+    # Um único processo continua emitindo amostras novas
+    assert esperar(lambda: leitor.ultima_amostra().uso_porcentagem >= 3)
+    assert leitor.reinicios == 0
+
+def test_leitor_reinicia_se_o_processo_morrer(nvidia_smi_falso, leitor):
+    nvidia_smi_falso()
+    leitor = leitor()
+    leitor.iniciar()
+    assert leitor.aguardar_amostra(timeout=5)
+    primeiro = leitor._processo
+
+    primeiro.kill()
+    assert esperar(lambda: leitor.reinicios == 1 and leitor._processo is not primeiro)
+    # O processo novo começa a contagem do zero e volta a emitir amostras
+    assert esperar(lambda: leitor._processo.poll() is None
+                   and leitor.ultima_amostra().uso_porcentagem >= 1)
+    assert not leitor.indisponivel
+
+def test_leitor_sem_executavel(leitor):
+    leitor = leitor(comando="nvidia-smi-que-nao-existe")
+    leitor.iniciar()
+    assert leitor.aguardar_amostra(timeout=5)
+    assert leitor.indisponivel
+    assert leitor.ultima_amostra() is None
+
+def test_detector_usa_o_nvidia_smi(nvidia_smi_falso):
+    nvidia_smi_falso()
+    detector = DetectorGPU(backends=[_BackendNvidia()])
+    amostra = detector.ler()
+    assert detector.ativo is not None and detector.ativo.nome == 'nvidia'
+    assert amostra.nome == "GPU Falsa, Modelo X"
+
+def test_detector_sem_nvidia_smi_no_path(tmp_path, monkeypatch):
+    monkeypatch.setenv("PATH", str(tmp_path))
+    detector = DetectorGPU(backends=[_BackendNvidia()])
+    assert detector.ler() is None
+    assert detector.ativo is None
+    assert gpu_monitor._leitor_nvidia is None
+
+def test_detector_com_nvidia_smi_que_falha(nvidia_smi_falso, monkeypatch):
+    nvidia_smi_falso('falha')
+    detector = DetectorGPU(backends=[_BackendNvidia()])
+    monkeypatch.setattr(gpu_monitor, '_detector_gpu', detector)
+
+    amostra = gpu_monitor.amostrar_gpu()
+    assert not amostra.disponivel
+    assert gpu_monitor.obter_uso_gpu()['disponivel'] is False
+    assert detector.ativo is None
+    # O leitor que não produziu nada foi encerrado
+    assert gpu_monitor._leitor_nvidia is None
@@ -0,0 +1,54 @@
+"""
+Testes da escolha de resolução em SerieMultiResolucao.ler
+"""
+
+import pytest
+
+from historico import SerieMultiResolucao
+
+DIA = 24 * 3600
+INICIO = 1_700_000_000.0
+
+def serie_com(segundos, retencao_s):
+    serie = SerieMultiResolucao(1.0, retencao_s)
+    for i in range(segundos):
+        serie.adicionar(INICIO + i, float(i % 100))
+    return serie
+
+def contar_leituras_brutas(serie, monkeypatch):
+    chamadas = []
+    faixa = serie.bruta.faixa
+    def espiar(*args, **kwargs):
+        chamadas.append(args)
+        return faixa(*args, **kwargs)
+    monkeypatch.setattr(serie.bruta, 'faixa', espiar)
+    return chamadas
+
+@pytest.fixture(scope='module')
+def serie_dia():
+    return serie_com(DIA, retencao_s=DIA)
+
+@pytest.mark.parametrize('fim', [None, INICIO + DIA - 1])
+def test_janela_longa_usa_agregado(serie_dia, monkeypatch, fim):
+    brutas = contar_leituras_brutas(serie_dia, monkeypatch)
+    valores = serie_dia.ler(INICIO, fim, pontos=300)
+    assert not brutas
+    assert 0 < len(valores) <= 300
+
+def test_sem_fim_igual_a_fim_explicito(serie_dia):
+    fim = INICIO + DIA - 1
+    assert serie_dia.ler(INICIO, None, 300) == serie_dia.ler(INICIO, fim, 300)
+
+def test_janela_curta_usa_bruta(serie_dia, monkeypatch):
+    brutas = contar_leituras_brutas(serie_dia, monkeypatch)
+    valores = serie_dia.ler(INICIO + DIA - 120, None, pontos=300)
+    assert brutas
+    assert len(valores) == 120
+
+def test_logo_apos_iniciar_usa_bruta(monkeypatch):
+    # Janela de 1 h pedida com só 90 s de dados: os agregados não têm nada mais antigo
+    serie = serie_com(90, retencao_s=3600)
+    brutas = contar_leituras_brutas(serie, monkeypatch)
+    valores = serie.ler(INICIO + 89 - 3600, None, pontos=300)
+    assert brutas
+    assert len(valores) == 90